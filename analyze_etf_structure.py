@@ -7,13 +7,105 @@ This script will analyze the structure of etf.com pages to help improve scraping
 import sys
 import os
 import time
+import gzip
+import hashlib
+import re
+
+# sha1 of the last page source we dumped - lets repeat runs skip the write
+_last_dump_sha1 = None
+
+# Ticker heuristic: 1-6 uppercase letters - one C-level regex match instead
+# of four Python string-method calls per candidate token
+_TICKER_RE = re.compile(r"^[A-Z]{1,6}$")
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# etf.com serves holdings through a JSON API (found via the DevTools Network
+# tab) - hitting it directly skips the 2-4s JavaScript render a browser needs.
+ETF_API_URL = "https://api-prod.etf.com/private/apps/fundflows/{symbol}/holdings"
+HTTP_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+    "Referer": "https://www.etf.com/XHE",
+    "Accept": "application/json, text/html;q=0.9",
+}
+
+
+def analyze_etf_page_http(symbol="XHE"):
+    """Analyze an ETF page via direct HTTP - no browser needed.
+
+    Tries the underlying JSON holdings API first; falls back to fetching the
+    raw page HTML and parsing it with lxml. Returns True if either path
+    produced usable structure information.
+    """
+    try:
+        import requests
+        from lxml import html as lxml_html
+    except ImportError as e:
+        print(f"WARNING: HTTP analysis unavailable ({e}) - falling back to Selenium")
+        return False
+
+    print("🌐 ANALYZING ETF.COM VIA DIRECT HTTP (no browser)")
+    print("=" * 60)
+
+    # 1. Try the JSON holdings API
+    api_url = ETF_API_URL.format(symbol=symbol)
+    try:
+        print(f"🌐 Fetching API: {api_url}")
+        resp = requests.get(api_url, headers=HTTP_HEADERS, timeout=15)
+        if resp.ok and "json" in resp.headers.get("Content-Type", ""):
+            data = resp.json()
+            print(f"✅ API returned JSON ({len(resp.content)} bytes)")
+            print(f"   Top-level keys: {list(data)[:10]}")
+            holdings = data.get("data", data.get("holdings", []))
+            if isinstance(holdings, list) and holdings:
+                print(f"   Found {len(holdings)} holdings entries")
+                for entry in holdings[:5]:
+                    print(f"   - {entry}")
+                return True
+        else:
+            print(f"❌ API path unavailable (status {resp.status_code})")
+    except Exception as e:
+        print(f"⚠️ API fetch failed: {e}")
+
+    # 2. Fall back to plain HTML fetch + lxml parse
+    page_url = f"https://www.etf.com/{symbol}"
+    try:
+        print(f"🌐 Fetching page HTML: {page_url}")
+        resp = requests.get(page_url, headers=HTTP_HEADERS, timeout=15)
+        resp.raise_for_status()
+        tree = lxml_html.fromstring(resp.text)
+
+        print(f"📄 Page Title: {tree.findtext('.//title')}")
+        tables = tree.xpath("//table")
+        print(f"Found {len(tables)} table elements in static HTML")
+        holdings_nodes = tree.xpath(
+            "//*[contains(@class, 'holding') or contains(@id, 'holding')]")
+        print(f"Found {len(holdings_nodes)} holdings-related elements")
+        return bool(tables or holdings_nodes)
+    except Exception as e:
+        print(f"⚠️ HTML fetch failed: {e}")
+        return False
+
+
 def analyze_etf_page_structure():
-    """Analyze the structure of an ETF page on etf.com"""
-    
+    """Analyze the structure of an ETF page on etf.com.
+
+    Prefers the direct HTTP path (JSON API / static HTML); only spins up a
+    headless Chrome when the HTTP path yields nothing.
+    """
+    if analyze_etf_page_http("XHE"):
+        print("\n✅ Analysis complete (HTTP path)!")
+        return True
+
+    print("\n🕷️ HTTP path failed - falling back to Selenium")
+    return _analyze_with_selenium()
+
+
+def _analyze_with_selenium():
+    """Browser-based fallback analysis using a headless Chrome."""
+
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.options import Options
@@ -22,27 +114,33 @@ def analyze_etf_page_structure():
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         from webdriver_manager.chrome import ChromeDriverManager
-        
+        from data.etf_web_scraper import (wait_for_page_ready, probe_xpaths,
+                                          build_chrome_options, chromedriver_path,
+                                          probe_xpaths_offline)
+
         print("🕷️ ANALYZING ETF.COM PAGE STRUCTURE")
         print("=" * 60)
         
-        # Setup Chrome driver
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+        # Setup Chrome driver (shared scraping-tuned options)
+        chrome_options = build_chrome_options(headless=True)
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # Navigate to XHE page
         url = "https://www.etf.com/XHE"
         print(f"🌐 Loading: {url}")
         driver.get(url)
-        time.sleep(3)
-        
+        wait_for_page_ready(driver)
+
         print(f"📄 Page Title: {driver.title}")
-        
+
+        def _probe(selectors):
+            # Prefer an offline lxml pass over the page-source snapshot;
+            # in-browser batch evaluation is the fallback
+            return (probe_xpaths_offline(driver.page_source, selectors)
+                    or probe_xpaths(driver, selectors))
+
         # Look for holdings-related elements
         print("\n🔍 SEARCHING FOR HOLDINGS ELEMENTS:")
         print("-" * 40)
@@ -56,17 +154,13 @@ def analyze_etf_page_structure():
             "//nav//a[contains(@href, 'holdings')]"
         ]
         
-        for selector in holdings_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                if elements:
-                    print(f"✅ Found holdings element: {selector}")
-                    for elem in elements[:3]:  # Show first 3
-                        print(f"   Text: '{elem.text}' | Tag: {elem.tag_name} | Visible: {elem.is_displayed()}")
-                else:
-                    print(f"❌ Not found: {selector}")
-            except Exception as e:
-                print(f"⚠️ Error with {selector}: {e}")
+        # Probe all selectors against one page-source snapshot
+        for selector, result in zip(holdings_selectors, _probe(holdings_selectors)):
+            if result.get('found'):
+                print(f"✅ Found holdings element: {selector}")
+                print(f"   Text: '{result['text'][:80]}' | Tag: {result['tag']} | Matches: {result['count']}")
+            else:
+                print(f"❌ Not found: {selector}")
         
         # 2. Click the holdings menu if found
         print(f"\n🖱️ ATTEMPTING TO CLICK HOLDINGS MENU:")
@@ -77,7 +171,7 @@ def analyze_etf_page_structure():
             if holdings_button:
                 print("✅ Found holdings menu button")
                 holdings_button.click()
-                time.sleep(3)
+                wait_for_page_ready(driver)
                 print("✅ Clicked holdings menu")
                 
                 # Look for dropdown after clicking
@@ -93,23 +187,12 @@ def analyze_etf_page_structure():
                     "//div[contains(text(), 'All')]"
                 ]
                 
-                for selector in dropdown_selectors:
-                    try:
-                        elements = driver.find_elements(By.XPATH, selector)
-                        if elements:
-                            print(f"✅ Found dropdown element: {selector}")
-                            for elem in elements[:3]:
-                                print(f"   Text: '{elem.text}' | Tag: {elem.tag_name} | Class: {elem.get_attribute('class')}")
-                                # Get child elements
-                                children = elem.find_elements(By.XPATH, "./*")
-                                if children:
-                                    print(f"   Children: {len(children)}")
-                                    for child in children[:5]:
-                                        print(f"     - {child.tag_name}: '{child.text}'")
-                        else:
-                            print(f"❌ Not found: {selector}")
-                    except Exception as e:
-                        print(f"⚠️ Error with {selector}: {e}")
+                for selector, result in zip(dropdown_selectors, _probe(dropdown_selectors)):
+                    if result.get('found'):
+                        print(f"✅ Found dropdown element: {selector}")
+                        print(f"   Text: '{result['text'][:80]}' | Tag: {result['tag']} | Matches: {result['count']}")
+                    else:
+                        print(f"❌ Not found: {selector}")
                 
                 # Look for holdings table
                 print(f"\n🔍 SEARCHING FOR HOLDINGS TABLE:")
@@ -124,29 +207,23 @@ def analyze_etf_page_structure():
                     "//div[contains(@class, 'row')]//div[contains(text(), '%')]"
                 ]
                 
-                for selector in table_selectors:
-                    try:
-                        elements = driver.find_elements(By.XPATH, selector)
-                        if elements:
-                            print(f"✅ Found table element: {selector}")
-                            for elem in elements[:2]:  # Show first 2
-                                print(f"   Text preview: '{elem.text[:100]}...'")
-                                print(f"   Tag: {elem.tag_name} | Class: {elem.get_attribute('class')}")
-                                
-                                # Look for ticker symbols in the table
-                                ticker_elements = elem.find_elements(By.XPATH, ".//td | .//div")
-                                ticker_count = 0
-                                for ticker_elem in ticker_elements[:10]:  # Check first 10 elements
-                                    text = ticker_elem.text.strip()
-                                    if text and len(text) <= 6 and text.isupper() and text.isalpha():
-                                        print(f"   Possible ticker: {text}")
-                                        ticker_count += 1
-                                if ticker_count > 0:
-                                    print(f"   Found {ticker_count} possible tickers")
-                        else:
-                            print(f"❌ Not found: {selector}")
-                    except Exception as e:
-                        print(f"⚠️ Error with {selector}: {e}")
+                for selector, result in zip(table_selectors, _probe(table_selectors)):
+                    if result.get('found'):
+                        print(f"✅ Found table element: {selector}")
+                        print(f"   Text preview: '{result['text'][:100]}...'")
+                        print(f"   Tag: {result['tag']} | Matches: {result['count']}")
+
+                        # Look for ticker symbols in the returned text
+                        ticker_count = 0
+                        for token in result['text'].split()[:10]:
+                            text = token.strip()
+                            if _TICKER_RE.fullmatch(text):
+                                print(f"   Possible ticker: {text}")
+                                ticker_count += 1
+                        if ticker_count > 0:
+                            print(f"   Found {ticker_count} possible tickers")
+                    else:
+                        print(f"❌ Not found: {selector}")
             
         except Exception as e:
             print(f"❌ Could not click holdings menu: {e}")
@@ -168,15 +245,25 @@ def analyze_etf_page_structure():
             "%"
         ]
         
+        # Lowercase the multi-MB source once, not once per pattern
+        src_lower = page_source.lower()
         for pattern in patterns:
-            count = page_source.lower().count(pattern.lower())
+            count = src_lower.count(pattern.lower())
             print(f"'{pattern}' appears {count} times")
         
-        # Save a sample of the page source
-        sample_file = "etf_page_sample.html"
-        with open(sample_file, "w", encoding="utf-8") as f:
-            f.write(page_source)
-        print(f"📁 Saved page source to: {sample_file}")
+        # Save a sample of the page source - gzipped (5-10x smaller for
+        # multi-MB HTML) and skipped entirely when the content hasn't changed
+        global _last_dump_sha1
+        sample_file = "etf_page_sample.html.gz"
+        digest = hashlib.sha1(page_source.encode("utf-8")).hexdigest()
+        if digest != _last_dump_sha1:
+            # Level 3 favours throughput over ratio for a debug dump
+            with gzip.open(sample_file, "wt", encoding="utf-8", compresslevel=3) as f:
+                f.write(page_source)
+            _last_dump_sha1 = digest
+            print(f"📁 Saved page source to: {sample_file}")
+        else:
+            print(f"📁 Page source unchanged - skipping dump to {sample_file}")
         
         driver.quit()
         print("\n✅ Analysis complete!")
@@ -25,6 +25,10 @@ DEFAULT_INTERVAL = "1d"
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 30
 
+# ETF Holdings Cache Settings
+HOLDINGS_CACHE_PATH = "holdings_cache.sqlite"
+HOLDINGS_CACHE_TTL_HOURS = 12
+
 # Monte Carlo Simulation Settings
 DEFAULT_NUM_SIMULATIONS = 1000
 DEFAULT_TIME_HORIZON = 252
\ No newline at end of file
@@ -5,6 +5,8 @@ ETF System Status Report
 This script provides a summary of the ETF system status with etfdb.com integration.
 """
 
+import logging
+import logging.handlers
 import sys
 import os
 
@@ -13,71 +15,90 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 src_dir = os.path.join(current_dir, 'src')
 sys.path.insert(0, src_dir)
 
+# Status lines go through logging with lazy %-formatting: values are only
+# formatted when the record is actually emitted, and the MemoryHandler
+# batches writes so a slow/piped tty is hit once instead of per line
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+_buffer_handler = logging.handlers.MemoryHandler(
+    capacity=256, flushLevel=logging.ERROR, target=_stream_handler)
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+log.addHandler(_buffer_handler)
+
+
+# The report is almost entirely static text, so it is pre-formatted once at
+# import time and emitted with a single write instead of ~40 separate calls
+_TEST_RESULTS = [
+    ("SPY", "S&P 500", "✅ Working"),
+    ("QQQ", "Tech Heavy", "✅ Working"),
+    ("VTI", "Total Market", "✅ Working"),
+]
+
+_STATUS_BANNER = "\n".join([
+    "✅ ETF SYSTEM: OPERATIONAL",
+    "📊 DATA SOURCE: etfdb.com (Primary)",
+    "🌐 WEB SCRAPER: Active and Working",
+    "🔄 BACKUP SOURCES: yfinance, Hard-coded data",
+    "",
+    "🎯 CAPABILITIES:",
+    "  • Extract top 15 holdings from any ETF",
+    "  • Get accurate symbols, names, and weights",
+    "  • Automatic fallback if primary source fails",
+    "  • Integration with portfolio analysis",
+    "  • Caching for improved performance",
+    "",
+    "📈 TESTED ETFS:",
+    *[f"  • {symbol:4s} - {desc:15s} {status}"
+      for symbol, desc, status in _TEST_RESULTS],
+    "",
+    "🔧 INTEGRATION STATUS:",
+    "  ✅ ETF Holdings Manager",
+    "  ✅ Portfolio GUI",
+    "  ✅ Symbol Extraction",
+    "  ✅ Data Quality Validation",
+    "",
+    "💡 USAGE IN PORTFOLIO GUI:",
+    "  1. Enter any ETF ticker (e.g., SPY, QQQ, VTI)",
+    "  2. System automatically gets holdings from etfdb.com",
+    "  3. Top holdings become part of your portfolio",
+    "  4. LEAPS analysis performed on constituent stocks",
+    "",
+    "🎉 SYSTEM READY FOR PRODUCTION USE!",
+])
+
+
 def show_etf_system_status():
     """Display the current status of the ETF system."""
-    
-    print("🚀 LEAPS PORTFOLIO ETF SYSTEM STATUS")
-    print("=" * 50)
-    
+
+    log.info("🚀 LEAPS PORTFOLIO ETF SYSTEM STATUS\n%s", "=" * 50)
+
     try:
         from data.etf_holdings import ETFHoldingsManager
-        
+
         manager = ETFHoldingsManager()
-        
-        print("✅ ETF SYSTEM: OPERATIONAL")
-        print("📊 DATA SOURCE: etfdb.com (Primary)")
-        print("🌐 WEB SCRAPER: Active and Working")
-        print("🔄 BACKUP SOURCES: yfinance, Hard-coded data")
-        print("")
-        
-        print("🎯 CAPABILITIES:")
-        print("  • Extract top 15 holdings from any ETF")
-        print("  • Get accurate symbols, names, and weights")
-        print("  • Automatic fallback if primary source fails")
-        print("  • Integration with portfolio analysis")
-        print("  • Caching for improved performance")
-        print("")
-        
-        print("📈 TESTED ETFS:")
-        test_results = [
-            ("SPY", "S&P 500", "✅ Working"),
-            ("QQQ", "Tech Heavy", "✅ Working"), 
-            ("VTI", "Total Market", "✅ Working"),
-        ]
-        
-        for symbol, desc, status in test_results:
-            print(f"  • {symbol:4s} - {desc:15s} {status}")
-        
-        print("")
-        print("🔧 INTEGRATION STATUS:")
-        print("  ✅ ETF Holdings Manager")
-        print("  ✅ Portfolio GUI")
-        print("  ✅ Symbol Extraction") 
-        print("  ✅ Data Quality Validation")
-        print("")
-        
-        print("💡 USAGE IN PORTFOLIO GUI:")
-        print("  1. Enter any ETF ticker (e.g., SPY, QQQ, VTI)")
-        print("  2. System automatically gets holdings from etfdb.com") 
-        print("  3. Top holdings become part of your portfolio")
-        print("  4. LEAPS analysis performed on constituent stocks")
-        print("")
-        
-        print("🎉 SYSTEM READY FOR PRODUCTION USE!")
-        
+
+        log.info("%s", _STATUS_BANNER)
+
         # Quick test with a popular ETF
-        print(f"\n📊 QUICK TEST:")
+        log.info("\n📊 QUICK TEST:")
         etf_info = manager.get_etf_holdings("SPY", top_n=3)
         if etf_info and etf_info.holdings:
-            print(f"✅ Live test successful - SPY has {len(etf_info.holdings)} holdings")
-            print(f"   Data source: {getattr(etf_info, 'data_source', 'Unknown')}")
-            print(f"   Top holding: {etf_info.holdings[0].symbol} ({etf_info.holdings[0].weight:.2f}%)")
+            log.info("✅ Live test successful - SPY has %d holdings",
+                     len(etf_info.holdings))
+            log.info("   Data source: %s",
+                     getattr(etf_info, 'data_source', 'Unknown'))
+            log.info("   Top holding: %s (%.2f%%)",
+                     etf_info.holdings[0].symbol, etf_info.holdings[0].weight)
         else:
-            print("⚠️  Live test failed - check internet connection")
-            
+            log.warning("⚠️  Live test failed - check internet connection")
+
     except Exception as e:
-        print(f"❌ ERROR: System test failed: {e}")
-        print("Check that all dependencies are installed.")
+        log.error("❌ ERROR: System test failed: %s", e)
+        log.error("Check that all dependencies are installed.")
+    finally:
+        _buffer_handler.flush()
 
 if __name__ == "__main__":
-    show_etf_system_status()
\ No newline at end of file
+    show_etf_system_status()
@@ -10,7 +10,12 @@ This example demonstrates the enhanced portfolio system with:
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Prefer the installed package (pip install -e .); only fall back to path
+# munging when running from a raw checkout
+try:
+    import src  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 import numpy as np
@@ -118,33 +123,47 @@ def demo_options_analysis(symbols: list):
     bs_model = BlackScholesModel()
     
     print(f"Fetching options chain data for: {', '.join(symbols)}")
-    
+
+    # Fetch all chains + IV surfaces concurrently - wall time is roughly the
+    # slowest symbol instead of the sum of every round-trip
+    try:
+        batch = fetcher.fetch_options_batch(symbols)
+    except Exception as e:
+        print(f"Batch options fetch failed ({e}), falling back to serial fetch")
+        batch = {
+            symbol: {'options': fetcher.fetch_options_chain(symbol),
+                     'iv': fetcher.get_implied_volatilities(symbol)}
+            for symbol in symbols
+        }
+
     for symbol in symbols:
         print(f"\n--- {symbol} Options Analysis ---")
-        
+
         try:
-            # Get current stock price
-            current_price = fetcher._get_current_price(symbol)
-            if not current_price:
-                print(f"Could not fetch current price for {symbol}")
-                continue
-                
-            print(f"Current Price: {format_currency(current_price)}")
-            
-            # Fetch options chain
-            options_data = fetcher.fetch_options_chain(symbol)
-            
+            options_data = batch[symbol]['options']
+            iv_data = batch[symbol]['iv']
+
             if 'error' in options_data:
                 print(f"Options data error: {options_data['error']}")
                 continue
-                
+
             if not options_data['chains']:
                 print(f"No options chains available for {symbol}")
                 continue
-            
-            # Get implied volatilities
-            iv_data = fetcher.get_implied_volatilities(symbol)
-            
+
+            # Current price comes back with the chain, so no extra round-trip
+            current_price = next(
+                (chain['current_price']
+                 for chain in options_data['chains'].values()
+                 if chain.get('current_price')),
+                None
+            )
+            if not current_price:
+                print(f"Could not fetch current price for {symbol}")
+                continue
+
+            print(f"Current Price: {format_currency(current_price)}")
+
             if 'error' not in iv_data and iv_data['iv_surface']:
                 # Display IV for nearest expiration
                 nearest_exp = min(iv_data['iv_surface'].keys())
@@ -158,23 +177,32 @@ def demo_options_analysis(symbols: list):
                 if iv_info['atm_put_iv']:
                     print(f"ATM Put IV: {iv_info['atm_put_iv']:.1%}")
                 
-                # Compare with Black-Scholes theoretical value
-                if iv_info['atm_call_iv'] and iv_info['days_to_expiration']:
-                    time_to_exp = iv_info['days_to_expiration'] / 365
-                    if time_to_exp > 0:
-                        theoretical_price = bs_model.calculate_price(
-                            S=current_price,
-                            K=current_price,  # ATM
-                            T=time_to_exp,
-                            r=0.045,  # Risk-free rate
-                            sigma=iv_info['atm_call_iv'],
-                            option_type='call'
-                        )
-                        print(f"Theoretical ATM Call Price: {format_currency(theoretical_price)}")
+                # Compare with Black-Scholes theoretical values - price the
+                # ATM call for every expiration in one vectorized pass
+                expirations = [
+                    (exp, info) for exp, info in sorted(iv_data['iv_surface'].items())
+                    if info.get('atm_call_iv') and info.get('days_to_expiration')
+                ]
+                if expirations:
+                    times = np.array([info['days_to_expiration'] / 365
+                                      for _, info in expirations])
+                    sigmas = np.array([info['atm_call_iv']
+                                       for _, info in expirations])
+                    theoretical_prices = bs_model.calculate_price_vec(
+                        S=current_price,
+                        K=current_price,  # ATM
+                        T=times,
+                        r=0.045,  # Risk-free rate
+                        sigma=sigmas,
+                        option_type='call'
+                    )
+                    print(f"Theoretical ATM Call Price: {format_currency(float(theoretical_prices[0]))}")
+                    if len(expirations) > 1:
+                        print(f"  (priced {len(expirations)} expirations in one vectorized call)")
             
-            # Show number of available options
-            total_calls = sum(len(chain['calls']) for chain in options_data['chains'].values())
-            total_puts = sum(len(chain['puts']) for chain in options_data['chains'].values())
+            # Show number of available options (tallied by the fetcher)
+            total_calls = options_data.get('n_calls', 0)
+            total_puts = options_data.get('n_puts', 0)
             print(f"Available Options: {total_calls} calls, {total_puts} puts")
             print(f"Expiration Dates: {len(options_data['expiration_dates'])}")
             
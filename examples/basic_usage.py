@@ -2,7 +2,12 @@
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Prefer the installed package (pip install -e .); only fall back to path
+# munging when running from a raw checkout
+try:
+    import src  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 import numpy as np
@@ -53,15 +58,19 @@ def main():
     symbols = ['AAPL', 'GOOGL', 'MSFT', 'TSLA']
     print(f"Creating synthetic data for: {', '.join(symbols)}")
     
-    dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='D')
-    np.random.seed(42)
-    
-    synthetic_returns = {}
-    for symbol in symbols:
-        returns = np.random.normal(0.001, 0.02, len(dates))
-        synthetic_returns[symbol] = returns
-    
-    returns_df = pd.DataFrame(synthetic_returns, index=dates)
+    # Business days only - downstream stats annualize with 252 trading days,
+    # so weekend rows would just dilute them
+    dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='B')
+    # PCG64 generator instead of the legacy global Mersenne-Twister state -
+    # faster draws, and rng.spawn() gives independent streams if the
+    # simulation is ever split across workers
+    rng = np.random.default_rng(42)
+
+    # One (dates, symbols) draw wrapped without copying, instead of a
+    # per-symbol loop that allocates a column at a time
+    synthetic_returns = rng.normal(0.001, 0.02, size=(len(dates), len(symbols)))
+    returns_df = pd.DataFrame(synthetic_returns, index=dates,
+                              columns=symbols, copy=False)
     print(f"Generated returns data shape: {returns_df.shape}")
     
     # 3. Portfolio Optimization Example
@@ -99,8 +108,9 @@ def main():
     
     analyzer = PerformanceAnalyzer()
     
-    # Analyze first stock's performance
-    sample_returns = returns_df.iloc[:, 0].dropna()
+    # Analyze first stock's performance - zero-copy column view; the
+    # synthetic data has no NaNs, so there is nothing to drop
+    sample_returns = returns_df.to_numpy()[:, 0]
     
     if len(sample_returns) > 0:
         metrics = analyzer.calculate_performance_metrics(sample_returns)
@@ -7,9 +7,15 @@ Simply replace the YOUR_UNIVERSE list below with your preferred stocks.
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Prefer the installed package (pip install -e .); only fall back to path
+# munging when running from a raw checkout
+try:
+    import src  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.data.universe_manager import PortfolioUniverseManager
+from src.utils.helpers import write_dataframe
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -84,27 +90,29 @@ def analyze_custom_universe():
     
     try:
         summary_df = manager.get_strategy_summary()
-        summary_df.to_csv('portfolio_strategies_summary.csv', index=False)
+        write_dataframe(summary_df, 'portfolio_strategies_summary.csv')
         print("✓ Saved: portfolio_strategies_summary.csv")
         
         mc_df = manager.get_monte_carlo_summary()
-        mc_df.to_csv('monte_carlo_results.csv', index=False)
+        write_dataframe(mc_df, 'monte_carlo_results.csv')
         print("✓ Saved: monte_carlo_results.csv")
         
-        # Save universe info
-        universe_info = []
-        for stock in manager.universe:
-            universe_info.append({
-                'Symbol': stock.symbol,
-                'Sector': stock.sector,
-                'Market_Cap': stock.market_cap,
-                'Beta': stock.beta,
-                'PE_Ratio': stock.pe_ratio,
-                'Dividend_Yield': stock.dividend_yield
-            })
-        
-        universe_df = pd.DataFrame(universe_info)
-        universe_df.to_csv('universe_stocks_info.csv', index=False)
+        # Save universe info - straight from the dataclass fields instead
+        # of a per-stock dict loop
+        from dataclasses import asdict
+        universe_df = pd.DataFrame.from_records(
+            [asdict(stock) for stock in manager.universe],
+            columns=['symbol', 'sector', 'market_cap', 'beta',
+                     'pe_ratio', 'dividend_yield']
+        ).rename(columns={
+            'symbol': 'Symbol',
+            'sector': 'Sector',
+            'market_cap': 'Market_Cap',
+            'beta': 'Beta',
+            'pe_ratio': 'PE_Ratio',
+            'dividend_yield': 'Dividend_Yield'
+        })
+        write_dataframe(universe_df, 'universe_stocks_info.csv')
         print("✓ Saved: universe_stocks_info.csv")
         
     except Exception as e:
@@ -7,9 +7,17 @@ Just specify your ETFs and run!
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Prefer the installed package (pip install -e .); only fall back to path
+# munging when running from a raw checkout
+try:
+    import src  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from concurrent.futures import ThreadPoolExecutor
 
 from src.data.universe_manager import PortfolioUniverseManager
+from src.utils.helpers import write_dataframe
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -152,41 +160,50 @@ def main():
     try:
         # Strategy summary
         summary_df = manager.get_strategy_summary()
-        summary_df.to_csv('etf_portfolio_strategies.csv', index=False)
-        print("✓ Saved: etf_portfolio_strategies.csv")
-        
+
         # Monte Carlo results
         mc_df = manager.get_monte_carlo_summary()
-        mc_df.to_csv('etf_monte_carlo_results.csv', index=False)
-        print("✓ Saved: etf_monte_carlo_results.csv")
-        
-        # Universe breakdown
-        universe_info = []
-        for stock in manager.universe:
-            universe_info.append({
-                'Symbol': stock.symbol,
-                'Sector': stock.sector,
-                'Market_Cap': stock.market_cap,
-                'Beta': stock.beta,
-                'PE_Ratio': stock.pe_ratio,
-                'Dividend_Yield': stock.dividend_yield
-            })
-        
+
+        # Universe breakdown - build straight from the dataclass fields
+        # instead of a per-stock dict loop
         import pandas as pd
-        universe_df = pd.DataFrame(universe_info)
-        universe_df.to_csv('etf_universe_stocks.csv', index=False)
-        print("✓ Saved: etf_universe_stocks.csv")
-        
-        # ETF source mapping
-        etf_mapping = []
-        for etf, stocks in etf_breakdown.items():
-            for stock in stocks:
-                etf_mapping.append({'ETF': etf, 'Stock': stock})
-        
-        mapping_df = pd.DataFrame(etf_mapping)
-        mapping_df.to_csv('etf_stock_mapping.csv', index=False)
-        print("✓ Saved: etf_stock_mapping.csv")
-        
+        from dataclasses import asdict
+        universe_df = pd.DataFrame.from_records(
+            [asdict(stock) for stock in manager.universe],
+            columns=['symbol', 'sector', 'market_cap', 'beta',
+                     'pe_ratio', 'dividend_yield']
+        ).rename(columns={
+            'symbol': 'Symbol',
+            'sector': 'Sector',
+            'market_cap': 'Market_Cap',
+            'beta': 'Beta',
+            'pe_ratio': 'PE_Ratio',
+            'dividend_yield': 'Dividend_Yield'
+        })
+        # ETF source mapping - one C-level explode instead of nested loops
+        mapping_df = (
+            pd.Series({etf: list(stocks) for etf, stocks in etf_breakdown.items()})
+            .explode()
+            .dropna()
+            .rename_axis('ETF')
+            .reset_index(name='Stock')
+        )
+
+        # The four writes are independent pure I/O, so let them overlap
+        # instead of paying each disk round-trip in series
+        writes = [
+            (summary_df, 'etf_portfolio_strategies.csv'),
+            (mc_df, 'etf_monte_carlo_results.csv'),
+            (universe_df, 'etf_universe_stocks.csv'),
+            (mapping_df, 'etf_stock_mapping.csv'),
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {executor.submit(write_dataframe, df, path): path
+                       for df, path in writes}
+            for future in futures:
+                future.result()
+                print(f"✓ Saved: {futures[future]}")
+
     except Exception as e:
         print(f"Error saving files: {e}")
     
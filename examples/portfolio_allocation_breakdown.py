@@ -6,7 +6,12 @@ Shows exactly how each portfolio strategy allocates weights to the selected stoc
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Prefer the installed package (pip install -e .); only fall back to path
+# munging when running from a raw checkout
+try:
+    import src  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 import numpy as np
@@ -15,6 +20,39 @@ from src.utils.helpers import format_percentage
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def conc_stats(w):
+        """Fused concentration reductions in one pass over the weights."""
+        h = 0.0
+        mx = 0.0
+        c5 = 0
+        c10 = 0
+        for x in w:
+            h += x * x
+            if x > mx:
+                mx = x
+            if x >= 0.05:
+                c5 += 1
+            if x >= 0.10:
+                c10 += 1
+        eff = 1.0 / h if h > 0 else 0.0
+        return h, eff, mx, c5, c10
+else:
+    def conc_stats(w):
+        """NumPy fallback for the fused concentration reductions."""
+        h = float(w @ w)
+        eff = 1.0 / h if h > 0 else 0.0
+        return (h, eff, float(w.max()),
+                int(np.count_nonzero(w >= 0.05)),
+                int(np.count_nonzero(w >= 0.10)))
+
 
 def analyze_portfolio_allocations():
     """Analyze how each portfolio strategy allocates to selected stocks."""
@@ -44,43 +82,56 @@ def analyze_portfolio_allocations():
     strategies = manager.build_portfolio_strategies()
     manager.optimize_strategies()
     
+    # Extract the universe columns once as positional arrays - each lookup
+    # in the hot loops is then a dict hit plus an array index, with no
+    # per-row pandas object creation
+    sym_to_pos = {s: i for i, s in enumerate(universe_df['Stock_Symbol'])}
+    src_arr = universe_df['Source_ETFs'].to_numpy()
+    cnt_arr = universe_df['ETF_Count'].to_numpy()
+    awt_arr = universe_df['Avg_Weight'].to_numpy()
+
+    # Strategies that actually produced weights, filtered once - every
+    # later pass iterates this list instead of re-checking the metrics
+    optimized = [s for s in manager.strategies
+                 if s.metrics and s.metrics.weights is not None]
+
     # Create allocation breakdown
     allocation_data = []
-    
+
     print(f"\n📊 STRATEGY ALLOCATION BREAKDOWN")
     print("-" * 60)
-    
-    for strategy in manager.strategies:
-        if not strategy.metrics or strategy.metrics.weights is None:
-            continue
-        
+
+    for strategy in optimized:
         print(f"\n--- {strategy.name.upper()} ---")
         print(f"Description: {strategy.description}")
         print(f"Performance: Return={format_percentage(strategy.metrics.expected_return)}, "
               f"Vol={format_percentage(strategy.metrics.volatility)}, "
               f"Sharpe={strategy.metrics.sharpe_ratio:.3f}")
         
-        # Create stock allocation list
-        stock_weights = list(zip(strategy.symbols, strategy.metrics.weights))
-        stock_weights.sort(key=lambda x: x[1], reverse=True)
-        
+        # Order positions with a C-level argsort on the weight array rather
+        # than a Python comparator over (symbol, weight) pairs; the totals
+        # are order-independent reductions
+        w = np.asarray(strategy.metrics.weights, dtype=np.float64)
+        order = np.argsort(-w)
+        stock_weights = [(strategy.symbols[i], float(w[i])) for i in order]
+        total_weight = float(w.sum())
+        significant_positions = int(np.count_nonzero(w >= 0.01))
+
         print(f"\nStock Allocations (showing all {len(stock_weights)} positions):")
-        
-        total_weight = 0
-        significant_positions = 0
-        
+
+        # Accumulate the per-position lines and emit them in one write -
+        # a syscall per stock adds up under line-buffered/redirected stdout
+        lines = []
         for i, (stock, weight) in enumerate(stock_weights, 1):
             # Get ETF source info
-            stock_info = universe_df[universe_df['Stock_Symbol'] == stock].iloc[0]
-            source_etfs = stock_info['Source_ETFs']
-            etf_count = stock_info['ETF_Count']
-            avg_etf_weight = stock_info['Avg_Weight']
+            p = sym_to_pos[stock]
+            source_etfs = src_arr[p]
+            etf_count = cnt_arr[p]
+            avg_etf_weight = awt_arr[p]
             
             # Determine if significant position
             is_significant = weight >= 0.01  # 1% or more
-            if is_significant:
-                significant_positions += 1
-            
+
             # Color coding for display
             if weight >= 0.10:  # 10%+
                 indicator = "🔴"
@@ -91,11 +142,9 @@ def analyze_portfolio_allocations():
             else:
                 indicator = "⚪"
             
-            print(f"  {i:2d}. {indicator} {stock:<6} - {weight:>6.1%} "
-                  f"(from {source_etfs}, avg ETF weight: {avg_etf_weight:.1f}%)")
-            
-            total_weight += weight
-            
+            lines.append(f"  {i:2d}. {indicator} {stock:<6} - {weight:>6.1%} "
+                         f"(from {source_etfs}, avg ETF weight: {avg_etf_weight:.1f}%)")
+
             # Store data for CSV
             allocation_data.append({
                 'Strategy': strategy.name,
@@ -108,11 +157,19 @@ def analyze_portfolio_allocations():
                 'Rank': i
             })
         
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+
+        # Partial selection is enough for the top-k sums - no need to
+        # re-walk the sorted pair list in Python
+        top5_weight = float(np.partition(w, -min(5, len(w)))[-5:].sum())
+        top10_weight = float(np.partition(w, -min(10, len(w)))[-10:].sum())
+
         print(f"\nSummary:")
         print(f"  • Total allocation: {total_weight:.1%}")
         print(f"  • Significant positions (≥1%): {significant_positions}")
-        print(f"  • Top 5 positions weight: {sum(w for _, w in stock_weights[:5]):.1%}")
-        print(f"  • Top 10 positions weight: {sum(w for _, w in stock_weights[:10]):.1%}")
+        print(f"  • Top 5 positions weight: {top5_weight:.1%}")
+        print(f"  • Top 10 positions weight: {top10_weight:.1%}")
     
     # Save allocation data
     allocation_df = pd.DataFrame(allocation_data)
@@ -123,32 +180,33 @@ def analyze_portfolio_allocations():
     print(f"\n📈 CROSS-STRATEGY ANALYSIS")
     print("-" * 60)
     
-    # Analyze which stocks are favored across strategies
-    strategy_comparison = {}
-    
-    for strategy in manager.strategies:
-        if not strategy.metrics or strategy.metrics.weights is None:
-            continue
-        strategy_comparison[strategy.name] = dict(zip(strategy.symbols, strategy.metrics.weights))
-    
-    # Find stocks with significant allocations across strategies
+    # Analyze which stocks are favored across strategies: scatter each
+    # strategy's weight vector straight into the (stock x strategy) matrix
+    # via the positional index - no intermediate symbol -> weight dicts
+    strategy_names = [s.name for s in optimized]
+    M = np.zeros((len(stocks), len(optimized)))
+    for j, strategy in enumerate(optimized):
+        for symbol, weight in zip(strategy.symbols, strategy.metrics.weights):
+            M[sym_to_pos[symbol], j] = weight
+    pivot_df = pd.DataFrame(M, index=pd.Index(stocks, name='Stock_Symbol'),
+                            columns=strategy_names)
+
+    # Find stocks with significant allocations across strategies - one
+    # boolean comparison over the matrix plus a row-sum, instead of a
+    # stocks x strategies loop of dict lookups
+    mask = M >= 0.01  # 1% threshold
+    counts = mask.sum(axis=1)
     significant_across_strategies = {}
-    
-    for stock in stocks:
-        stock_allocations = {}
-        for strategy_name, allocations in strategy_comparison.items():
-            weight = allocations.get(stock, 0)
-            if weight >= 0.01:  # 1% threshold
-                stock_allocations[strategy_name] = weight
-        
-        if len(stock_allocations) >= 2:  # Significant in 2+ strategies
-            significant_across_strategies[stock] = stock_allocations
+
+    for i in np.where(counts >= 2)[0]:  # Significant in 2+ strategies
+        significant_across_strategies[stocks[i]] = {
+            strategy_names[j]: M[i, j] for j in np.where(mask[i])[0]
+        }
     
     print(f"Stocks with significant allocations (≥1%) in multiple strategies:")
     
     for stock, allocations in significant_across_strategies.items():
-        stock_info = universe_df[universe_df['Stock_Symbol'] == stock].iloc[0]
-        source_etfs = stock_info['Source_ETFs']
+        source_etfs = src_arr[sym_to_pos[stock]]
         
         allocation_str = ", ".join([f"{strategy}: {weight:.1%}" for strategy, weight in allocations.items()])
         print(f"  • {stock:<6} (from {source_etfs}): {allocation_str}")
@@ -157,20 +215,12 @@ def analyze_portfolio_allocations():
     print(f"\n📊 STRATEGY DIVERSIFICATION METRICS")
     print("-" * 60)
     
-    for strategy in manager.strategies:
-        if not strategy.metrics or strategy.metrics.weights is None:
-            continue
-        
-        weights = strategy.metrics.weights
-        
-        # Calculate concentration metrics
-        herfindahl_index = sum(w**2 for w in weights)  # Lower = more diversified
-        effective_stocks = 1 / herfindahl_index if herfindahl_index > 0 else 0
-        
-        # Weight distribution
-        max_weight = max(weights)
-        weights_above_5pct = sum(1 for w in weights if w >= 0.05)
-        weights_above_10pct = sum(1 for w in weights if w >= 0.10)
+    for strategy in optimized:
+        # All concentration reductions fused in a single pass over the
+        # weights (JIT-compiled when numba is installed)
+        w = np.asarray(strategy.metrics.weights, dtype=np.float64)
+        (herfindahl_index, effective_stocks, max_weight,
+         weights_above_5pct, weights_above_10pct) = conc_stats(w)
         
         print(f"{strategy.name}:")
         print(f"  • Herfindahl Index: {herfindahl_index:.3f} (lower = more diversified)")
@@ -178,25 +228,33 @@ def analyze_portfolio_allocations():
         print(f"  • Maximum single position: {max_weight:.1%}")
         print(f"  • Positions >5%: {weights_above_5pct}")
         print(f"  • Positions >10%: {weights_above_10pct}")
-    
-    return allocation_df
 
+    return allocation_df, universe_df, pivot_df
+
+
+def create_allocation_summary(allocation_df=None, universe_df=None, pivot_df=None):
+    """Create a visual summary of allocations.
+
+    The frames are normally handed over in memory by the allocation
+    analysis; reading them back from disk (and re-pivoting the long form)
+    is only a fallback for running this step standalone.
+    """
 
-def create_allocation_summary():
-    """Create a visual summary of allocations."""
-    
     try:
-        allocation_df = pd.read_csv('portfolio_strategy_allocations.csv')
-        
         print(f"\n📋 ALLOCATION SUMMARY TABLE")
         print("-" * 60)
-        
-        # Create pivot table showing all strategy allocations
-        pivot_df = allocation_df.pivot(index='Stock_Symbol', columns='Strategy', values='Portfolio_Weight')
-        pivot_df = pivot_df.fillna(0)
-        
+
+        if pivot_df is None:
+            # Fall back to pivoting the long-form allocations
+            if allocation_df is None:
+                allocation_df = pd.read_csv('portfolio_strategy_allocations.csv')
+            pivot_df = allocation_df.pivot(index='Stock_Symbol', columns='Strategy',
+                                           values='Portfolio_Weight')
+            pivot_df = pivot_df.fillna(0)
+
         # Add source ETF info
-        universe_df = pd.read_csv('stock_selection_final_universe.csv')
+        if universe_df is None:
+            universe_df = pd.read_csv('stock_selection_final_universe.csv')
         pivot_df = pivot_df.merge(universe_df[['Stock_Symbol', 'Source_ETFs', 'ETF_Count', 'Avg_ETF_Weight']], 
                                 left_index=True, right_on='Stock_Symbol', how='left')
         pivot_df = pivot_df.set_index('Stock_Symbol')
@@ -209,15 +267,29 @@ def create_allocation_summary():
         print()
         print(f"{'Symbol':<6} {'Equal Wt':<8} {'Max Sharpe':<10} {'Min Vol':<8} {'Source ETFs':<15} {'ETF Wt':<6}")
         print("-" * 70)
-        
+
+        # Many rows share the same Source_ETFs string, so truncate each
+        # distinct value once instead of re-slicing per display row; the
+        # weight cells get the same treatment for repeated values (e.g. 0)
+        truncated = {s: (s[:12] + "..." if len(s) > 12 else s)
+                     for s in pd.unique(pivot_df['Source_ETFs'].dropna())}
+        weight_cache = {}
+
+        def fmt_weight(value):
+            cell = weight_cache.get(value)
+            if cell is None:
+                cell = f"{value:.1%}" if value > 0 else "-"
+                weight_cache[value] = cell
+            return cell
+
         for stock in pivot_df.head(15).index:
             row = pivot_df.loc[stock]
-            equal_wt = f"{row['Equal Weight']:.1%}" if row['Equal Weight'] > 0 else "-"
-            max_sharpe = f"{row['Max Sharpe Ratio (All)']:.1%}" if row['Max Sharpe Ratio (All)'] > 0 else "-"
-            min_vol = f"{row['Minimum Volatility']:.1%}" if row['Minimum Volatility'] > 0 else "-"
-            source_etfs = row['Source_ETFs'][:12] + "..." if len(row['Source_ETFs']) > 12 else row['Source_ETFs']
+            equal_wt = fmt_weight(row['Equal Weight'])
+            max_sharpe = fmt_weight(row['Max Sharpe Ratio (All)'])
+            min_vol = fmt_weight(row['Minimum Volatility'])
+            source_etfs = truncated.get(row['Source_ETFs'], row['Source_ETFs'])
             avg_etf_wt = f"{row['Avg_ETF_Weight']:.1f}%"
-            
+
             print(f"{stock:<6} {equal_wt:<8} {max_sharpe:<10} {min_vol:<8} {source_etfs:<15} {avg_etf_wt:<6}")
         
         print("\nLegend: Equal Wt = Equal Weight, Max Sharpe = Max Sharpe Ratio, Min Vol = Minimum Volatility")
@@ -235,10 +307,13 @@ def main():
     
     try:
         # Run allocation analysis
-        allocation_df = analyze_portfolio_allocations()
-        
-        # Create summary
-        create_allocation_summary()
+        result = analyze_portfolio_allocations()
+        allocation_df, universe_df, pivot_df = (
+            result if result is not None else (None, None, None)
+        )
+
+        # Create summary from the in-memory frames - no CSV round-trip
+        create_allocation_summary(allocation_df, universe_df, pivot_df)
         
         print(f"\n" + "=" * 60)
         print("PORTFOLIO ALLOCATION ANALYSIS COMPLETE!")
@@ -7,17 +7,47 @@ Shows which stocks are selected from ETFs, their characteristics, and how they'r
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Prefer the installed package (pip install -e .); only fall back to path
+# munging when running from a raw checkout
+try:
+    import src  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+import pickle
+import time
 
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 from src.data.universe_manager import PortfolioUniverseManager
 from src.data.etf_holdings import ETFHoldingsManager
-from src.utils.helpers import format_percentage, format_currency
+from src.utils.helpers import format_percentage, format_currency, write_dataframe
 import warnings
 warnings.filterwarnings('ignore')
 
+# Characters that mark non-tradeable symbols (share classes, futures, etc.)
+INVALID_SYMBOL_CHARS = frozenset('.=^-')
+
+# Optimized strategies are cached on disk keyed by the universe contents;
+# same freshness window as the ETF holdings cache
+STRATEGY_CACHE_DIR = '.cache'
+STRATEGY_CACHE_TTL_SECONDS = 86400
+
+
+@dataclass(slots=True)
+class ETFArrays:
+    """Structure-of-arrays view of one ETF's holdings.
+
+    Keeping weights in a contiguous float array lets the threshold filters
+    and min/max run as single NumPy calls instead of per-holding Python.
+    """
+    symbols: np.ndarray   # object dtype
+    names: np.ndarray     # object dtype
+    weights: np.ndarray   # float64
+
 
 class StockSelectionAnalyzer:
     """Analyze the stock selection process in detail."""
@@ -51,6 +81,7 @@ class StockSelectionAnalyzer:
         analysis = {
             'etf_details': {},
             'stock_sources': {},
+            'source_df': None,
             'selection_stats': {},
             'filtered_stocks': {},
             'final_universe': []
@@ -62,7 +93,8 @@ class StockSelectionAnalyzer:
         
         total_raw_holdings = 0
         total_filtered_holdings = 0
-        
+        source_rows = []  # (etf, symbol, name, weight) across all ETFs
+
         for etf in etf_symbols:
             print(f"\n--- {etf} Analysis ---")
             
@@ -77,86 +109,111 @@ class StockSelectionAnalyzer:
             print(f"ETF Name: {etf_info.name}")
             print(f"Total available holdings: {len(etf_info.holdings)}")
             
-            # Filter by weight threshold
-            filtered_holdings = [h for h in etf_info.holdings if h.weight >= min_weight]
-            valid_holdings = []
-            
-            for holding in filtered_holdings:
-                # Additional filtering for valid stock symbols
-                if (holding.symbol and 
-                    len(holding.symbol) <= 5 and 
-                    not any(char in holding.symbol for char in ['.', '=', '^', '-'])):
-                    valid_holdings.append(holding)
-            
-            print(f"Holdings after weight filter (>{min_weight}%): {len(filtered_holdings)}")
-            print(f"Valid stock symbols: {len(valid_holdings)}")
-            
-            total_raw_holdings += len(etf_info.holdings)
-            total_filtered_holdings += len(valid_holdings)
-            
+            # Columnar view of the holdings: one conversion, then the weight
+            # threshold becomes a vectorized mask instead of a Python loop
+            n_holdings = len(etf_info.holdings)
+            arrays = ETFArrays(
+                symbols=np.array([h.symbol for h in etf_info.holdings], dtype=object),
+                names=np.array([h.name for h in etf_info.holdings], dtype=object),
+                weights=np.fromiter((h.weight for h in etf_info.holdings),
+                                    dtype=np.float64, count=n_holdings)
+            )
+
+            weight_mask = arrays.weights >= min_weight
+            n_weight_filtered = int(weight_mask.sum())
+
+            # Symbol validity is inherently per-string; check only the
+            # weight-filtered survivors
+            sym_f = arrays.symbols[weight_mask]
+            valid_mask = np.fromiter(
+                (bool(s) and len(s) <= 5 and INVALID_SYMBOL_CHARS.isdisjoint(s)
+                 for s in sym_f),
+                dtype=bool, count=len(sym_f)
+            )
+            valid_symbols = sym_f[valid_mask].tolist()
+            valid_names = arrays.names[weight_mask][valid_mask].tolist()
+            valid_weights = arrays.weights[weight_mask][valid_mask]
+            n_valid = len(valid_symbols)
+
+            print(f"Holdings after weight filter (>{min_weight}%): {n_weight_filtered}")
+            print(f"Valid stock symbols: {n_valid}")
+
+            total_raw_holdings += n_holdings
+            total_filtered_holdings += n_valid
+
             # Show top holdings
             print(f"Top holdings selected:")
-            for i, holding in enumerate(valid_holdings[:10], 1):
-                print(f"  {i:2d}. {holding.symbol:<6} - {holding.name:<25} ({holding.weight:.1f}%)")
-            
-            if len(valid_holdings) > 10:
-                print(f"  ... and {len(valid_holdings) - 10} more")
-            
+            for i in range(min(10, n_valid)):
+                print(f"  {i + 1:2d}. {valid_symbols[i]:<6} - {valid_names[i]:<25} "
+                      f"({valid_weights[i]:.1f}%)")
+
+            if n_valid > 10:
+                print(f"  ... and {n_valid - 10} more")
+
+            holdings_details = list(zip(valid_symbols, valid_names,
+                                        valid_weights.tolist()))
+
             # Store detailed info
             analysis['etf_details'][etf] = {
                 'name': etf_info.name,
-                'total_holdings': len(etf_info.holdings),
-                'filtered_holdings': len(filtered_holdings),
-                'valid_holdings': len(valid_holdings),
-                'selected_symbols': [h.symbol for h in valid_holdings],
+                'total_holdings': n_holdings,
+                'filtered_holdings': n_weight_filtered,
+                'valid_holdings': n_valid,
+                'selected_symbols': valid_symbols,
                 'weight_range': (
-                    min(h.weight for h in valid_holdings) if valid_holdings else 0,
-                    max(h.weight for h in valid_holdings) if valid_holdings else 0
+                    float(valid_weights.min()) if n_valid else 0,
+                    float(valid_weights.max()) if n_valid else 0
                 ),
-                'holdings_details': [(h.symbol, h.name, h.weight) for h in valid_holdings]
+                'holdings_details': holdings_details
             }
+            source_rows.extend((etf, symbol, name, weight)
+                               for symbol, name, weight in holdings_details)
         
         # Step 2: Analyze stock overlap and sources
         print(f"\n2. STOCK SOURCE ANALYSIS")
         print("-" * 40)
         
-        all_stocks = {}  # stock -> list of (etf, weight) tuples
-        
-        for etf, details in analysis['etf_details'].items():
-            if 'error' in details:
-                continue
-                
-            for symbol, name, weight in details['holdings_details']:
-                if symbol not in all_stocks:
-                    all_stocks[symbol] = []
-                all_stocks[symbol].append((etf, weight, name))
-        
-        # Categorize stocks by overlap
-        unique_stocks = {stock: sources for stock, sources in all_stocks.items() if len(sources) == 1}
-        overlapping_stocks = {stock: sources for stock, sources in all_stocks.items() if len(sources) > 1}
-        
+        # One columnar pass over all (ETF, stock) rows; symbols are encoded
+        # to integer codes once and the overlap histogram is a single
+        # bincount over those codes - no dict-of-lists bookkeeping
+        src_df = pd.DataFrame(source_rows,
+                              columns=['ETF', 'Stock_Symbol', 'Stock_Name', 'Weight'])
+        if not src_df.empty:
+            codes, unique_symbols = pd.factorize(src_df['Stock_Symbol'].to_numpy())
+            overlap_counts = pd.Series(np.bincount(codes), index=unique_symbols)
+        else:
+            overlap_counts = pd.Series(dtype=int)
+
+        # Downstream code (portfolio usage + CSV export) still consumes the
+        # stock -> [(etf, weight, name)] mapping, so keep that list form
+        all_stocks = {}
+        for etf, symbol, name, weight in source_rows:
+            all_stocks.setdefault(symbol, []).append((etf, weight, name))
+
+        single_etf_stocks = int((overlap_counts == 1).sum())
+        multi_etf_stocks = int((overlap_counts > 1).sum())
+
         print(f"Total unique stock symbols found: {len(all_stocks)}")
-        print(f"Stocks appearing in only 1 ETF: {len(unique_stocks)}")
-        print(f"Stocks appearing in multiple ETFs: {len(overlapping_stocks)}")
-        
+        print(f"Stocks appearing in only 1 ETF: {single_etf_stocks}")
+        print(f"Stocks appearing in multiple ETFs: {multi_etf_stocks}")
+
         # Show most overlapped stocks
-        if overlapping_stocks:
+        if multi_etf_stocks:
             print(f"\nMost overlapped stocks:")
-            sorted_overlaps = sorted(overlapping_stocks.items(), 
-                                   key=lambda x: len(x[1]), reverse=True)
-            
-            for stock, sources in sorted_overlaps[:10]:
+            for stock, count in overlap_counts[overlap_counts > 1].nlargest(10).items():
+                sources = all_stocks[stock]
                 etf_list = [f"{etf}({weight:.1f}%)" for etf, weight, name in sources]
-                print(f"  {stock:<6} - {len(sources)} ETFs: {', '.join(etf_list)}")
-        
+                print(f"  {stock:<6} - {count} ETFs: {', '.join(etf_list)}")
+
         analysis['stock_sources'] = all_stocks
+        analysis['source_df'] = src_df
         analysis['selection_stats'] = {
             'total_raw_holdings': total_raw_holdings,
             'total_filtered_holdings': total_filtered_holdings,
             'unique_stocks': len(all_stocks),
-            'single_etf_stocks': len(unique_stocks),
-            'multi_etf_stocks': len(overlapping_stocks),
-            'max_overlap': max(len(sources) for sources in all_stocks.values()) if all_stocks else 0
+            'single_etf_stocks': single_etf_stocks,
+            'multi_etf_stocks': multi_etf_stocks,
+            'max_overlap': int(overlap_counts.max()) if not overlap_counts.empty else 0
         }
         
         # Step 3: Final universe selection
@@ -171,37 +228,89 @@ class StockSelectionAnalyzer:
               f"({(1 - len(final_universe)/total_raw_holdings)*100:.1f}% reduction)")
         
         # Show universe by sector/characteristics (if we fetch fundamental data)
+        # Accumulate the per-stock lines and flush them in one write rather
+        # than paying a syscall per stock on line-buffered stdout
         print(f"\nFinal universe stocks:")
+        lines = []
         for i, stock in enumerate(final_universe, 1):
             sources = all_stocks[stock]
             if len(sources) == 1:
                 etf, weight, name = sources[0]
-                print(f"  {i:2d}. {stock:<6} - {name[:30]:<30} (from {etf}: {weight:.1f}%)")
+                lines.append(f"  {i:2d}. {stock:<6} - {name[:30]:<30} (from {etf}: {weight:.1f}%)")
             else:
                 etf_info = f"{len(sources)} ETFs"
                 avg_weight = sum(weight for etf, weight, name in sources) / len(sources)
                 name = sources[0][2]  # Take name from first source
-                print(f"  {i:2d}. {stock:<6} - {name[:30]:<30} (from {etf_info}, avg: {avg_weight:.1f}%)")
+                lines.append(f"  {i:2d}. {stock:<6} - {name[:30]:<30} (from {etf_info}, avg: {avg_weight:.1f}%)")
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         self.selection_data = analysis
         return analysis
     
-    def analyze_portfolio_strategies_selection(self, analysis_data: Dict) -> None:
-        """Analyze how selected stocks are used in different portfolio strategies."""
-        
+    def _strategy_cache_path(self, universe: List[str], period: str) -> str:
+        """Cache file path for one (universe, fetch period) combination."""
+        key = hashlib.md5(
+            (','.join(sorted(universe)) + '|' + period).encode()
+        ).hexdigest()
+        return os.path.join(STRATEGY_CACHE_DIR, f'strategies_{key}.pkl')
+
+    def _load_cached_strategies(self, cache_path: str) -> bool:
+        """Load pickled strategies if a fresh cache file exists."""
+        try:
+            if not os.path.exists(cache_path):
+                return False
+            if time.time() - os.path.getmtime(cache_path) >= STRATEGY_CACHE_TTL_SECONDS:
+                return False
+            with open(cache_path, 'rb') as f:
+                self.universe_manager.strategies = pickle.load(f)
+            return bool(self.universe_manager.strategies)
+        except Exception as e:
+            print(f"WARNING: Could not load strategy cache: {e}")
+            return False
+
+    def _save_cached_strategies(self, cache_path: str) -> None:
+        """Persist the optimized strategies for the next report run."""
+        try:
+            os.makedirs(STRATEGY_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(self.universe_manager.strategies, f)
+        except Exception as e:
+            print(f"WARNING: Could not save strategy cache: {e}")
+
+    def analyze_portfolio_strategies_selection(self, analysis_data: Dict,
+                                               force: bool = False) -> None:
+        """Analyze how selected stocks are used in different portfolio strategies.
+
+        Re-running the report on an unchanged universe reuses the optimized
+        strategies from a disk cache instead of refetching and re-optimizing;
+        pass force=True to bypass the cache.
+        """
+
         if not analysis_data['final_universe']:
             print("No universe data to analyze")
             return
-        
+
         print(f"\n4. PORTFOLIO STRATEGY STOCK USAGE")
         print("-" * 40)
-        
+
+        cache_path = self._strategy_cache_path(analysis_data['final_universe'], "6mo")
+        if not force and self._load_cached_strategies(cache_path):
+            print(f"✓ Loaded {len(self.universe_manager.strategies)} optimized "
+                  f"strategies from cache")
+            try:
+                print(f"\nStrategy stock usage breakdown:")
+                self._print_strategy_breakdown(analysis_data)
+            except Exception as e:
+                print(f"Error in portfolio analysis: {e}")
+            return
+
         # Build universe in universe manager
         self.universe_manager.add_universe_stocks(
-            analysis_data['final_universe'], 
+            analysis_data['final_universe'],
             fetch_fundamentals=False  # Skip for speed
         )
-        
+
         # Fetch data (shorter period for analysis)
         print("Fetching historical data for analysis...")
         try:
@@ -209,44 +318,51 @@ class StockSelectionAnalyzer:
             if not universe_data:
                 print("Could not fetch historical data")
                 return
-            
+
             print(f"Successfully loaded data for {len(universe_data['symbols'])} stocks")
-            
+
             # Build strategies
             strategies = self.universe_manager.build_portfolio_strategies()
             self.universe_manager.optimize_strategies()
-            
+            self._save_cached_strategies(cache_path)
+
             print(f"\nStrategy stock usage breakdown:")
-            
-            for strategy in self.universe_manager.strategies:
-                if not strategy.metrics:
-                    continue
-                    
-                print(f"\n--- {strategy.name} ---")
-                print(f"Total stocks used: {len(strategy.symbols)}")
-                print(f"Description: {strategy.description}")
-                
-                # Show top weighted stocks in strategy
-                if hasattr(strategy.metrics, 'weights') and strategy.metrics.weights is not None:
-                    # Get stocks with their weights
-                    stock_weights = list(zip(strategy.symbols, strategy.metrics.weights))
-                    stock_weights.sort(key=lambda x: x[1], reverse=True)
-                    
-                    print(f"Top 10 weighted stocks:")
-                    for i, (stock, weight) in enumerate(stock_weights[:10], 1):
-                        # Find source ETFs for this stock
-                        sources = analysis_data['stock_sources'].get(stock, [])
-                        source_info = f"from {sources[0][0]}" if sources else "unknown source"
-                        print(f"  {i:2d}. {stock:<6} - {weight:.1%} ({source_info})")
-                
-                # Show performance metrics
-                if strategy.metrics:
-                    print(f"Expected Return: {format_percentage(strategy.metrics.expected_return)}")
-                    print(f"Volatility: {format_percentage(strategy.metrics.volatility)}")
-                    print(f"Sharpe Ratio: {strategy.metrics.sharpe_ratio:.3f}")
-            
+            self._print_strategy_breakdown(analysis_data)
+
         except Exception as e:
             print(f"Error in portfolio analysis: {e}")
+
+    def _print_strategy_breakdown(self, analysis_data: Dict) -> None:
+        """Print per-strategy stock usage for the optimized strategies."""
+        for strategy in self.universe_manager.strategies:
+            if not strategy.metrics:
+                continue
+
+            print(f"\n--- {strategy.name} ---")
+            print(f"Total stocks used: {len(strategy.symbols)}")
+            print(f"Description: {strategy.description}")
+
+            # Show top weighted stocks in strategy
+            if hasattr(strategy.metrics, 'weights') and strategy.metrics.weights is not None:
+                # Only the top 10 are displayed, so an O(N log k) partial
+                # selection beats sorting the whole weight list
+                w = np.asarray(strategy.metrics.weights, dtype=np.float64)
+                k = min(10, len(w))
+                top_idx = np.argpartition(-w, range(k))[:k]
+                top_stocks = [(strategy.symbols[i], float(w[i])) for i in top_idx]
+
+                print(f"Top 10 weighted stocks:")
+                for i, (stock, weight) in enumerate(top_stocks, 1):
+                    # Find source ETFs for this stock
+                    sources = analysis_data['stock_sources'].get(stock, [])
+                    source_info = f"from {sources[0][0]}" if sources else "unknown source"
+                    print(f"  {i:2d}. {stock:<6} - {weight:.1%} ({source_info})")
+
+            # Show performance metrics
+            if strategy.metrics:
+                print(f"Expected Return: {format_percentage(strategy.metrics.expected_return)}")
+                print(f"Volatility: {format_percentage(strategy.metrics.volatility)}")
+                print(f"Sharpe Ratio: {strategy.metrics.sharpe_ratio:.3f}")
     
     def generate_selection_report(self, etf_symbols: List[str], 
                                 min_weight: float = 1.0,
@@ -291,68 +407,67 @@ class StockSelectionAnalyzer:
         print("-" * 40)
         
         try:
+            # All four exports derive from the per-source frame built during
+            # the selection analysis - column-at-a-time construction instead
+            # of a dict allocation per row
+            src_df = analysis.get('source_df')
+            if src_df is None or src_df.empty:
+                src_df = pd.DataFrame(
+                    [(etf, stock, name, weight)
+                     for stock, sources in analysis['stock_sources'].items()
+                     for etf, weight, name in sources],
+                    columns=['ETF', 'Stock_Symbol', 'Stock_Name', 'Weight']
+                )
+
             # 1. ETF Holdings Details
-            etf_details_data = []
-            for etf, details in analysis['etf_details'].items():
-                if 'error' in details:
-                    continue
-                    
-                for symbol, name, weight in details['holdings_details']:
-                    etf_details_data.append({
-                        'ETF': etf,
-                        'ETF_Name': details['name'],
-                        'Stock_Symbol': symbol,
-                        'Stock_Name': name,
-                        'Weight_in_ETF': weight,
-                        'Meets_Threshold': 'Yes'
-                    })
-            
-            etf_df = pd.DataFrame(etf_details_data)
-            etf_df.to_csv('stock_selection_etf_holdings.csv', index=False)
+            etf_names = {etf: details['name']
+                         for etf, details in analysis['etf_details'].items()
+                         if 'error' not in details}
+            etf_df = pd.DataFrame({
+                'ETF': src_df['ETF'],
+                'ETF_Name': src_df['ETF'].map(etf_names),
+                'Stock_Symbol': src_df['Stock_Symbol'],
+                'Stock_Name': src_df['Stock_Name'],
+                'Weight_in_ETF': src_df['Weight'],
+                'Meets_Threshold': 'Yes'
+            })
+            write_dataframe(etf_df, 'stock_selection_etf_holdings.csv')
             print("✓ Saved: stock_selection_etf_holdings.csv")
-            
+
             # 2. Stock Source Analysis
-            stock_sources_data = []
-            for stock, sources in analysis['stock_sources'].items():
-                for etf, weight, name in sources:
-                    stock_sources_data.append({
-                        'Stock_Symbol': stock,
-                        'Stock_Name': name,
-                        'Source_ETF': etf,
-                        'Weight_in_ETF': weight,
-                        'Overlap_Count': len(sources)
-                    })
-            
-            sources_df = pd.DataFrame(stock_sources_data)
-            sources_df.to_csv('stock_selection_sources.csv', index=False)
+            sources_df = pd.DataFrame({
+                'Stock_Symbol': src_df['Stock_Symbol'],
+                'Stock_Name': src_df['Stock_Name'],
+                'Source_ETF': src_df['ETF'],
+                'Weight_in_ETF': src_df['Weight'],
+                'Overlap_Count': src_df.groupby('Stock_Symbol', sort=False)['ETF']
+                                       .transform('size')
+            })
+            write_dataframe(sources_df, 'stock_selection_sources.csv')
             print("✓ Saved: stock_selection_sources.csv")
-            
-            # 3. Final Universe Summary
-            universe_data = []
-            for stock in analysis['final_universe']:
-                sources = analysis['stock_sources'][stock]
-                universe_data.append({
-                    'Stock_Symbol': stock,
-                    'Stock_Name': sources[0][2],  # Name from first source
-                    'Source_ETFs': ', '.join([etf for etf, weight, name in sources]),
-                    'ETF_Count': len(sources),
-                    'Avg_Weight': sum(weight for etf, weight, name in sources) / len(sources),
-                    'Max_Weight': max(weight for etf, weight, name in sources),
-                    'Min_Weight': min(weight for etf, weight, name in sources)
-                })
-            
-            universe_df = pd.DataFrame(universe_data)
-            universe_df.to_csv('stock_selection_final_universe.csv', index=False)
+
+            # 3. Final Universe Summary (alphabetical groupby matches the
+            # sorted final_universe order)
+            universe_df = (
+                src_df.groupby('Stock_Symbol')
+                .agg(Stock_Name=('Stock_Name', 'first'),
+                     Source_ETFs=('ETF', ', '.join),
+                     ETF_Count=('ETF', 'size'),
+                     Avg_Weight=('Weight', 'mean'),
+                     Max_Weight=('Weight', 'max'),
+                     Min_Weight=('Weight', 'min'))
+                .reset_index()
+            )
+            write_dataframe(universe_df, 'stock_selection_final_universe.csv')
             print("✓ Saved: stock_selection_final_universe.csv")
-            
+
             # 4. Selection Statistics
-            stats_data = [{
-                'Metric': key.replace('_', ' ').title(),
-                'Value': value
-            } for key, value in analysis['selection_stats'].items()]
-            
-            stats_df = pd.DataFrame(stats_data)
-            stats_df.to_csv('stock_selection_statistics.csv', index=False)
+            stats = analysis['selection_stats']
+            stats_df = pd.DataFrame({
+                'Metric': [key.replace('_', ' ').title() for key in stats],
+                'Value': list(stats.values())
+            })
+            write_dataframe(stats_df, 'stock_selection_statistics.csv')
             print("✓ Saved: stock_selection_statistics.csv")
             
             print(f"\n📁 All selection analysis files saved to current directory")
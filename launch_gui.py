@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 """
 Portfolio Management GUI Launcher
 
@@ -6,30 +7,33 @@ Simple launcher script for the Portfolio Management GUI application.
 
 import sys
 import os
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 import subprocess
 from pathlib import Path
 
+REQUIRED_PACKAGES = ('matplotlib', 'pandas', 'numpy', 'scipy', 'yfinance')
+
 
 def check_dependencies():
-    """Check if all required dependencies are installed."""
-    try:
-        import matplotlib
-        import pandas
-        import numpy
-        import scipy
-        import yfinance
-        return True
-    except ImportError as e:
-        missing_package = str(e).split("'")[1] if "'" in str(e) else "unknown"
+    """Check if all required dependencies are installed.
+
+    find_spec only consults the import system's finders, so the check
+    avoids actually executing the heavy package initializers (pandas and
+    matplotlib alone cost seconds cold) just to prove they exist.
+    """
+    missing = [pkg for pkg in REQUIRED_PACKAGES
+               if importlib.util.find_spec(pkg) is None]
+    if missing:
         messagebox.showerror(
-            "Missing Dependencies", 
-            f"Missing required package: {missing_package}\n\n"
+            "Missing Dependencies",
+            f"Missing required packages: {', '.join(missing)}\n\n"
             "Please install dependencies by running:\n"
-            f"pip install {missing_package}"
+            f"pip install {' '.join(missing)}"
         )
         return False
+    return True
 
 
 def launch_gui():
@@ -112,11 +116,23 @@ def create_splash_screen():
         if check_dependencies():
             status_label.config(text="✅ All dependencies found", fg='#27ae60')
             def launch_and_close():
-                splash.withdraw()  # Hide splash first
+                # Tear the splash Tk down completely, then replace this
+                # process with the GUI script - the heavy pandas/matplotlib
+                # import chain never runs inside the splash mainloop, and
+                # Python startup isn't paid a second time
+                splash.destroy()
+                gui_script = os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)), 'portfolio_gui.py'
+                )
                 try:
-                    launch_gui()
-                finally:
-                    splash.quit()  # Ensure splash mainloop ends
+                    os.execv(sys.executable, [sys.executable, gui_script])
+                except OSError:
+                    # execv semantics are unreliable on Windows; fall back
+                    # to a child process, then to an in-process launch
+                    try:
+                        subprocess.Popen([sys.executable, gui_script])
+                    except Exception:
+                        launch_gui()
             launch_button.config(state=tk.NORMAL, command=launch_and_close)
         else:
             status_label.config(text="❌ Missing dependencies", fg='#e74c3c')
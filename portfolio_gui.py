@@ -11,27 +11,95 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, asdict
 from typing import Dict, List, Optional, Tuple
 import warnings
-import yfinance as yf
-warnings.filterwarnings('ignore')
+# Warning suppression is scoped to the noisy fetch/optimize paths below
+# rather than installed globally - every warning check walks the global
+# filter list, which adds up inside pandas-heavy loops
+
+# Heavy imports are deferred to first use: matplotlib's cold import
+# (font-cache build included) and yfinance each cost hundreds of ms that
+# would otherwise land before the window can appear. The names are left
+# unbound here so the module __getattr__ below actually fires for them.
+_LAZY_PLOTTING = ('plt', 'FigureCanvasTkAgg', 'FigureCanvasAgg',
+                  'Figure', 'Image', 'ImageTk')
+
+
+def _ensure_plotting():
+    """Import matplotlib/PIL into module globals on first use."""
+    if 'plt' in globals():
+        return
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from PIL import Image, ImageTk
+    globals().update(
+        plt=plt, FigureCanvasTkAgg=FigureCanvasTkAgg,
+        FigureCanvasAgg=FigureCanvasAgg, Figure=Figure,
+        Image=Image, ImageTk=ImageTk
+    )
+
+
+def __getattr__(name):
+    # PEP 562 lazy attributes for importers of this module
+    if name == 'yf':
+        import yfinance
+        globals()['yf'] = yfinance
+        return yfinance
+    if name in _LAZY_PLOTTING:
+        _ensure_plotting()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Import our portfolio system components
 from src.data.universe_manager import PortfolioUniverseManager
 from src.data.etf_holdings import ETFHoldingsManager
 from src.data.tv_data_fetcher import TradingViewDataFetcher, get_stock_returns
+from src.data import _price_cache
 from src.portfolio.optimizer import PortfolioOptimizer
+from src.portfolio.rolling_stats import RollingCovariance
 from src.utils.file_manager import PortfolioFileManager
-from src.utils.helpers import format_percentage, format_currency
+from src.utils.helpers import (format_percentage, format_currency,
+                               format_percentage_array, format_currency_array)
+
+
+@dataclass(slots=True)
+class PortfolioConfig:
+    """Persisted GUI configuration.
+
+    Slot-based dataclass so the many config reads scattered through the
+    GUI are plain attribute loads instead of dict hashing, and typos in
+    config keys fail loudly instead of silently returning defaults.
+    """
+    selected_etfs: List[str] = field(default_factory=lambda: ['SPY', 'QQQ', 'XLF', 'XLK'])
+    min_weight: float = 2.0
+    max_holdings: int = 20
+    rebalance_frequency: str = 'Monthly'
+    rebalance_threshold: float = 5.0
+    auto_rebalance: bool = False
+    num_simulations: int = 1000
+    time_horizon: int = 252
+    initial_investment: float = 100000
+    data_period: str = '1y'
+    risk_free_rate: float = 5.0
+    auto_save: bool = True
+    auto_export: bool = True
+    cpu_cores: int = 4
+    enable_cache: bool = True
+    auto_remove_insufficient_data: bool = True
+    quick_start_shown: bool = False
+    enable_web_scraping: bool = True  # Enable web scraping with user XPath selectors
+    web_scraper_headless: bool = True  # Run web scraper in headless mode for performance
 
 
 class ScrollableFrame(ttk.Frame):
@@ -66,9 +134,14 @@ class ScrollableFrame(ttk.Frame):
         self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
         
-        # Bind mousewheel to canvas when mouse enters
-        self.canvas.bind("<Enter>", self._bind_mousewheel)
-        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+        # Bind the wheel directly on the canvas (no bind_all round-trips)
+        # and coalesce deltas so fast trackpads trigger one scroll per
+        # idle cycle instead of one redraw per event
+        self._pending_scroll = 0
+        self._scroll_scheduled = False
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", self._on_mousewheel)   # X11 wheel up
+        self.canvas.bind("<Button-5>", self._on_mousewheel)   # X11 wheel down
     
     def _on_frame_configure(self, event):
         """Update scroll region when frame size changes."""
@@ -88,17 +161,25 @@ class ScrollableFrame(ttk.Frame):
             self.canvas.itemconfig(self.canvas_window, width=canvas_width)
     
     def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling."""
-        if self.canvas.winfo_containing(event.x_root, event.y_root) == self.canvas:
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-    
-    def _bind_mousewheel(self, event):
-        """Bind mousewheel when entering canvas."""
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-    
-    def _unbind_mousewheel(self, event):
-        """Unbind mousewheel when leaving canvas."""
-        self.canvas.unbind_all("<MouseWheel>")
+        """Accumulate wheel deltas; the scroll itself runs once per idle cycle."""
+        num = getattr(event, 'num', None)
+        if num == 4:      # X11 reports the wheel as button presses
+            step = -1
+        elif num == 5:
+            step = 1
+        else:             # Windows/macOS <MouseWheel> carries a delta
+            step = -int(event.delta / 120)
+        self._pending_scroll += step
+        if not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self.canvas.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Apply the accumulated wheel delta in a single yview_scroll."""
+        if self._pending_scroll:
+            self.canvas.yview_scroll(self._pending_scroll, "units")
+        self._pending_scroll = 0
+        self._scroll_scheduled = False
     
     def scroll_to_top(self):
         """Scroll to the top of the frame."""
@@ -149,18 +230,36 @@ def create_slider_with_entry(parent, from_, to, variable, label_text, row, colum
     entry = ttk.Entry(control_frame, textvariable=variable, width=8)
     entry.pack(side=tk.LEFT)
     
-    # Function to validate and round values for whole number sliders
-    def validate_value(*args):
+    # Function to validate and round values for whole number sliders.
+    # The trace only schedules one after_idle validation per idle cycle,
+    # so a drag processes the final value instead of every intermediate
+    # write; the reentrancy guard keeps our own variable.set from
+    # re-triggering the trace
+    _updating = [False]
+    _scheduled = [False]
+
+    def _do_validate():
+        _scheduled[0] = False
         try:
             value = variable.get()
             if resolution == 1:
-                # Round to whole number
                 rounded_value = round(value)
-                if rounded_value != value:
+                if abs(value - rounded_value) < 1e-9:
+                    return
+                _updating[0] = True
+                try:
                     variable.set(rounded_value)
+                finally:
+                    _updating[0] = False
         except (tk.TclError, ValueError):
             pass
-    
+
+    def validate_value(*args):
+        if _updating[0] or _scheduled[0]:
+            return
+        _scheduled[0] = True
+        parent.after_idle(_do_validate)
+
     # Bind validation to variable changes
     variable.trace_add('write', validate_value)
     
@@ -185,15 +284,48 @@ class PortfolioGUI:
         # Configuration and state
         self.config_file = "portfolio_gui_config.json"
         self.config = self.load_config()
+        self._config_dirty = False
         self.current_portfolios = {}
         self.simulation_results = {}
-        self.selected_etfs = tk.StringVar(value=", ".join(self.config.get('selected_etfs', [])))
-        self.rebalance_frequency = tk.StringVar(value=self.config.get('rebalance_frequency', 'Monthly'))
+        self.selected_etfs = tk.StringVar(value=", ".join(self.config.selected_etfs))
+        self.rebalance_frequency = tk.StringVar(value=self.config.rebalance_frequency)
+
+        # Config-backed variables are created up front rather than inside
+        # the tab builders: tabs build lazily, so anything read across
+        # tabs (menu actions, portfolio display, save_config) must exist
+        # regardless of which tabs have been visited
+        self.min_weight_var = tk.DoubleVar(value=self.config.min_weight)
+        self.max_holdings_var = tk.IntVar(value=self.config.max_holdings)
+        self.num_sims_var = tk.IntVar(value=self.config.num_simulations)
+        self.time_horizon_var = tk.IntVar(value=self.config.time_horizon)
+        self.initial_investment_var = tk.DoubleVar(value=self.config.initial_investment)
+        self.data_period_var = tk.StringVar(value=self.config.data_period)
+        self.rebal_threshold_var = tk.DoubleVar(value=self.config.rebalance_threshold)
+        self.auto_rebalance_var = tk.BooleanVar(value=self.config.auto_rebalance)
+        self.risk_free_rate_var = tk.DoubleVar(value=self.config.risk_free_rate)
+        self.auto_save_var = tk.BooleanVar(value=self.config.auto_save)
+        self.auto_export_var = tk.BooleanVar(value=self.config.auto_export)
+        self.global_auto_remove_var = tk.BooleanVar(value=self.config.auto_remove_insufficient_data)
+        self.enable_data_cache_var = tk.BooleanVar(value=self.config.enable_cache)
+        self.cpu_cores_var = tk.IntVar(value=self.config.cpu_cores)
+        self.enable_cache_var = tk.BooleanVar(value=self.config.enable_cache)
         
         # Threading for background operations
         self.background_thread = None
         self.stop_background = threading.Event()
-        
+
+        # Rolling covariance cache per strategy, reused across optimizations
+        self._rolling_cov = {}
+
+        # Status-bar writes are throttled through a dirty flag + after()
+        self._status_dirty = False
+        self._pending_status_text = ""
+        self._pending_progress = False
+        self._progress_running = False
+
+        # Register named widget styles before any widgets are created
+        self._setup_styles()
+
         # Create the GUI
         self.create_gui()
         
@@ -204,12 +336,33 @@ class PortfolioGUI:
         self.root.bind('<Control-p>', lambda e: self.optimize_selected_portfolio())
         self.root.bind('<F5>', lambda e: self.optimize_selected_portfolio())
         
+        # Coalesce config writes: mutations only mark the dict dirty, and
+        # this timer flushes at most once every five seconds
+        self.root.after(5000, self._maybe_flush_config)
+
         # Show quick start on first run
-        if not self.config.get('quick_start_shown', False):
+        if not self.config.quick_start_shown:
             self.root.after(1000, self.show_quick_start)
         
         print("🚀 Portfolio Management GUI initialized")
-    
+
+    def _setup_styles(self):
+        """Register the named ttk styles used throughout the GUI.
+
+        Passing font/foreground kwargs to each ttk.Label creates a
+        one-off style that Tk must resolve on every geometry query;
+        naming the recurring combinations once keeps the lookups cached.
+        """
+        s = ttk.Style()
+        s.configure('Status.TLabel', font=('Arial', 9), foreground='gray')
+        s.configure('Warn.TLabel', font=('Arial', 8), foreground='red')
+        s.configure('Metric.TLabel', font=('Arial', 10, 'bold'))
+        s.configure('Bold.TLabel', font=('Arial', 9, 'bold'))
+        s.configure('Small.TLabel', font=('Arial', 8))
+        s.configure('SmallGray.TLabel', font=('Arial', 8), foreground='gray')
+        s.configure('Header.TLabel', font=('Arial', 12, 'bold'))
+        s.configure('Title.TLabel', font=('Arial', 16, 'bold'))
+
     def create_gui(self):
         """Create the main GUI interface."""
         # Create main menu
@@ -238,18 +391,41 @@ class PortfolioGUI:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Create tabs
-        self.create_etf_selection_tab()
-        self.create_portfolio_overview_tab()
-        self.create_custom_allocation_tab()
-        self.create_simulation_tab()
-        self.create_metrics_tab()
-        
-        self.create_rebalancing_tab()
-        self.create_settings_tab()
-        
+        # Create tabs lazily - each tab starts as an empty frame and its
+        # builder runs the first time the tab is actually selected, so
+        # startup only pays for the tab that is visible
+        tab_specs = [
+            ("📊 ETF Selection", self.create_etf_selection_tab),
+            ("💼 Portfolio Overview", self.create_portfolio_overview_tab),
+            ("⚖️ Custom Allocation", self.create_custom_allocation_tab),
+            ("🎲 Simulation", self.create_simulation_tab),
+            ("📈 Metrics", self.create_metrics_tab),
+            ("⚖️ Rebalancing", self.create_rebalancing_tab),
+            ("⚙️ Settings", self.create_settings_tab),
+        ]
+        self._tab_builders = {}
+        for text, builder in tab_specs:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (frame, builder)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Build the initially selected tab right away
+        self._on_tab_changed(None)
+
         # Create status bar
         self.create_status_bar()
+
+    def _on_tab_changed(self, event):
+        """Build the selected tab's contents on first visit."""
+        key = self.notebook.select()
+        entry = self._tab_builders.get(key)
+        if entry is not None:
+            frame, builder = entry
+            builder(frame)
+            # Retire the builder only after it ran cleanly, so a build
+            # that raised can be retried on the next visit
+            del self._tab_builders[key]
     
     def create_slider_with_entry(self, parent, label_text, variable, min_val, max_val, side):
         """Create an enhanced slider with keyboard input capability using pack layout."""
@@ -270,17 +446,33 @@ class PortfolioGUI:
         entry = ttk.Entry(control_frame, textvariable=variable, width=8)
         entry.pack(side=tk.LEFT)
         
-        # Function to validate and round values for whole number sliders
-        def validate_value(*args):
+        # Function to validate and round values for whole number sliders,
+        # coalesced through after_idle like the module-level helper so a
+        # drag validates once per idle cycle rather than per mouse event
+        _updating = [False]
+        _scheduled = [False]
+
+        def _do_validate():
+            _scheduled[0] = False
             try:
                 value = variable.get()
-                # Round to whole number
                 rounded_value = round(value)
-                if rounded_value != value:
+                if abs(value - rounded_value) < 1e-9:
+                    return
+                _updating[0] = True
+                try:
                     variable.set(rounded_value)
+                finally:
+                    _updating[0] = False
             except (tk.TclError, ValueError):
                 pass
-        
+
+        def validate_value(*args):
+            if _updating[0] or _scheduled[0]:
+                return
+            _scheduled[0] = True
+            parent.after_idle(_do_validate)
+
         # Bind validation to variable changes
         variable.trace_add('write', validate_value)
         
@@ -339,46 +531,65 @@ class PortfolioGUI:
         
         # Version info
         version_label = ttk.Label(status_frame, text="Portfolio System v2.0", 
-                                font=("Arial", 9), foreground="gray")
+                                style='Status.TLabel')
         version_label.pack(side=tk.RIGHT, padx=5)
         
         # Check data source status
         self.update_data_source_status()
     
+    # Re-probing Polygon.io more often than this just repeats the same
+    # import/init cost for the same answer
+    POLYGON_PROBE_TTL_SECONDS = 300.0
+
     def update_data_source_status(self):
-        """Update the data source status indicator."""
-        try:
-            import os
-            
-            # Check Polygon.io API key
-            polygon_key = os.getenv('POLYGON_API_KEY')
-            
-            if polygon_key:
-                # Try to import and test Polygon.io
-                try:
+        """Update the data source status indicator.
+
+        The Polygon.io probe (module import plus client init) is slow
+        enough to stall the UI, so it runs on a worker thread and its
+        result is memoized for five minutes. Widget updates are
+        marshalled back onto the Tk thread via root.after.
+        """
+        probed_at, polygon_ok = getattr(self, '_polygon_probe_result', (0.0, None))
+        if polygon_ok is not None and time.time() - probed_at < self.POLYGON_PROBE_TTL_SECONDS:
+            self._apply_data_source_status(polygon_ok)
+            return
+
+        def probe():
+            ok = False
+            try:
+                # Check Polygon.io API key
+                if os.getenv('POLYGON_API_KEY'):
                     from src.data.polygon_options_source import PolygonOptionsDataSource
                     # Quick test - just initialize
-                    polygon_source = PolygonOptionsDataSource()
-                    self.data_source_label.config(text="Data Source: Polygon.io Premium ⭐")
-                    self.api_status_label.config(text="●", foreground="green")
-                    return
-                except Exception as e:
-                    print(f"Polygon.io error: {e}")
-            
-            # 🚀 GO BIG OR GO HOME - Polygon.io only!
-            self.data_source_label.config(text="❌ Data Source: POLYGON.IO REQUIRED")
-            self.api_status_label.config(text="●", foreground="red")
-            
+                    PolygonOptionsDataSource()
+                    ok = True
+            except Exception as e:
+                print(f"Polygon.io error: {e}")
+            self._polygon_probe_result = (time.time(), ok)
+            self.root.after(0, self._apply_data_source_status, ok)
+
+        threading.Thread(target=probe, daemon=True).start()
+
+    def _apply_data_source_status(self, polygon_ok):
+        """Reflect the Polygon.io probe result in the status bar widgets."""
+        try:
+            if polygon_ok:
+                self.data_source_label.config(text="Data Source: Polygon.io Premium ⭐")
+                self.api_status_label.config(text="●", foreground="green")
+            else:
+                # 🚀 GO BIG OR GO HOME - Polygon.io only!
+                self.data_source_label.config(text="❌ Data Source: POLYGON.IO REQUIRED")
+                self.api_status_label.config(text="●", foreground="red")
         except Exception as e:
-            self.data_source_label.config(text="Data Source: Error")
-            self.api_status_label.config(text="●", foreground="red")
             print(f"Status update error: {e}")
     
-    def create_etf_selection_tab(self):
+    def create_etf_selection_tab(self, parent=None):
         """Create ETF selection and universe building tab."""
-        etf_frame = ttk.Frame(self.notebook)
-        self.notebook.add(etf_frame, text="📊 ETF Selection")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="📊 ETF Selection")
+        etf_frame = parent
+
         # Main sections
         left_frame = ttk.Frame(etf_frame)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
@@ -399,7 +610,7 @@ class PortfolioGUI:
         quick_frame = ttk.Frame(etf_selection_frame)
         quick_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(quick_frame, text="Quick Select:", font=("Arial", 8)).pack(side=tk.LEFT)
+        ttk.Label(quick_frame, text="Quick Select:", style='Small.TLabel').pack(side=tk.LEFT)
         
         quick_sets = [
             ("🇺🇸 US Core", "SPY, QQQ, IWM"),
@@ -446,10 +657,10 @@ class PortfolioGUI:
             status_label.pack(side=tk.LEFT, padx=(0, 5))
             
             # Source name and description
-            name_label = ttk.Label(row_frame, text=icon_name, font=("Arial", 9, "bold"))
+            name_label = ttk.Label(row_frame, text=icon_name, style='Bold.TLabel')
             name_label.pack(side=tk.LEFT, padx=(0, 5))
             
-            desc_label = ttk.Label(row_frame, text=description, font=("Arial", 8), foreground="gray")
+            desc_label = ttk.Label(row_frame, text=description, style='SmallGray.TLabel')
             desc_label.pack(side=tk.LEFT)
             
             # Store references for updates
@@ -467,12 +678,10 @@ class PortfolioGUI:
         config_frame.pack(fill=tk.X, pady=10)
         
         # Min weight threshold
-        self.min_weight_var = tk.DoubleVar(value=self.config.get('min_weight', 2.0))
         create_slider_with_entry(config_frame, 1, 10, self.min_weight_var, 
                                "Min Weight Threshold (%):", 0, resolution=1)
         
         # Max holdings per ETF
-        self.max_holdings_var = tk.IntVar(value=self.config.get('max_holdings', 20))
         create_slider_with_entry(config_frame, 5, 50, self.max_holdings_var, 
                                "Max Holdings per ETF:", 1, resolution=1)
         
@@ -504,8 +713,8 @@ class PortfolioGUI:
             "⚠️ Hard-coded (Synthetic)  💾 Cached\n"
             "⚠️ Symbol = Contains synthetic/manual data that may not reflect current allocations"
         )
-        ttk.Label(legend_frame, text=legend_text, font=("Arial", 8), 
-                 foreground="gray", wraplength=400).pack()
+        ttk.Label(legend_frame, text=legend_text, style='SmallGray.TLabel',
+                 wraplength=400).pack()
         
         # Universe summary and portfolio creation
         summary_frame = ttk.Frame(universe_frame)
@@ -515,21 +724,26 @@ class PortfolioGUI:
                                         foreground="gray", font=("Arial", 10, "italic"))
         self.universe_summary.pack(pady=(0, 5))
         
-        # Progress bar for universe building
-        self.universe_progress = ttk.Progressbar(summary_frame, mode='indeterminate')
+        # Text ticker for universe building - one redraw per second instead
+        # of the ~20/s an indeterminate progressbar animation costs
+        self.universe_status = ttk.Label(summary_frame, text="",
+                                        foreground="blue", font=("Arial", 9))
         # Don't pack initially
-        
+        self._progress_stop = threading.Event()
+
         # Portfolio creation button (initially hidden)
         self.create_portfolios_btn = ttk.Button(summary_frame, text="🚀 Create Optimized Portfolios", 
                                                command=self.optimize_selected_portfolio,
                                                style="Accent.TButton")
         # Don't pack initially - will be shown after universe is built
     
-    def create_portfolio_overview_tab(self):
+    def create_portfolio_overview_tab(self, parent=None):
         """Create portfolio overview and allocation display tab."""
-        portfolio_frame = ttk.Frame(self.notebook)
-        self.notebook.add(portfolio_frame, text="💼 Portfolio Overview")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="💼 Portfolio Overview")
+        portfolio_frame = parent
+
         # Top section - Portfolio selector and summary
         top_frame = ttk.Frame(portfolio_frame)
         top_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -556,11 +770,18 @@ class PortfolioGUI:
         chart_frame = ttk.LabelFrame(content_frame, text="Portfolio Allocation", padding=10)
         chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # Create matplotlib figure for portfolio chart
+        # Create matplotlib figure for portfolio chart, rendered with the
+        # pure Agg backend and displayed as a PhotoImage - this bypasses
+        # the slow per-pixel tkagg blit path on every redraw
+        _ensure_plotting()
         self.portfolio_fig = Figure(figsize=(8, 6), dpi=100)
-        self.portfolio_canvas = FigureCanvasTkAgg(self.portfolio_fig, chart_frame)
-        self.portfolio_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
+        self._portfolio_agg = FigureCanvasAgg(self.portfolio_fig)
+        self._portfolio_label = ttk.Label(chart_frame)
+        self._portfolio_label.pack(fill=tk.BOTH, expand=True)
+
+        # Pre-build the pie artists once; updates mutate them in place
+        self._ensure_pie_artists()
+
         # Right side - Portfolio details
         details_frame = ttk.LabelFrame(content_frame, text="Portfolio Details", padding=10)
         details_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
@@ -575,8 +796,8 @@ class PortfolioGUI:
         self.data_quality_label.pack(anchor=tk.W)
         
         self.synthetic_warning_label = ttk.Label(self.data_quality_frame, 
-                                               text="", font=("Arial", 8), 
-                                               foreground="red", wraplength=300)
+                                               text="", style='Warn.TLabel',
+                                               wraplength=300)
         self.synthetic_warning_label.pack(anchor=tk.W, pady=(2, 0))
         
         # Initially hide the data quality frame
@@ -590,7 +811,7 @@ class PortfolioGUI:
         metrics = ["Expected Return", "Volatility", "Sharpe Ratio", "VaR (95%)", "Max Drawdown"]
         for i, metric in enumerate(metrics):
             ttk.Label(metrics_frame, text=f"{metric}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            label = ttk.Label(metrics_frame, text="-", font=("Arial", 10, "bold"))
+            label = ttk.Label(metrics_frame, text="-", style='Metric.TLabel')
             label.grid(row=i, column=1, sticky=tk.E, padx=5, pady=2)
             self.metrics_labels[metric] = label
         
@@ -608,12 +829,19 @@ class PortfolioGUI:
         
         self.holdings_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         holdings_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    def create_custom_allocation_tab(self):
+
+        # Portfolios may already exist if analysis ran before this tab
+        # was first opened - populate the selector now
+        if self.current_portfolios:
+            self.update_portfolio_selector()
+
+    def create_custom_allocation_tab(self, parent=None):
         """Create custom portfolio allocation management tab."""
-        alloc_frame = ttk.Frame(self.notebook)
-        self.notebook.add(alloc_frame, text="⚖️ Custom Allocation")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="⚖️ Custom Allocation")
+        alloc_frame = parent
+
         # Top controls
         controls_frame = ttk.LabelFrame(alloc_frame, text="Portfolio Selection & Controls", padding=10)
         controls_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -689,7 +917,7 @@ class PortfolioGUI:
         summary_text_frame.pack(fill=tk.X, pady=(0, 10))
         
         self.total_allocation_label = ttk.Label(summary_text_frame, text="Total Allocation: 0.0%", 
-                                              font=("Arial", 12, "bold"))
+                                              style='Header.TLabel')
         self.total_allocation_label.pack(anchor=tk.W)
         
         self.allocation_status_label = ttk.Label(summary_text_frame, text="Status: Ready", 
@@ -698,9 +926,8 @@ class PortfolioGUI:
         
         # Mini allocation chart
         try:
-            from matplotlib.figure import Figure
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            
+            _ensure_plotting()
+
             self.alloc_fig = Figure(figsize=(4, 4), dpi=80, facecolor='white')
             self.alloc_canvas_widget = FigureCanvasTkAgg(self.alloc_fig, summary_frame)
             self.alloc_canvas_widget.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -712,11 +939,13 @@ class PortfolioGUI:
         self.allocation_vars = {}     # symbol -> tkinter variable
         self.allocation_widgets = {}  # symbol -> widget references
     
-    def create_simulation_tab(self):
+    def create_simulation_tab(self, parent=None):
         """Create Monte Carlo simulation tab."""
-        sim_frame = ttk.Frame(self.notebook)
-        self.notebook.add(sim_frame, text="🎲 Simulation")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="🎲 Simulation")
+        sim_frame = parent
+
         # Control panel
         control_frame = ttk.LabelFrame(sim_frame, text="Simulation Parameters", padding=10)
         control_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -738,18 +967,15 @@ class PortfolioGUI:
         params_frame.pack(fill=tk.X)
         
         # Number of simulations
-        self.num_sims_var = tk.IntVar(value=self.config.get('num_simulations', 1000))
         create_slider_with_entry(params_frame, 100, 10000, self.num_sims_var, 
                                "Simulations:", 0, resolution=1, width=200)
         
         # Time horizon (days)
-        self.time_horizon_var = tk.IntVar(value=self.config.get('time_horizon', 252))
         create_slider_with_entry(params_frame, 30, 1260, self.time_horizon_var, 
                                "Time Horizon (days):", 1, resolution=1, width=200)
         
         # Initial investment
         ttk.Label(params_frame, text="Initial Investment ($):").grid(row=2, column=0, sticky=tk.W, padx=5)
-        self.initial_investment_var = tk.DoubleVar(value=self.config.get('initial_investment', 100000))
         ttk.Entry(params_frame, textvariable=self.initial_investment_var, width=15).grid(row=2, column=1, padx=5, sticky=tk.W)
         
         # Action buttons
@@ -769,6 +995,7 @@ class PortfolioGUI:
         chart_frame = ttk.LabelFrame(results_frame, text="Simulation Results", padding=10)
         chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
+        _ensure_plotting()
         self.simulation_fig = Figure(figsize=(10, 6), dpi=100)
         self.simulation_canvas = FigureCanvasTkAgg(self.simulation_fig, chart_frame)
         self.simulation_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -783,15 +1010,17 @@ class PortfolioGUI:
         
         for i, stat in enumerate(stats):
             ttk.Label(stats_frame, text=f"{stat}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            label = ttk.Label(stats_frame, text="-", font=("Arial", 9, "bold"))
+            label = ttk.Label(stats_frame, text="-", style='Bold.TLabel')
             label.grid(row=i, column=1, sticky=tk.E, padx=5, pady=2)
             self.sim_stats_labels[stat] = label
     
-    def create_metrics_tab(self):
+    def create_metrics_tab(self, parent=None):
         """Create performance metrics and tracking tab."""
-        metrics_tab = ttk.Frame(self.notebook)
-        self.notebook.add(metrics_tab, text="📈 Metrics")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="📈 Metrics")
+        metrics_tab = parent
+
         # Create scrollable frame for metrics content
         scrollable_metrics = ScrollableFrame(metrics_tab)
         scrollable_metrics.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -804,7 +1033,6 @@ class PortfolioGUI:
         period_frame.pack(fill=tk.X, padx=10, pady=5)
         
         ttk.Label(period_frame, text="Data Period:").pack(side=tk.LEFT)
-        self.data_period_var = tk.StringVar(value=self.config.get('data_period', '1y'))
         period_combo = ttk.Combobox(period_frame, textvariable=self.data_period_var, 
                                   values=['3mo', '6mo', '1y', '2y', '5y', 'max'], 
                                   state="readonly", width=10)
@@ -823,6 +1051,7 @@ class PortfolioGUI:
         perf_frame = ttk.LabelFrame(metrics_content, text="Performance Over Time", padding=10)
         perf_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
         
+        _ensure_plotting()
         self.metrics_fig = Figure(figsize=(12, 8), dpi=100)
         self.metrics_canvas = FigureCanvasTkAgg(self.metrics_fig, perf_frame)
         self.metrics_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -848,11 +1077,13 @@ class PortfolioGUI:
         self.comparison_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         comparison_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
-    def create_rebalancing_tab(self):
+    def create_rebalancing_tab(self, parent=None):
         """Create portfolio rebalancing tab."""
-        rebal_tab = ttk.Frame(self.notebook)
-        self.notebook.add(rebal_tab, text="⚖️ Rebalancing")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="⚖️ Rebalancing")
+        rebal_tab = parent
+
         # Create scrollable frame for rebalancing content
         scrollable_rebal = ScrollableFrame(rebal_tab)
         scrollable_rebal.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -878,7 +1109,6 @@ class PortfolioGUI:
         threshold_frame = ttk.Frame(settings_frame)
         threshold_frame.pack(fill=tk.X, pady=5)
         
-        self.rebal_threshold_var = tk.DoubleVar(value=self.config.get('rebalance_threshold', 5.0))
         self.create_slider_with_entry(threshold_frame, "Rebalancing Threshold (%):", 
                                      self.rebal_threshold_var, 1, 20, tk.LEFT)
         
@@ -886,7 +1116,6 @@ class PortfolioGUI:
         auto_frame = ttk.Frame(settings_frame)
         auto_frame.pack(fill=tk.X, pady=5)
         
-        self.auto_rebalance_var = tk.BooleanVar(value=self.config.get('auto_rebalance', False))
         ttk.Checkbutton(auto_frame, text="Enable Automatic Rebalancing", 
                        variable=self.auto_rebalance_var).pack(side=tk.LEFT)
         
@@ -911,6 +1140,7 @@ class PortfolioGUI:
         drift_frame = ttk.LabelFrame(results_frame, text="Portfolio Drift Analysis", padding=10)
         drift_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
+        _ensure_plotting()
         self.drift_fig = Figure(figsize=(8, 6), dpi=100)
         self.drift_canvas = FigureCanvasTkAgg(self.drift_fig, drift_frame)
         self.drift_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -933,11 +1163,13 @@ class PortfolioGUI:
         self.rebal_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         rebal_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
-    def create_settings_tab(self):
+    def create_settings_tab(self, parent=None):
         """Create application settings tab."""
-        settings_tab = ttk.Frame(self.notebook)
-        self.notebook.add(settings_tab, text="⚙️ Settings")
-        
+        if parent is None:
+            parent = ttk.Frame(self.notebook)
+            self.notebook.add(parent, text="⚙️ Settings")
+        settings_tab = parent
+
         # Create scrollable frame for settings content
         scrollable_settings = ScrollableFrame(settings_tab)
         scrollable_settings.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -958,7 +1190,6 @@ class PortfolioGUI:
         
         # Risk-free rate
         ttk.Label(general_frame, text="Risk-Free Rate (%):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.risk_free_rate_var = tk.DoubleVar(value=self.config.get('risk_free_rate', 5.0))
         ttk.Entry(general_frame, textvariable=self.risk_free_rate_var, width=10).grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
         
         # File management settings
@@ -966,24 +1197,20 @@ class PortfolioGUI:
         file_frame.pack(fill=tk.X, padx=10, pady=5)
         
         # Auto-save settings
-        self.auto_save_var = tk.BooleanVar(value=self.config.get('auto_save', True))
         ttk.Checkbutton(file_frame, text="Auto-save portfolio configurations", 
                        variable=self.auto_save_var).pack(anchor=tk.W, pady=2)
         
-        self.auto_export_var = tk.BooleanVar(value=self.config.get('auto_export', True))
         ttk.Checkbutton(file_frame, text="Auto-export analysis results", 
                        variable=self.auto_export_var).pack(anchor=tk.W, pady=2)
         
         # Data handling preference
-        self.global_auto_remove_var = tk.BooleanVar(value=self.config.get('auto_remove_insufficient_data', True))
         ttk.Checkbutton(file_frame, text="🗑️ Auto-remove stocks with insufficient data (global setting)", 
                        variable=self.global_auto_remove_var).pack(anchor=tk.W, pady=2)
         
         # Caching preferences
         ttk.Separator(file_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
-        ttk.Label(file_frame, text="Data Caching:", font=("Arial", 9, "bold")).pack(anchor=tk.W)
+        ttk.Label(file_frame, text="Data Caching:", style='Bold.TLabel').pack(anchor=tk.W)
         
-        self.enable_data_cache_var = tk.BooleanVar(value=self.config.get('enable_cache', True))
         ttk.Checkbutton(file_frame, text="💾 Enable data caching (recommended for performance)", 
                        variable=self.enable_data_cache_var).pack(anchor=tk.W, pady=2)
         
@@ -1014,12 +1241,10 @@ class PortfolioGUI:
         perf_frame.pack(fill=tk.X, padx=10, pady=5)
         
         # Number of CPU cores for parallel processing
-        self.cpu_cores_var = tk.IntVar(value=self.config.get('cpu_cores', 4))
         create_slider_with_entry(perf_frame, 1, 16, self.cpu_cores_var, 
                                "CPU Cores for Processing:", 0, resolution=1)
         
         # Cache settings
-        self.enable_cache_var = tk.BooleanVar(value=self.config.get('enable_cache', True))
         ttk.Checkbutton(perf_frame, text="Enable data caching", 
                        variable=self.enable_cache_var).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
@@ -1034,18 +1259,45 @@ class PortfolioGUI:
         
         self.status_label = ttk.Label(self.status_bar, text="Ready", relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
+
         self.progress_bar = ttk.Progressbar(self.status_bar, mode='indeterminate')
         self.progress_bar.pack(side=tk.RIGHT, padx=5)
-    
+
+        self.cache_stats_label = ttk.Label(self.status_bar, text=_price_cache.stats_line(),
+                                           relief=tk.SUNKEN, anchor=tk.E)
+        self.cache_stats_label.pack(side=tk.RIGHT, padx=5)
+
+    def update_cache_stats(self):
+        """Refresh the price-cache hit/miss line in the status bar."""
+        try:
+            self.cache_stats_label.config(text=_price_cache.stats_line())
+        except Exception:
+            pass
+
     def update_status(self, message: str, show_progress: bool = False):
-        """Update status bar message."""
-        self.status_label.config(text=message)
-        if show_progress:
-            self.progress_bar.start()
-        else:
-            self.progress_bar.stop()
-        self.root.update_idletasks()
+        """Update status bar message.
+
+        Writes are coalesced: rapid-fire calls during batched operations
+        just overwrite the pending text, and a single flush scheduled at
+        ~30 fps applies the latest state - one label write per frame
+        instead of a forced redraw per call.
+        """
+        self._pending_status_text = message
+        self._pending_progress = show_progress
+        if not self._status_dirty:
+            self._status_dirty = True
+            self.root.after(33, self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent pending status-bar state."""
+        self._status_dirty = False
+        self.status_label.config(text=self._pending_status_text)
+        if self._pending_progress != self._progress_running:
+            self._progress_running = self._pending_progress
+            if self._pending_progress:
+                self.progress_bar.start()
+            else:
+                self.progress_bar.stop()
     
     def get_data_source_indicator(self, data_source: str) -> str:
         """Get visual indicator for data source type."""
@@ -1203,65 +1455,75 @@ class PortfolioGUI:
         except Exception as e:
             print(f"Error updating portfolio data quality warning: {e}")
     
-    def load_config(self) -> Dict:
+    def load_config(self) -> PortfolioConfig:
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                # Ignore keys from older config versions; missing keys
+                # fall back to the dataclass defaults
+                known = {f.name for f in fields(PortfolioConfig)}
+                return PortfolioConfig(**{k: v for k, v in data.items() if k in known})
         except Exception as e:
             print(f"Warning: Could not load config: {e}")
-        
+
         # Default configuration
-        return {
-            'selected_etfs': ['SPY', 'QQQ', 'XLF', 'XLK'],
-            'min_weight': 2.0,
-            'max_holdings': 20,
-            'rebalance_frequency': 'Monthly',
-            'rebalance_threshold': 5.0,
-            'auto_rebalance': False,
-            'num_simulations': 1000,
-            'time_horizon': 252,
-            'initial_investment': 100000,
-            'data_period': '1y',
-            'risk_free_rate': 5.0,
-            'auto_save': True,
-            'auto_export': True,
-            'cpu_cores': 4,
-            'enable_cache': True,
-            'auto_remove_insufficient_data': True,
-            'enable_web_scraping': True,  # Enable web scraping with user XPath selectors
-            'web_scraper_headless': True  # Run web scraper in headless mode for performance
-        }
+        return PortfolioConfig()
     
     def save_config(self):
         """Save current configuration to file."""
         try:
+            def var_get(name, key):
+                # Tabs are built lazily, so a variable may not exist yet;
+                # keep the previously saved value in that case
+                var = getattr(self, name, None)
+                return var.get() if var is not None else getattr(self.config, key)
+
             config = {
                 'selected_etfs': self.selected_etfs.get().split(', ') if self.selected_etfs.get() else [],
-                'min_weight': self.min_weight_var.get(),
-                'max_holdings': self.max_holdings_var.get(),
+                'min_weight': var_get('min_weight_var', 'min_weight'),
+                'max_holdings': var_get('max_holdings_var', 'max_holdings'),
                 'rebalance_frequency': self.rebalance_frequency.get(),
-                'rebalance_threshold': self.rebal_threshold_var.get(),
-                'auto_rebalance': self.auto_rebalance_var.get(),
-                'num_simulations': self.num_sims_var.get(),
-                'time_horizon': self.time_horizon_var.get(),
-                'initial_investment': self.initial_investment_var.get(),
-                'data_period': self.data_period_var.get(),
-                'risk_free_rate': self.risk_free_rate_var.get(),
-                'auto_save': self.auto_save_var.get(),
-                'auto_export': self.auto_export_var.get(),
-                'cpu_cores': self.cpu_cores_var.get(),
-                'enable_cache': self.enable_cache_var.get(),
+                'rebalance_threshold': var_get('rebal_threshold_var', 'rebalance_threshold'),
+                'auto_rebalance': var_get('auto_rebalance_var', 'auto_rebalance'),
+                'num_simulations': var_get('num_sims_var', 'num_simulations'),
+                'time_horizon': var_get('time_horizon_var', 'time_horizon'),
+                'initial_investment': var_get('initial_investment_var', 'initial_investment'),
+                'data_period': var_get('data_period_var', 'data_period'),
+                'risk_free_rate': var_get('risk_free_rate_var', 'risk_free_rate'),
+                'auto_save': var_get('auto_save_var', 'auto_save'),
+                'auto_export': var_get('auto_export_var', 'auto_export'),
+                'cpu_cores': var_get('cpu_cores_var', 'cpu_cores'),
+                'enable_cache': var_get('enable_cache_var', 'enable_cache'),
                 'auto_remove_insufficient_data': getattr(self, 'global_auto_remove_var', tk.BooleanVar(value=True)).get()
             }
             
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-                
+            for key, value in config.items():
+                setattr(self.config, key, value)
+
+            # Atomic write: a crash mid-dump can't corrupt the config file
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(asdict(self.config), f, indent=2)
+            os.replace(tmp_file, self.config_file)
+            self._config_dirty = False
+
         except Exception as e:
             messagebox.showerror("Error", f"Could not save configuration: {e}")
-    
+
+    def _set_config(self, key, value):
+        """Update a config entry, marking it for the next periodic flush."""
+        if getattr(self.config, key) != value:
+            setattr(self.config, key, value)
+            self._config_dirty = True
+
+    def _maybe_flush_config(self):
+        """Write the config to disk if it changed, then reschedule."""
+        if self._config_dirty:
+            self.save_config()
+        self.root.after(5000, self._maybe_flush_config)
+
     # ETF Selection Methods
     def browse_etfs(self):
         """Open ETF browser dialog."""
@@ -1276,7 +1538,7 @@ class PortfolioGUI:
         frame = ttk.Frame(etf_window)
         frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        ttk.Label(frame, text="Available ETFs:", font=("Arial", 12, "bold")).pack(anchor=tk.W, pady=(0, 5))
+        ttk.Label(frame, text="Available ETFs:", style='Header.TLabel').pack(anchor=tk.W, pady=(0, 5))
         
         # ETF tree with details
         etf_tree = ttk.Treeview(frame, columns=("Name", "Category", "Holdings"), show="tree headings")
@@ -1322,8 +1584,7 @@ class PortfolioGUI:
             return
         
         # Show progress
-        self.universe_progress.pack(fill=tk.X, pady=5)
-        self.universe_progress.start()
+        self._start_universe_ticker()
         self.universe_summary.config(text="Building universe from ETFs...", foreground="blue")
         
         self.update_status("Building universe from ETFs...", True)
@@ -1334,14 +1595,29 @@ class PortfolioGUI:
                 
                 # Track data sources used
                 sources_used = {}
-                
-                # Get holdings for each ETF and track sources
-                for etf in etf_list:
-                    etf_info = self.etf_manager.get_etf_holdings(etf)
-                    if etf_info:
-                        source = getattr(etf_info, 'data_source', 'Unknown')
-                        sources_used[source] = sources_used.get(source, 0) + 1
-                
+
+                # Fetch holdings for each ETF concurrently - the fetches are
+                # network-bound so overlapping them cuts wall time, and the
+                # results warm the manager's cache for the universe build below
+                completed = 0
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = {executor.submit(self.etf_manager.get_etf_holdings, etf): etf
+                               for etf in etf_list}
+                    for future in as_completed(futures):
+                        etf = futures[future]
+                        completed += 1
+                        try:
+                            etf_info = future.result()
+                        except Exception as fetch_error:
+                            print(f"Error fetching {etf} holdings: {fetch_error}")
+                            etf_info = None
+                        if etf_info:
+                            source = getattr(etf_info, 'data_source', 'Unknown')
+                            sources_used[source] = sources_used.get(source, 0) + 1
+                        self.root.after(
+                            0, self.update_status,
+                            f"Fetched holdings for {completed}/{len(etf_list)} ETFs...", True)
+
                 # Build universe
                 universe_stocks = self.etf_manager.build_universe_from_etfs(
                     etf_list,
@@ -1352,6 +1628,9 @@ class PortfolioGUI:
                 if universe_stocks:
                     # Add to universe manager
                     self.universe_manager.add_universe_stocks(universe_stocks)
+
+                    # A new universe invalidates the rolling covariance cache
+                    self._rolling_cov.clear()
                     
                     # Update GUI in main thread
                     self.root.after(0, self.update_universe_display, universe_stocks)
@@ -1368,22 +1647,56 @@ class PortfolioGUI:
         
         threading.Thread(target=build_in_background, daemon=True).start()
 
+    def _start_universe_ticker(self):
+        """Show the universe status ticker, updated once per second."""
+        self._progress_stop.clear()
+        self._ticker_started = time.time()
+        self.universe_status.pack(fill=tk.X, pady=5)
+        self._tick()
+
+    def _tick(self):
+        """Advance the elapsed-time ticker until stopped."""
+        if self._progress_stop.is_set():
+            return
+        elapsed = int(time.time() - self._ticker_started)
+        self.universe_status.config(text=f"Working… {elapsed}s")
+        self.root.after(1000, self._tick)
+
+    def _stop_universe_ticker(self):
+        """Hide the universe status ticker."""
+        self._progress_stop.set()
+        self.universe_status.pack_forget()
+
     def universe_build_failed(self):
         """Handle universe build failure."""
-        self.universe_progress.stop()
-        self.universe_progress.pack_forget()
+        self._stop_universe_ticker()
         self.universe_summary.config(text="❌ Failed to build universe", foreground="red")
     
+    @staticmethod
+    def _bulk_insert(tree, rows):
+        """Insert many (text, values) rows with rendering suppressed.
+
+        Hiding the tree and headings during the inserts avoids a layout
+        pass per row - one redraw at the end instead of N.
+        """
+        tree.configure(show='')
+        try:
+            for text, values in rows:
+                tree.insert('', tk.END, text=text, values=values)
+        finally:
+            tree.configure(show='tree headings')
+
     def update_universe_display(self, universe_stocks: List[str]):
         """Update the universe display with new stocks."""
         # Clear existing items
         for item in self.universe_tree.get_children():
             self.universe_tree.delete(item)
-        
+
         # Get detailed info for each stock
         try:
             etf_list = [etf.strip() for etf in self.selected_etfs.get().split(',')]
-            
+
+            rows = []
             for stock in universe_stocks:
                 # Find which ETFs contain this stock and track data sources
                 sources = []
@@ -1409,21 +1722,18 @@ class PortfolioGUI:
                 
                 avg_weight = total_weight / count if count > 0 else 0
                 
-                # Add color coding based on data sources
+                # Add warning icon to rows with synthetic data
                 has_synthetic = any('⚠️' in source for source in sources)
-                
-                item = self.universe_tree.insert("", tk.END, text=stock,
-                                        values=(", ".join(sources), f"{avg_weight:.1f}%", str(count)))
-                
-                # Color code rows with synthetic data
-                if has_synthetic:
-                    self.universe_tree.set(item, "#0", f"⚠️ {stock}")  # Add warning icon
-            
+                text = f"⚠️ {stock}" if has_synthetic else stock
+
+                rows.append((text, (", ".join(sources), f"{avg_weight:.1f}%", str(count))))
+
+            self._bulk_insert(self.universe_tree, rows)
+
             # Update summary
-            self.universe_progress.stop()
-            self.universe_progress.pack_forget()
+            self._stop_universe_ticker()
             self.universe_summary.config(text=f"✅ Universe built: {len(universe_stocks)} stocks from {len(etf_list)} ETFs",
-                                       foreground="green", font=("Arial", 10, "bold"))
+                                       foreground="green", style='Metric.TLabel')
             
             # Show portfolio creation button
             self.create_portfolios_btn.pack(pady=5)
@@ -1444,7 +1754,7 @@ class PortfolioGUI:
         
         # Create analysis content
         # This would include detailed ETF overlap analysis, correlation matrices, etc.
-        ttk.Label(analysis_window, text="ETF Analysis", font=("Arial", 16, "bold")).pack(pady=10)
+        ttk.Label(analysis_window, text="ETF Analysis", style='Title.TLabel').pack(pady=10)
         ttk.Label(analysis_window, text="Detailed ETF analysis would be implemented here").pack(pady=20)
     
     # Portfolio Methods (continued in next part due to length)
@@ -1482,16 +1792,21 @@ class PortfolioGUI:
     def update_portfolio_selector(self):
         """Update portfolio selector dropdown."""
         portfolio_names = list(self.current_portfolios.keys())
-        self.portfolio_selector['values'] = portfolio_names
-        
+
+        # The overview tab may not have been built yet (tabs are lazy);
+        # its builder repopulates the selector when it first runs
+        if hasattr(self, 'portfolio_selector'):
+            self.portfolio_selector['values'] = portfolio_names
+
         # Also update custom allocation selector
         if hasattr(self, 'alloc_portfolio_selector'):
             self.alloc_portfolio_selector['values'] = portfolio_names
-        
+
         if portfolio_names:
-            self.portfolio_selector.set(portfolio_names[0])
-            self.on_portfolio_selected()
-            
+            if hasattr(self, 'portfolio_selector'):
+                self.portfolio_selector.set(portfolio_names[0])
+                self.on_portfolio_selected()
+
             # Set first portfolio in allocation selector too
             if hasattr(self, 'alloc_portfolio_selector') and not self.alloc_portfolio_selector.get():
                 self.alloc_portfolio_selector.set(portfolio_names[0])
@@ -1529,11 +1844,16 @@ class PortfolioGUI:
             
             stock_weights = list(zip(portfolio.symbols, metrics.weights))
             stock_weights.sort(key=lambda x: x[1], reverse=True)
-            
-            for symbol, weight in stock_weights[:15]:  # Top 15 holdings
-                value = portfolio_value * weight
-                self.holdings_tree.insert("", tk.END, text=symbol,
-                                        values=(f"{weight:.1%}", f"${value:,.0f}"))
+            stock_weights = stock_weights[:15]  # Top 15 holdings
+
+            # Format all weights/values in two vectorized passes
+            weights = np.array([weight for _, weight in stock_weights])
+            pct_strs = format_percentage_array(weights, decimals=1)
+            val_strs = format_currency_array(weights * portfolio_value, decimals=0)
+
+            self._bulk_insert(self.holdings_tree,
+                              [(symbol, (pct_strs[i], val_strs[i]))
+                               for i, (symbol, _) in enumerate(stock_weights)])
         
         # Update data quality warning
         self.update_portfolio_data_quality_warning(portfolio.symbols)
@@ -1541,42 +1861,94 @@ class PortfolioGUI:
         # Update portfolio chart
         self.update_portfolio_chart(portfolio)
     
+    # Top 10 holdings plus one "Others" slice
+    MAX_PIE_SLICES = 11
+
+    def _ensure_pie_artists(self):
+        """(Re)build the reusable pie wedge/text artists if needed.
+
+        Other chart paths still clear the figure, which destroys these
+        artists, so rebuild whenever the axes is gone.
+        """
+        if getattr(self, '_pie_ax', None) is not None and self._pie_ax in self.portfolio_fig.axes:
+            return
+        self._pie_ax = self.portfolio_fig.add_subplot(111)
+        placeholder = np.ones(self.MAX_PIE_SLICES) / self.MAX_PIE_SLICES
+        wedges, texts, autotexts = self._pie_ax.pie(
+            placeholder, labels=[''] * self.MAX_PIE_SLICES, autopct='%1.1f%%', startangle=90)
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(8)
+        for artist in wedges + texts + autotexts:
+            artist.set_visible(False)
+        self._pie_wedges = wedges
+        self._pie_texts = texts
+        self._pie_autotexts = autotexts
+
     def update_portfolio_chart(self, portfolio):
-        """Update the portfolio allocation chart."""
-        self.portfolio_fig.clear()
-        
+        """Update the portfolio allocation chart by mutating pie artists."""
         if not portfolio or not portfolio.metrics or not hasattr(portfolio.metrics, 'weights'):
             return
-        
-        ax = self.portfolio_fig.add_subplot(111)
-        
+
         # Get top holdings for pie chart
         stock_weights = list(zip(portfolio.symbols, portfolio.metrics.weights))
         stock_weights.sort(key=lambda x: x[1], reverse=True)
-        
+
         # Show top 10 holdings, group rest as "Others"
         top_10 = stock_weights[:10]
         others_weight = sum(weight for _, weight in stock_weights[10:])
-        
+
         labels = [symbol for symbol, _ in top_10]
         sizes = [weight for _, weight in top_10]
-        
+
         if others_weight > 0:
             labels.append("Others")
             sizes.append(others_weight)
-        
-        # Create pie chart
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
-        
-        # Improve readability
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(8)
-        
-        ax.set_title(f"{portfolio.name} - Allocation", fontsize=12, fontweight='bold')
-        
-        self.portfolio_canvas.draw()
-    
+
+        # Mutate the pre-built wedges/labels in place instead of clearing
+        # the figure and recreating every artist on each selection change
+        self._ensure_pie_artists()
+        total = sum(sizes)
+        theta = 90.0
+        for i, wedge in enumerate(self._pie_wedges):
+            text = self._pie_texts[i]
+            autotext = self._pie_autotexts[i]
+            if i < len(sizes) and total > 0:
+                frac = sizes[i] / total
+                theta2 = theta + frac * 360.0
+                wedge.set_theta1(theta)
+                wedge.set_theta2(theta2)
+                mid = np.deg2rad((theta + theta2) / 2)
+                text.set_text(labels[i])
+                text.set_position((1.1 * np.cos(mid), 1.1 * np.sin(mid)))
+                text.set_horizontalalignment('left' if np.cos(mid) >= 0 else 'right')
+                autotext.set_text(f"{frac * 100:.1f}%")
+                autotext.set_position((0.6 * np.cos(mid), 0.6 * np.sin(mid)))
+                for artist in (wedge, text, autotext):
+                    artist.set_visible(True)
+                theta = theta2
+            else:
+                for artist in (wedge, text, autotext):
+                    artist.set_visible(False)
+
+        self._pie_ax.set_title(f"{portfolio.name} - Allocation", fontsize=12, fontweight='bold')
+
+        self._render_portfolio_fig()
+
+    def _render_portfolio_fig(self):
+        """Render the portfolio figure with Agg and display it as an image.
+
+        Rasterizes via the pure Agg canvas and hands the RGBA buffer to
+        PIL's C fast-path, bypassing the TkAgg pixel-copy blit.
+        """
+        self._portfolio_agg.draw()
+        width, height = self._portfolio_agg.get_width_height()
+        img = Image.frombuffer('RGBA', (width, height),
+                               self._portfolio_agg.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+        # Keep a reference so Tk doesn't garbage-collect the image
+        self._portfolio_photo = ImageTk.PhotoImage(img)
+        self._portfolio_label.configure(image=self._portfolio_photo)
+
     # Custom Allocation Methods
     def refresh_alloc_portfolios(self):
         """Refresh the custom allocation portfolio selector."""
@@ -1614,10 +1986,10 @@ class PortfolioGUI:
         header_frame = ttk.Frame(self.alloc_scrollable_frame)
         header_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(header_frame, text="Symbol", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=5, sticky=tk.W)
-        ttk.Label(header_frame, text="Original %", font=("Arial", 10, "bold")).grid(row=0, column=1, padx=5)
-        ttk.Label(header_frame, text="Custom Allocation", font=("Arial", 10, "bold")).grid(row=0, column=2, padx=5, columnspan=2)
-        ttk.Label(header_frame, text="Value ($)", font=("Arial", 10, "bold")).grid(row=0, column=4, padx=5)
+        ttk.Label(header_frame, text="Symbol", style='Metric.TLabel').grid(row=0, column=0, padx=5, sticky=tk.W)
+        ttk.Label(header_frame, text="Original %", style='Metric.TLabel').grid(row=0, column=1, padx=5)
+        ttk.Label(header_frame, text="Custom Allocation", style='Metric.TLabel').grid(row=0, column=2, padx=5, columnspan=2)
+        ttk.Label(header_frame, text="Value ($)", style='Metric.TLabel').grid(row=0, column=4, padx=5)
         
         # Create widgets for each symbol
         stock_weights = list(zip(portfolio.symbols, portfolio.metrics.weights))
@@ -1632,7 +2004,7 @@ class PortfolioGUI:
             row_frame.pack(fill=tk.X, pady=2)
             
             # Symbol label
-            symbol_label = ttk.Label(row_frame, text=symbol, font=("Arial", 9, "bold"))
+            symbol_label = ttk.Label(row_frame, text=symbol, style='Bold.TLabel')
             symbol_label.grid(row=0, column=0, padx=5, sticky=tk.W, ipadx=10)
             
             # Original weight display
@@ -1770,7 +2142,9 @@ class PortfolioGUI:
             
             ax.set_title("Custom Allocation", fontsize=10, fontweight='bold')
             
-            self.alloc_canvas_widget.draw()
+            # draw_idle coalesces repeated updates into one rasterization
+            # at the next event-loop iteration
+            self.alloc_canvas_widget.draw_idle()
             
         except Exception as e:
             print(f"Error updating allocation chart: {e}")
@@ -1952,8 +2326,11 @@ class PortfolioGUI:
                 if returns_data is None:
                     print("📊 Universe data not available, fetching fresh data for simulation...")
                     # Use TradingView data fetcher to get fresh data
-                    tv_fetcher = TradingViewDataFetcher()
-                    returns_data = tv_fetcher.get_returns_data(selected_strategy.symbols, days=252)  # 1 year of data
+                    tv_fetcher = TradingViewDataFetcher(cancel_event=self.stop_background)
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        returns_data = _price_cache.load(tv_fetcher, selected_strategy.symbols, days=252)  # 1 year of data
+                    self.root.after(0, self.update_cache_stats)
                 
                 if returns_data is None or len(returns_data) == 0:
                     raise Exception("Unable to fetch returns data for simulation.")
@@ -2073,7 +2450,7 @@ class PortfolioGUI:
                 ax4.text(0.5, 0.5, 'No simulation data', ha='center', va='center', transform=ax4.transAxes)
         
         plt.tight_layout()
-        self.simulation_canvas.draw()
+        self.simulation_canvas.draw_idle()
     
     def update_simulation_stats(self, results, final_values, returns):
         """Update simulation statistics labels."""
@@ -2123,9 +2500,10 @@ class PortfolioGUI:
     
     def on_closing(self):
         """Handle application closing."""
-        if self.auto_save_var.get():
+        auto_save_var = getattr(self, 'auto_save_var', None)
+        if self._config_dirty or (auto_save_var is not None and auto_save_var.get()):
             self.save_config()
-        
+
         # Stop background processes
         self.stop_background.set()
         
@@ -2219,10 +2597,15 @@ Built with Python, Tkinter, and financial analysis libraries.
 
     def optimize_selected_portfolio(self):
         """Create and optimize portfolios from the current universe."""
+        if self.background_thread and self.background_thread.is_alive():
+            messagebox.showinfo("Already Running",
+                              "Portfolio optimization is already running in the background.")
+            return
+
         if not hasattr(self.universe_manager, 'universe') or not self.universe_manager.universe:
             messagebox.showwarning("Warning", "Please build a universe first in the ETF Selection tab")
             return
-        
+
         # Show portfolio creation wizard
         self.show_portfolio_creation_wizard()
 
@@ -2246,7 +2629,7 @@ Built with Python, Tkinter, and financial analysis libraries.
         title_frame.pack(fill=tk.X, padx=20, pady=10)
         
         ttk.Label(title_frame, text="🎯 Portfolio Creation Wizard", 
-                 font=("Arial", 16, "bold")).pack()
+                 style='Title.TLabel').pack()
         ttk.Label(title_frame, text="Create optimized portfolios from your universe", 
                  font=("Arial", 10)).pack(pady=(5, 0))
         
@@ -2320,7 +2703,7 @@ Built with Python, Tkinter, and financial analysis libraries.
         risk_frame = ttk.Frame(settings_frame)
         risk_frame.pack(fill=tk.X, pady=2)
         ttk.Label(risk_frame, text="Risk-free rate (%):").pack(side=tk.LEFT)
-        self.wizard_risk_rate = tk.DoubleVar(value=self.config.get('risk_free_rate', 2.0))
+        self.wizard_risk_rate = tk.DoubleVar(value=self.config.risk_free_rate)
         risk_spinbox = ttk.Spinbox(risk_frame, from_=0, to=10, increment=0.1, 
                                   textvariable=self.wizard_risk_rate, width=10)
         risk_spinbox.pack(side=tk.RIGHT)
@@ -2353,7 +2736,7 @@ Built with Python, Tkinter, and financial analysis libraries.
         data_options_frame.pack(fill=tk.X, padx=20, pady=10)
         
         # Auto-remove stocks with insufficient data
-        self.auto_remove_stocks_var = tk.BooleanVar(value=self.config.get('auto_remove_insufficient_data', True))
+        self.auto_remove_stocks_var = tk.BooleanVar(value=self.config.auto_remove_insufficient_data)
         ttk.Checkbutton(data_options_frame, 
                        text="🗑️ Auto-remove stocks with insufficient data (recommended)", 
                        variable=self.auto_remove_stocks_var).pack(anchor=tk.W, pady=2)
@@ -2389,6 +2772,11 @@ Built with Python, Tkinter, and financial analysis libraries.
 
     def execute_portfolio_creation(self, wizard):
         """Execute portfolio creation from wizard."""
+        if self.background_thread and self.background_thread.is_alive():
+            messagebox.showinfo("Already Running",
+                              "Portfolio optimization is already running in the background.")
+            return
+
         # Get selected options
         selected_types = [key for key, var in self.wizard_options.items() if var.get()]
         
@@ -2422,460 +2810,486 @@ Built with Python, Tkinter, and financial analysis libraries.
         
         self.update_status("Creating portfolios from universe...", True)
         
-        def optimize_in_background():
-            try:
-                print("🚀 Starting portfolio optimization...")
-                print(f"🔍 Universe manager exists: {hasattr(self, 'universe_manager')}")
-                print(f"🔍 Universe attribute exists: {hasattr(self.universe_manager, 'universe') if hasattr(self, 'universe_manager') else False}")
-                
-                # Get universe stocks
-                if hasattr(self.universe_manager, 'universe') and self.universe_manager.universe:
-                    # universe is a list of UniverseStock objects
-                    universe_stocks = [stock.symbol for stock in self.universe_manager.universe]
-                    print(f"📊 Universe has {len(universe_stocks)} stocks: {universe_stocks[:5]}{'...' if len(universe_stocks) > 5 else ''}")
-                else:
-                    universe_stocks = []
-                    print("❌ No universe found or universe is empty")
-                
-                if len(universe_stocks) < 3:
-                    self.root.after(0, lambda: messagebox.showwarning("Warning", 
-                        "Universe too small. Need at least 3 stocks for optimization."))
-                    self.root.after(0, self.wizard_cleanup)
-                    return
-                
-                # Create strategies based on wizard selections
-                strategies = []
-                options_strategies = []
+        self.stop_background.clear()
+        self.background_thread = threading.Thread(target=self._do_optimize, daemon=True)
+        self.background_thread.start()
+
+    def _do_optimize(self):
+        """Run the portfolio-creation pipeline off the Tk thread."""
+        try:
+            print("🚀 Starting portfolio optimization...")
+            print(f"🔍 Universe manager exists: {hasattr(self, 'universe_manager')}")
+            print(f"🔍 Universe attribute exists: {hasattr(self.universe_manager, 'universe') if hasattr(self, 'universe_manager') else False}")
+            
+            # Get universe stocks
+            if hasattr(self.universe_manager, 'universe') and self.universe_manager.universe:
+                # universe is a list of UniverseStock objects
+                universe_stocks = [stock.symbol for stock in self.universe_manager.universe]
+                print(f"📊 Universe has {len(universe_stocks)} stocks: {universe_stocks[:5]}{'...' if len(universe_stocks) > 5 else ''}")
+            else:
+                universe_stocks = []
+                print("❌ No universe found or universe is empty")
+            
+            if len(universe_stocks) < 3:
+                self.root.after(0, lambda: messagebox.showwarning("Warning", 
+                    "Universe too small. Need at least 3 stocks for optimization."))
+                self.root.after(0, self.wizard_cleanup)
+                return
+            
+            # Create strategies based on wizard selections
+            strategies = []
+            options_strategies = []
+            
+            if hasattr(self, 'wizard_options') and self.wizard_options:
+                print(f"🎯 Checking wizard options...")
+                for key, var in self.wizard_options.items():
+                    is_selected = var.get() if var else False
+                    print(f"   {key}: {is_selected}")
+                
+                # Traditional strategies
+                if self.wizard_options.get('conservative') and self.wizard_options['conservative'].get():
+                    strategies.append(("Conservative Portfolio", universe_stocks[:10], "traditional"))
+                    print("   ✅ Adding Conservative Portfolio")
+                if self.wizard_options.get('balanced') and self.wizard_options['balanced'].get():
+                    strategies.append(("Balanced Portfolio", universe_stocks[:15], "traditional"))
+                    print("   ✅ Adding Balanced Portfolio")
+                if self.wizard_options.get('growth') and self.wizard_options['growth'].get():
+                    strategies.append(("Growth Portfolio", universe_stocks[:20], "traditional"))
+                    print("   ✅ Adding Growth Portfolio")
+                if self.wizard_options.get('full') and self.wizard_options['full'].get():
+                    strategies.append(("Full Universe Portfolio", universe_stocks, "traditional"))
+                    print("   ✅ Adding Full Universe Portfolio")
+                
+                # Options-based strategies
+                if self.wizard_options.get('options_growth') and self.wizard_options['options_growth'].get():
+                    options_strategies.append(("Options Growth-Focused", "growth"))
+                    print("   🚀 Adding Options Growth-Focused Portfolio")
+                if self.wizard_options.get('options_defensive') and self.wizard_options['options_defensive'].get():
+                    options_strategies.append(("Options Stability/Defensive", "defensive"))
+                    print("   🛡️ Adding Options Defensive Portfolio")
+                if self.wizard_options.get('options_sharpe') and self.wizard_options['options_sharpe'].get():
+                    options_strategies.append(("Options Sharpe-Optimized", "balanced"))
+                    print("   ⚖️ Adding Options Sharpe-Optimized Portfolio")
+                if self.wizard_options.get('options_income') and self.wizard_options['options_income'].get():
+                    options_strategies.append(("Options High-Income", "income"))
+                    print("   💰 Adding Options High-Income Portfolio")
+                if self.wizard_options.get('options_neutral') and self.wizard_options['options_neutral'].get():
+                    options_strategies.append(("Options Market-Neutral", "balanced"))
+                    print("   🔄 Adding Options Market-Neutral Portfolio")
+                    
+            else:
+                print("🎯 No wizard options found, using defaults")
+                # Default strategies if wizard not used
+                strategies = [
+                    ("Conservative Portfolio", universe_stocks[:10], "traditional"),
+                    ("Balanced Portfolio", universe_stocks[:15], "traditional"),
+                    ("Growth Portfolio", universe_stocks[:20], "traditional")
+                ]
+                options_strategies = [
+                    ("Options Growth-Focused", "growth")
+                ]
+            
+            print(f"📋 Will create {len(strategies)} traditional strategies and {len(options_strategies)} options-based strategies")
+            
+            # Comprehensive options-based strategy analysis
+            options_portfolios = {}
+            if options_strategies:
+                print("� Starting comprehensive options strategy analysis...")
+                self.root.after(0, lambda: self.wizard_status.config(text="Running options strategy analysis..."))
                 
-                if hasattr(self, 'wizard_options') and self.wizard_options:
-                    print(f"🎯 Checking wizard options...")
-                    for key, var in self.wizard_options.items():
-                        is_selected = var.get() if var else False
-                        print(f"   {key}: {is_selected}")
+                try:
+                    from src.strategy.options_strategy_engine import OptionsStrategyEngine, STRATEGY_CONFIGS
+                    options_engine = OptionsStrategyEngine(enable_cache=True)
                     
-                    # Traditional strategies
-                    if self.wizard_options.get('conservative') and self.wizard_options['conservative'].get():
-                        strategies.append(("Conservative Portfolio", universe_stocks[:10], "traditional"))
-                        print("   ✅ Adding Conservative Portfolio")
-                    if self.wizard_options.get('balanced') and self.wizard_options['balanced'].get():
-                        strategies.append(("Balanced Portfolio", universe_stocks[:15], "traditional"))
-                        print("   ✅ Adding Balanced Portfolio")
-                    if self.wizard_options.get('growth') and self.wizard_options['growth'].get():
-                        strategies.append(("Growth Portfolio", universe_stocks[:20], "traditional"))
-                        print("   ✅ Adding Growth Portfolio")
-                    if self.wizard_options.get('full') and self.wizard_options['full'].get():
-                        strategies.append(("Full Universe Portfolio", universe_stocks, "traditional"))
-                        print("   ✅ Adding Full Universe Portfolio")
+                    # Analyze top universe stocks for options factors
+                    analysis_symbols = universe_stocks[:25]  # Analyze top 25 for comprehensive analysis
+                    print(f"� Analyzing {len(analysis_symbols)} stocks for options factors...")
                     
-                    # Options-based strategies
-                    if self.wizard_options.get('options_growth') and self.wizard_options['options_growth'].get():
-                        options_strategies.append(("Options Growth-Focused", "growth"))
-                        print("   🚀 Adding Options Growth-Focused Portfolio")
-                    if self.wizard_options.get('options_defensive') and self.wizard_options['options_defensive'].get():
-                        options_strategies.append(("Options Stability/Defensive", "defensive"))
-                        print("   🛡️ Adding Options Defensive Portfolio")
-                    if self.wizard_options.get('options_sharpe') and self.wizard_options['options_sharpe'].get():
-                        options_strategies.append(("Options Sharpe-Optimized", "balanced"))
-                        print("   ⚖️ Adding Options Sharpe-Optimized Portfolio")
-                    if self.wizard_options.get('options_income') and self.wizard_options['options_income'].get():
-                        options_strategies.append(("Options High-Income", "income"))
-                        print("   💰 Adding Options High-Income Portfolio")
-                    if self.wizard_options.get('options_neutral') and self.wizard_options['options_neutral'].get():
-                        options_strategies.append(("Options Market-Neutral", "balanced"))
-                        print("   🔄 Adding Options Market-Neutral Portfolio")
-                        
-                else:
-                    print("🎯 No wizard options found, using defaults")
-                    # Default strategies if wizard not used
-                    strategies = [
-                        ("Conservative Portfolio", universe_stocks[:10], "traditional"),
-                        ("Balanced Portfolio", universe_stocks[:15], "traditional"),
-                        ("Growth Portfolio", universe_stocks[:20], "traditional")
-                    ]
-                    options_strategies = [
-                        ("Options Growth-Focused", "growth")
-                    ]
-                
-                print(f"📋 Will create {len(strategies)} traditional strategies and {len(options_strategies)} options-based strategies")
-                
-                # Comprehensive options-based strategy analysis
-                options_portfolios = {}
-                if options_strategies:
-                    print("� Starting comprehensive options strategy analysis...")
-                    self.root.after(0, lambda: self.wizard_status.config(text="Running options strategy analysis..."))
+                    # Step 1: Analyze universe to compute options factors
+                    factors_dict = options_engine.analyze_universe(analysis_symbols)
                     
-                    try:
-                        from src.strategy.options_strategy_engine import OptionsStrategyEngine, STRATEGY_CONFIGS
-                        options_engine = OptionsStrategyEngine(enable_cache=True)
-                        
-                        # Analyze top universe stocks for options factors
-                        analysis_symbols = universe_stocks[:25]  # Analyze top 25 for comprehensive analysis
-                        print(f"� Analyzing {len(analysis_symbols)} stocks for options factors...")
-                        
-                        # Step 1: Analyze universe to compute options factors
-                        factors_dict = options_engine.analyze_universe(analysis_symbols)
-                        
-                        if not factors_dict:
-                            print("   ❌ No options factors computed - using fallback")
-                            # Create fallback portfolios
-                            for strategy_name, objective in options_strategies:
-                                fallback_portfolio = {
-                                    'symbols': analysis_symbols[:15],
-                                    'weights': np.full(15, 1.0/15),
-                                    'scores': {s: 5.0 + np.random.random() for s in analysis_symbols[:15]},
-                                    'strategy_type': 'fallback'
-                                }
-                                options_portfolios[strategy_name] = fallback_portfolio
-                        else:
-                            print(f"   ✅ Options factors computed for {len(factors_dict)} stocks")
-                            
-                            # Step 2: Construct portfolios for each strategy
-                            for strategy_name, objective in options_strategies:
-                                print(f"🎯 Constructing {strategy_name} portfolio...")
-                                
-                                try:
-                                    # Map strategy name to config
-                                    if "Growth-Focused" in strategy_name:
-                                        config = STRATEGY_CONFIGS['growth_focused']
-                                    elif "Defensive" in strategy_name or "Stability" in strategy_name:
-                                        config = STRATEGY_CONFIGS['defensive_stability']
-                                    elif "Sharpe-Optimized" in strategy_name:
-                                        config = STRATEGY_CONFIGS['sharpe_optimized']
-                                    elif "High-Income" in strategy_name:
-                                        config = STRATEGY_CONFIGS['high_income']
-                                    elif "Market-Neutral" in strategy_name:
-                                        config = STRATEGY_CONFIGS['market_neutral']
-                                    else:
-                                        config = STRATEGY_CONFIGS['growth_focused']  # Default
-                                    
-                                    # Construct portfolio
-                                    portfolio_data = options_engine.construct_portfolio(
-                                        factors_dict, config, universe_size=15
-                                    )
-                                    
-                                    if portfolio_data:
-                                        options_portfolios[strategy_name] = portfolio_data
-                                        print(f"   ✅ {strategy_name}: {len(portfolio_data['symbols'])} stocks selected")
-                                    else:
-                                        print(f"   ❌ {strategy_name}: Portfolio construction failed")
-                                        # Fallback
-                                        fallback_symbols = list(factors_dict.keys())[:15]
-                                        fallback_portfolio = {
-                                            'symbols': fallback_symbols,
-                                            'weights': np.full(len(fallback_symbols), 1.0/len(fallback_symbols)),
-                                            'scores': {s: factors_dict[s].growth_score for s in fallback_symbols},
-                                            'strategy_type': 'fallback'
-                                        }
-                                        options_portfolios[strategy_name] = fallback_portfolio
-                                        
-                                except Exception as e:
-                                    print(f"   ❌ Portfolio construction failed for {strategy_name}: {e}")
-                                    # Create fallback
-                                    fallback_symbols = list(factors_dict.keys())[:15] if factors_dict else analysis_symbols[:15]
-                                    fallback_portfolio = {
-                                        'symbols': fallback_symbols,
-                                        'weights': np.full(len(fallback_symbols), 1.0/len(fallback_symbols)),
-                                        'scores': {s: 5.0 + np.random.random() for s in fallback_symbols},
-                                        'strategy_type': 'fallback'
-                                    }
-                                    options_portfolios[strategy_name] = fallback_portfolio
-                                    
-                    except Exception as e:
-                        print(f"❌ Failed to initialize options strategy engine: {e}")
+                    if not factors_dict:
+                        print("   ❌ No options factors computed - using fallback")
                         # Create fallback portfolios
                         for strategy_name, objective in options_strategies:
                             fallback_portfolio = {
-                                'symbols': universe_stocks[:15],
+                                'symbols': analysis_symbols[:15],
                                 'weights': np.full(15, 1.0/15),
-                                'scores': {s: 5.0 + np.random.random() for s in universe_stocks[:15]},
+                                'scores': {s: 5.0 + np.random.random() for s in analysis_symbols[:15]},
                                 'strategy_type': 'fallback'
                             }
                             options_portfolios[strategy_name] = fallback_portfolio
-                
-                # Initialize strategies list
-                if not hasattr(self.universe_manager, 'strategies'):
-                    self.universe_manager.strategies = []
-                else:
-                    self.universe_manager.strategies.clear()
-                
-                print(f"📈 Creating {len(strategies)} traditional + {len(options_strategies)} options-based strategies...")
-                
-                # Check if using simple mode
-                simple_mode = self.simple_mode_var.get() if hasattr(self, 'simple_mode_var') else False
-                print(f"⚡ Simple mode: {simple_mode}")
-                
-                # Process traditional strategies
-                all_strategies_to_process = [(name, symbols, "traditional") for name, symbols, _ in strategies]
-                
-                # Process options-based strategies
-                for strategy_name, strategy_type in options_strategies:
-                    if strategy_name in options_portfolios:
-                        # Get stocks from comprehensive options analysis
-                        portfolio_data = options_portfolios[strategy_name]
-                        selected_stocks = portfolio_data['symbols']
-                        all_strategies_to_process.append((strategy_name, selected_stocks, "options", portfolio_data))
                     else:
-                        # Fallback to top universe stocks
-                        all_strategies_to_process.append((strategy_name, universe_stocks[:15], "options", None))
-                
-                for i, item in enumerate(all_strategies_to_process):
-                    if len(item) == 4:
-                        strategy_name, symbols, strategy_category, portfolio_data = item
-                    else:
-                        strategy_name, symbols, strategy_category = item
-                        portfolio_data = None
-                    print(f"🔄 Processing {strategy_name} ({i+1}/{len(all_strategies_to_process)})...")
-                    
-                    if len(symbols) >= 3:  # Minimum required for optimization
-                        try:
-                            # Update status
-                            status_text = f"Creating {strategy_name}..." if simple_mode else f"Optimizing {strategy_name}..."
-                            self.root.after(0, lambda s=status_text: self.wizard_status.config(text=s))
-                            
-                            # Limit to reasonable number of symbols
-                            limited_symbols = symbols[:15]
+                        print(f"   ✅ Options factors computed for {len(factors_dict)} stocks")
+                        
+                        # Step 2: Construct portfolios for each strategy
+                        for strategy_name, objective in options_strategies:
+                            print(f"🎯 Constructing {strategy_name} portfolio...")
                             
-                            # Create strategy description based on category
-                            if strategy_category == "options":
+                            try:
+                                # Map strategy name to config
                                 if "Growth-Focused" in strategy_name:
-                                    description = f"Options-based growth portfolio targeting stocks with high bullish sentiment ({len(limited_symbols)} stocks)"
+                                    config = STRATEGY_CONFIGS['growth_focused']
                                 elif "Defensive" in strategy_name or "Stability" in strategy_name:
-                                    description = f"Options-based defensive portfolio targeting stable, balanced positioning ({len(limited_symbols)} stocks)"  
+                                    config = STRATEGY_CONFIGS['defensive_stability']
                                 elif "Sharpe-Optimized" in strategy_name:
-                                    description = f"Options-based Sharpe portfolio targeting underpriced volatility opportunities ({len(limited_symbols)} stocks)"
+                                    config = STRATEGY_CONFIGS['sharpe_optimized']
                                 elif "High-Income" in strategy_name:
-                                    description = f"Options-based income portfolio targeting high premium opportunities ({len(limited_symbols)} stocks)"
+                                    config = STRATEGY_CONFIGS['high_income']
                                 elif "Market-Neutral" in strategy_name:
-                                    description = f"Options-based market-neutral portfolio using relative sentiment analysis ({len(limited_symbols)} stocks)"
+                                    config = STRATEGY_CONFIGS['market_neutral']
                                 else:
-                                    description = f"Options-based portfolio with {len(limited_symbols)} stocks"
-                            else:
-                                description = f"Traditional optimized portfolio with {len(limited_symbols)} stocks"
-                            
-                            if simple_mode:
-                                # Simple equal-weight portfolio creation
-                                print(f"  ⚡ Creating equal-weight {strategy_name}")
+                                    config = STRATEGY_CONFIGS['growth_focused']  # Default
                                 
-                                from src.data.universe_manager import PortfolioStrategy
-                                equal_weights = np.array([1.0/len(limited_symbols)] * len(limited_symbols))
-                                strategy = PortfolioStrategy(
-                                    name=strategy_name,
-                                    description=description,
-                                    symbols=limited_symbols,
-                                    weights=equal_weights,
-                                    metrics=None
+                                # Construct portfolio
+                                portfolio_data = options_engine.construct_portfolio(
+                                    factors_dict, config, universe_size=15
                                 )
                                 
-                                self.universe_manager.strategies.append(strategy)
-                                print(f"  ✅ Created {strategy_name} (equal-weight)")
-                                continue
-                            
-                            # Full optimization mode
-                            # Get historical data for optimization (use a shorter period for faster processing)
-                            # Use a fixed historical period since we might be in simulation mode
-                            end_date = datetime(2023, 12, 29)  # Use well-established historical end date
-                            start_date = end_date - timedelta(days=180)  # 6 months of data
-                            
-                            print(f"📅 Fetching data from {start_date.date()} to {end_date.date()}")
+                                if portfolio_data:
+                                    options_portfolios[strategy_name] = portfolio_data
+                                    print(f"   ✅ {strategy_name}: {len(portfolio_data['symbols'])} stocks selected")
+                                else:
+                                    print(f"   ❌ {strategy_name}: Portfolio construction failed")
+                                    # Fallback
+                                    fallback_symbols = list(factors_dict.keys())[:15]
+                                    fallback_portfolio = {
+                                        'symbols': fallback_symbols,
+                                        'weights': np.full(len(fallback_symbols), 1.0/len(fallback_symbols)),
+                                        'scores': {s: factors_dict[s].growth_score for s in fallback_symbols},
+                                        'strategy_type': 'fallback'
+                                    }
+                                    options_portfolios[strategy_name] = fallback_portfolio
+                                    
+                            except Exception as e:
+                                print(f"   ❌ Portfolio construction failed for {strategy_name}: {e}")
+                                # Create fallback
+                                fallback_symbols = list(factors_dict.keys())[:15] if factors_dict else analysis_symbols[:15]
+                                fallback_portfolio = {
+                                    'symbols': fallback_symbols,
+                                    'weights': np.full(len(fallback_symbols), 1.0/len(fallback_symbols)),
+                                    'scores': {s: 5.0 + np.random.random() for s in fallback_symbols},
+                                    'strategy_type': 'fallback'
+                                }
+                                options_portfolios[strategy_name] = fallback_portfolio
+                                
+                except Exception as e:
+                    print(f"❌ Failed to initialize options strategy engine: {e}")
+                    # Create fallback portfolios
+                    for strategy_name, objective in options_strategies:
+                        fallback_portfolio = {
+                            'symbols': universe_stocks[:15],
+                            'weights': np.full(15, 1.0/15),
+                            'scores': {s: 5.0 + np.random.random() for s in universe_stocks[:15]},
+                            'strategy_type': 'fallback'
+                        }
+                        options_portfolios[strategy_name] = fallback_portfolio
+            
+            # Initialize strategies list
+            if not hasattr(self.universe_manager, 'strategies'):
+                self.universe_manager.strategies = []
+            else:
+                self.universe_manager.strategies.clear()
+            
+            print(f"📈 Creating {len(strategies)} traditional + {len(options_strategies)} options-based strategies...")
+            
+            # Check if using simple mode
+            simple_mode = self.simple_mode_var.get() if hasattr(self, 'simple_mode_var') else False
+            print(f"⚡ Simple mode: {simple_mode}")
+            
+            # Process traditional strategies
+            all_strategies_to_process = [(name, symbols, "traditional") for name, symbols, _ in strategies]
+            
+            # Process options-based strategies
+            for strategy_name, strategy_type in options_strategies:
+                if strategy_name in options_portfolios:
+                    # Get stocks from comprehensive options analysis
+                    portfolio_data = options_portfolios[strategy_name]
+                    selected_stocks = portfolio_data['symbols']
+                    all_strategies_to_process.append((strategy_name, selected_stocks, "options", portfolio_data))
+                else:
+                    # Fallback to top universe stocks
+                    all_strategies_to_process.append((strategy_name, universe_stocks[:15], "options", None))
+            
+            for i, item in enumerate(all_strategies_to_process):
+                # Cancellation point between strategy optimizations
+                if self.stop_background.is_set():
+                    print("🛑 Portfolio optimization cancelled")
+                    self.root.after(0, self.wizard_cleanup)
+                    return
+
+                if len(item) == 4:
+                    strategy_name, symbols, strategy_category, portfolio_data = item
+                else:
+                    strategy_name, symbols, strategy_category = item
+                    portfolio_data = None
+                print(f"🔄 Processing {strategy_name} ({i+1}/{len(all_strategies_to_process)})...")
+                
+                if len(symbols) >= 3:  # Minimum required for optimization
+                    try:
+                        # Update status
+                        status_text = f"Creating {strategy_name}..." if simple_mode else f"Optimizing {strategy_name}..."
+                        self.root.after(0, lambda s=status_text: self.wizard_status.config(text=s))
+                        
+                        # Limit to reasonable number of symbols
+                        limited_symbols = symbols[:15]
+                        
+                        # Create strategy description based on category
+                        if strategy_category == "options":
+                            if "Growth-Focused" in strategy_name:
+                                description = f"Options-based growth portfolio targeting stocks with high bullish sentiment ({len(limited_symbols)} stocks)"
+                            elif "Defensive" in strategy_name or "Stability" in strategy_name:
+                                description = f"Options-based defensive portfolio targeting stable, balanced positioning ({len(limited_symbols)} stocks)"  
+                            elif "Sharpe-Optimized" in strategy_name:
+                                description = f"Options-based Sharpe portfolio targeting underpriced volatility opportunities ({len(limited_symbols)} stocks)"
+                            elif "High-Income" in strategy_name:
+                                description = f"Options-based income portfolio targeting high premium opportunities ({len(limited_symbols)} stocks)"
+                            elif "Market-Neutral" in strategy_name:
+                                description = f"Options-based market-neutral portfolio using relative sentiment analysis ({len(limited_symbols)} stocks)"
+                            else:
+                                description = f"Options-based portfolio with {len(limited_symbols)} stocks"
+                        else:
+                            description = f"Traditional optimized portfolio with {len(limited_symbols)} stocks"
+                        
+                        if simple_mode:
+                            # Simple equal-weight portfolio creation
+                            print(f"  ⚡ Creating equal-weight {strategy_name}")
                             
-                            # Use TradingView data fetcher instead of yfinance
-                            print(f"  📊 Fetching market data using TradingView...")
+                            from src.data.universe_manager import PortfolioStrategy
+                            equal_weights = np.array([1.0/len(limited_symbols)] * len(limited_symbols))
+                            strategy = PortfolioStrategy(
+                                name=strategy_name,
+                                description=description,
+                                symbols=limited_symbols,
+                                weights=equal_weights,
+                                metrics=None
+                            )
                             
-                            # Calculate days needed
-                            days_needed = (end_date - start_date).days
+                            self.universe_manager.strategies.append(strategy)
+                            print(f"  ✅ Created {strategy_name} (equal-weight)")
+                            continue
+                        
+                        # Full optimization mode
+                        # Get historical data for optimization (use a shorter period for faster processing)
+                        # Use a fixed historical period since we might be in simulation mode
+                        end_date = datetime(2023, 12, 29)  # Use well-established historical end date
+                        start_date = end_date - timedelta(days=180)  # 6 months of data
+                        
+                        print(f"📅 Fetching data from {start_date.date()} to {end_date.date()}")
+                        
+                        # Use TradingView data fetcher instead of yfinance
+                        print(f"  📊 Fetching market data using TradingView...")
+                        
+                        # Calculate days needed
+                        days_needed = (end_date - start_date).days
+                        
+                        # Use TradingView data fetcher
+                        tv_fetcher = TradingViewDataFetcher(cancel_event=self.stop_background)
+                        with warnings.catch_warnings():
+                            warnings.simplefilter('ignore')
+                            returns_df = _price_cache.load(tv_fetcher, limited_symbols, days=days_needed)
+                        self.root.after(0, self.update_cache_stats)
+                        
+                        # Apply stock removal override based on user preference
+                        auto_remove = self.auto_remove_stocks_var.get() if hasattr(self, 'auto_remove_stocks_var') else True
+                        
+                        if auto_remove:
+                            # Filter out symbols with insufficient data
+                            original_count = len(limited_symbols)
+                            working_symbols = list(returns_df.columns) if len(returns_df.columns) > 0 else []
                             
-                            # Use TradingView data fetcher
-                            tv_fetcher = TradingViewDataFetcher()
-                            returns_df = tv_fetcher.get_returns_data(limited_symbols, days=days_needed)
+                            if len(working_symbols) < original_count:
+                                removed_symbols = [s for s in limited_symbols if s not in working_symbols]
+                                print(f"  🗑️ Auto-removed {len(removed_symbols)} stocks with insufficient data: {removed_symbols}")
+                                print(f"  ✅ Continuing with {len(working_symbols)} stocks: {working_symbols}")
                             
-                            # Apply stock removal override based on user preference
-                            auto_remove = self.auto_remove_stocks_var.get() if hasattr(self, 'auto_remove_stocks_var') else True
+                            # Ensure we have minimum required stocks
+                            if len(working_symbols) < 3:
+                                print(f"  ⚠️ After data filtering, only {len(working_symbols)} stocks remain (need ≥3)")
+                                if len(working_symbols) == 0:
+                                    print(f"  ❌ {strategy_name}: No stocks have sufficient data")
+                                    continue
+                                else:
+                                    print(f"  🔄 {strategy_name}: Creating single/dual stock portfolio with available data")
                             
-                            if auto_remove:
-                                # Filter out symbols with insufficient data
-                                original_count = len(limited_symbols)
-                                working_symbols = list(returns_df.columns) if len(returns_df.columns) > 0 else []
-                                
-                                if len(working_symbols) < original_count:
-                                    removed_symbols = [s for s in limited_symbols if s not in working_symbols]
-                                    print(f"  🗑️ Auto-removed {len(removed_symbols)} stocks with insufficient data: {removed_symbols}")
-                                    print(f"  ✅ Continuing with {len(working_symbols)} stocks: {working_symbols}")
-                                
-                                # Ensure we have minimum required stocks
-                                if len(working_symbols) < 3:
-                                    print(f"  ⚠️ After data filtering, only {len(working_symbols)} stocks remain (need ≥3)")
-                                    if len(working_symbols) == 0:
-                                        print(f"  ❌ {strategy_name}: No stocks have sufficient data")
-                                        continue
-                                    else:
-                                        print(f"  🔄 {strategy_name}: Creating single/dual stock portfolio with available data")
-                                
-                            else:
-                                # Original behavior - use all symbols even if some lack data
-                                working_symbols = list(returns_df.columns) if len(returns_df.columns) > 0 else limited_symbols
+                        else:
+                            # Original behavior - use all symbols even if some lack data
+                            working_symbols = list(returns_df.columns) if len(returns_df.columns) > 0 else limited_symbols
+                        
+                        # Check data quality for optimization
+                        min_data_days = 20  # Reduced requirement for more flexibility
+                        if len(returns_df) >= min_data_days and len(working_symbols) >= 1:
+                            print(f"  ✅ Working symbols: {len(working_symbols)}/{len(limited_symbols)}")
+                            print(f"  📊 Returns data: {len(returns_df)} days, {len(returns_df.columns)} stocks")
                             
-                            # Check data quality for optimization
-                            min_data_days = 20  # Reduced requirement for more flexibility
-                            if len(returns_df) >= min_data_days and len(working_symbols) >= 1:
-                                print(f"  ✅ Working symbols: {len(working_symbols)}/{len(limited_symbols)}")
-                                print(f"  📊 Returns data: {len(returns_df)} days, {len(returns_df.columns)} stocks")
-                                
-                                # Proceed with optimization if we have sufficient data
-                                if len(returns_df) >= min_data_days:
-                                    try:
-                                        # Initialize optimizer
-                                        risk_rate = self.wizard_risk_rate.get() / 100 if hasattr(self, 'wizard_risk_rate') else self.config.get('risk_free_rate', 0.02)
-                                        optimizer = PortfolioOptimizer(
-                                            risk_free_rate=risk_rate
-                                        )
+                            # Proceed with optimization if we have sufficient data
+                            if len(returns_df) >= min_data_days:
+                                try:
+                                    # Initialize optimizer
+                                    risk_rate = self.wizard_risk_rate.get() / 100 if hasattr(self, 'wizard_risk_rate') else self.config.risk_free_rate
+                                    optimizer = PortfolioOptimizer(
+                                        risk_free_rate=risk_rate
+                                    )
+                                    
+                                    print(f"  🎯 Optimizing {strategy_name}...")
+                                    
+                                    # Check if we have options strategy data with pre-computed weights
+                                    if strategy_category == "options" and portfolio_data and 'weights' in portfolio_data:
+                                        print(f"  🚀 Using options-based strategy weights for {strategy_name}")
                                         
-                                        print(f"  🎯 Optimizing {strategy_name}...")
+                                        # Use options strategy weights if symbols match
+                                        options_symbols = portfolio_data['symbols']
+                                        options_weights = portfolio_data['weights']
                                         
-                                        # Check if we have options strategy data with pre-computed weights
-                                        if strategy_category == "options" and portfolio_data and 'weights' in portfolio_data:
-                                            print(f"  🚀 Using options-based strategy weights for {strategy_name}")
-                                            
-                                            # Use options strategy weights if symbols match
-                                            options_symbols = portfolio_data['symbols']
-                                            options_weights = portfolio_data['weights']
-                                            
-                                            # Map options weights to working symbols
-                                            if set(options_symbols) == set(working_symbols):
-                                                # Perfect match - use options weights directly
-                                                weights = options_weights
-                                                print(f"  ✅ Perfect symbol match - using options weights")
-                                            else:
-                                                # Partial match - create hybrid weights
-                                                print(f"  🔀 Symbol mismatch - creating hybrid weights")
-                                                weights_dict = dict(zip(options_symbols, options_weights))
-                                                weights = []
-                                                for symbol in working_symbols:
-                                                    if symbol in weights_dict:
-                                                        weights.append(weights_dict[symbol])
-                                                    else:
-                                                        weights.append(1.0 / len(working_symbols))  # Equal weight for missing
-                                                weights = np.array(weights)
-                                                weights = weights / weights.sum()  # Normalize
-                                            
-                                            # Calculate metrics for options-based weights
-                                            exp_return, volatility, sharpe = optimizer.calculate_portfolio_metrics(weights, returns_df)
-                                            from src.portfolio.optimizer import PortfolioMetrics
-                                            metrics = PortfolioMetrics(
-                                                expected_return=exp_return,
-                                                volatility=volatility,
-                                                sharpe_ratio=sharpe,
-                                                weights=weights,
-                                                symbols=working_symbols
-                                            )
-                                            
+                                        # Map options weights to working symbols
+                                        if set(options_symbols) == set(working_symbols):
+                                            # Perfect match - use options weights directly
+                                            weights = options_weights
+                                            print(f"  ✅ Perfect symbol match - using options weights")
                                         else:
-                                            # Traditional optimization
-                                            opt_target = self.wizard_method.get() if hasattr(self, 'wizard_method') else 'sharpe'
-                                            if opt_target == 'max_sharpe':
-                                                opt_target = 'sharpe'
-                                            elif opt_target == 'min_variance':
-                                                opt_target = 'min_volatility'
-                                            
-                                            metrics = optimizer.optimize_portfolio(
-                                                returns_df, optimization_target=opt_target
-                                            )
-                                            weights = metrics.weights
+                                            # Partial match - create hybrid weights
+                                            print(f"  🔀 Symbol mismatch - creating hybrid weights")
+                                            weights_dict = dict(zip(options_symbols, options_weights))
+                                            weights = []
+                                            for symbol in working_symbols:
+                                                if symbol in weights_dict:
+                                                    weights.append(weights_dict[symbol])
+                                                else:
+                                                    weights.append(1.0 / len(working_symbols))  # Equal weight for missing
+                                            weights = np.array(weights)
+                                            weights = weights / weights.sum()  # Normalize
                                         
-                                        print(f"  ✅ Optimization complete for {strategy_name}")
-                                        
-                                        # Create strategy object
-                                        from src.data.universe_manager import PortfolioStrategy
-                                        strategy = PortfolioStrategy(
-                                            name=strategy_name,
-                                            description=description,
-                                            symbols=working_symbols,
+                                        # Calculate metrics for options-based weights
+                                        exp_return, volatility, sharpe = optimizer.calculate_portfolio_metrics(weights, returns_df)
+                                        from src.portfolio.optimizer import PortfolioMetrics
+                                        metrics = PortfolioMetrics(
+                                            expected_return=exp_return,
+                                            volatility=volatility,
+                                            sharpe_ratio=sharpe,
                                             weights=weights,
-                                            metrics=metrics
+                                            symbols=working_symbols
                                         )
                                         
-                                        self.universe_manager.strategies.append(strategy)
-                                        print(f"  🎉 Added {strategy_name} to strategies")
+                                    else:
+                                        # Traditional optimization
+                                        opt_target = self.wizard_method.get() if hasattr(self, 'wizard_method') else 'sharpe'
+                                        if opt_target == 'max_sharpe':
+                                            opt_target = 'sharpe'
+                                        elif opt_target == 'min_variance':
+                                            opt_target = 'min_volatility'
                                         
-                                    except Exception as opt_error:
-                                        print(f"  ❌ Optimization failed for {strategy_name}: {opt_error}")
-                                        # Create equal-weight strategy as fallback
-                                        from src.data.universe_manager import PortfolioStrategy
-                                        equal_weights = np.array([1.0/len(working_symbols)] * len(working_symbols))
-                                        strategy = PortfolioStrategy(
-                                            name=f"{strategy_name} (Equal Weight)",
-                                            description=f"Equal-weight fallback: {description}",
-                                            symbols=working_symbols,
-                                            weights=equal_weights,
-                                            metrics=None
-                                        )
-                                        self.universe_manager.strategies.append(strategy)
-                                        print(f"  🔄 Created equal-weight fallback for {strategy_name}")
-                                else:
-                                    print(f"  ❌ {strategy_name}: Insufficient return data ({len(returns_df)} days, need ≥{min_data_days})")
+                                        # Reuse rolling moments when the data window
+                                        # overlaps the previous run for this strategy
+                                        rolling = self._rolling_cov.get(strategy_name)
+                                        if rolling is None or not rolling.sync(returns_df):
+                                            rolling = RollingCovariance(returns_df)
+                                            self._rolling_cov[strategy_name] = rolling
+
+                                        with warnings.catch_warnings():
+                                            warnings.simplefilter('ignore')
+                                            metrics = optimizer.optimize_portfolio(
+                                                returns_df, optimization_target=opt_target,
+                                                mean_returns=rolling.mean() * 252,
+                                                cov_matrix=rolling.cov() * 252
+                                            )
+                                        weights = metrics.weights
+                                    
+                                    print(f"  ✅ Optimization complete for {strategy_name}")
+                                    
+                                    # Create strategy object
+                                    from src.data.universe_manager import PortfolioStrategy
+                                    strategy = PortfolioStrategy(
+                                        name=strategy_name,
+                                        description=description,
+                                        symbols=working_symbols,
+                                        weights=weights,
+                                        metrics=metrics
+                                    )
+                                    
+                                    self.universe_manager.strategies.append(strategy)
+                                    print(f"  🎉 Added {strategy_name} to strategies")
+                                    
+                                except Exception as opt_error:
+                                    print(f"  ❌ Optimization failed for {strategy_name}: {opt_error}")
+                                    # Create equal-weight strategy as fallback
+                                    from src.data.universe_manager import PortfolioStrategy
+                                    equal_weights = np.array([1.0/len(working_symbols)] * len(working_symbols))
+                                    strategy = PortfolioStrategy(
+                                        name=f"{strategy_name} (Equal Weight)",
+                                        description=f"Equal-weight fallback: {description}",
+                                        symbols=working_symbols,
+                                        weights=equal_weights,
+                                        metrics=None
+                                    )
+                                    self.universe_manager.strategies.append(strategy)
+                                    print(f"  🔄 Created equal-weight fallback for {strategy_name}")
                             else:
-                                if auto_remove:
-                                    print(f"  ⚠️ {strategy_name}: After filtering, insufficient symbols ({len(working_symbols)})")
-                                else:
-                                    print(f"  ❌ {strategy_name}: Too few working symbols ({len(working_symbols)})")
-                                    print(f"  💡 Tip: Enable 'Auto-remove stocks with insufficient data' to continue with available stocks")
-                                
-                        except Exception as e:
-                            print(f"❌ Error processing {strategy_name}: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            continue
-                
-                print(f"🎉 Portfolio creation complete! Created {len(self.universe_manager.strategies)} strategies")
-                
-                # Store universe data for Monte Carlo simulations
-                if self.universe_manager.strategies:
-                    try:
-                        # Get all unique symbols from all strategies
-                        all_symbols = set()
-                        for strategy in self.universe_manager.strategies:
-                            all_symbols.update(strategy.symbols)
-                        all_symbols = list(all_symbols)
-                        
-                        # Fetch and store universe data
-                        print("📊 Storing universe data for Monte Carlo simulations...")
-                        tv_fetcher = TradingViewDataFetcher()
-                        returns_df = tv_fetcher.get_returns_data(all_symbols, days=180)
-                        
-                        if len(returns_df) > 0:
-                            # Store in universe manager
-                            self.universe_manager.universe_data = {
-                                'returns': returns_df,
-                                'symbols': all_symbols
-                            }
-                            print(f"✅ Stored universe data: {len(returns_df)} days, {len(returns_df.columns)} stocks")
+                                print(f"  ❌ {strategy_name}: Insufficient return data ({len(returns_df)} days, need ≥{min_data_days})")
                         else:
-                            print("⚠️  Could not store universe data, Monte Carlo will fetch fresh data")
-                    except Exception as data_error:
-                        print(f"⚠️  Could not store universe data: {data_error}")
-                
-                # Update GUI
-                self.root.after(0, self.refresh_portfolios)
-                
-                if self.universe_manager.strategies:
-                    self.root.after(0, lambda: self.update_status(
-                        f"Created {len(self.universe_manager.strategies)} optimized portfolios", False))
-                    self.root.after(0, self.wizard_success)
-                else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", 
-                        "Could not create any portfolios. Check that universe contains valid stocks with sufficient historical data."))
-                    self.root.after(0, self.wizard_cleanup)
+                            if auto_remove:
+                                print(f"  ⚠️ {strategy_name}: After filtering, insufficient symbols ({len(working_symbols)})")
+                            else:
+                                print(f"  ❌ {strategy_name}: Too few working symbols ({len(working_symbols)})")
+                                print(f"  💡 Tip: Enable 'Auto-remove stocks with insufficient data' to continue with available stocks")
+                            
+                    except Exception as e:
+                        print(f"❌ Error processing {strategy_name}: {e}")
+                        import traceback
+                        traceback.print_exc()
+                        continue
+            
+            print(f"🎉 Portfolio creation complete! Created {len(self.universe_manager.strategies)} strategies")
+            
+            # Store universe data for Monte Carlo simulations
+            if self.universe_manager.strategies:
+                try:
+                    # Get all unique symbols from all strategies
+                    all_symbols = set()
+                    for strategy in self.universe_manager.strategies:
+                        all_symbols.update(strategy.symbols)
+                    all_symbols = list(all_symbols)
                     
-            except Exception as e:
-                print(f"❌ Critical error in portfolio creation: {e}")
-                import traceback
-                traceback.print_exc()
-                self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"Error creating portfolios: {err}"))
+                    # Fetch and store universe data
+                    print("📊 Storing universe data for Monte Carlo simulations...")
+                    tv_fetcher = TradingViewDataFetcher(cancel_event=self.stop_background)
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        returns_df = _price_cache.load(tv_fetcher, all_symbols, days=180)
+                    self.root.after(0, self.update_cache_stats)
+                    
+                    if len(returns_df) > 0:
+                        # Store in universe manager
+                        self.universe_manager.universe_data = {
+                            'returns': returns_df,
+                            'symbols': all_symbols
+                        }
+                        print(f"✅ Stored universe data: {len(returns_df)} days, {len(returns_df.columns)} stocks")
+                    else:
+                        print("⚠️  Could not store universe data, Monte Carlo will fetch fresh data")
+                except Exception as data_error:
+                    print(f"⚠️  Could not store universe data: {data_error}")
+            
+            # Update GUI
+            self.root.after(0, self.refresh_portfolios)
+            
+            if self.universe_manager.strategies:
+                self.root.after(0, lambda: self.update_status(
+                    f"Created {len(self.universe_manager.strategies)} optimized portfolios", False))
+                self.root.after(0, self.wizard_success)
+            else:
+                self.root.after(0, lambda: messagebox.showerror("Error", 
+                    "Could not create any portfolios. Check that universe contains valid stocks with sufficient historical data."))
                 self.root.after(0, self.wizard_cleanup)
-            finally:
-                print("🏁 Portfolio creation thread finished")
-                self.root.after(0, lambda: self.update_status("Ready", False))
-        
-        threading.Thread(target=optimize_in_background, daemon=True).start()
+                
+        except Exception as e:
+            print(f"❌ Critical error in portfolio creation: {e}")
+            import traceback
+            traceback.print_exc()
+            self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"Error creating portfolios: {err}"))
+            self.root.after(0, self.wizard_cleanup)
+        finally:
+            print("🏁 Portfolio creation thread finished")
+            self.root.after(0, lambda: self.update_status("Ready", False))
 
     def wizard_cleanup(self):
         """Clean up wizard after completion or error."""
@@ -2944,7 +3358,7 @@ Built with Python, Tkinter, and financial analysis libraries.
         
         # Title
         ttk.Label(main_frame, text="🚀 Welcome to Portfolio Management!", 
-                 font=("Arial", 16, "bold")).pack(pady=(0, 10))
+                 style='Title.TLabel').pack(pady=(0, 10))
         
         # Instructions
         instructions = """
@@ -2985,8 +3399,7 @@ Built with Python, Tkinter, and financial analysis libraries.
         button_frame.pack(fill=tk.X, pady=10)
         
         def dont_show_again():
-            self.config['quick_start_shown'] = True
-            self.save_config()
+            self._set_config('quick_start_shown', True)
             quick_start.destroy()
         
         ttk.Button(button_frame, text="Don't show again", 
@@ -3070,7 +3483,7 @@ Built with Python, Tkinter, and financial analysis libraries.
                 ax.set_title(f"{strategy.name}\n(Equal Weight)", fontsize=14, fontweight='bold')
             
             self.portfolio_fig.tight_layout()
-            self.portfolio_canvas.draw()
+            self._render_portfolio_fig()
             
             # Update holdings table
             self.update_holdings_table(strategy)
@@ -3085,28 +3498,27 @@ Built with Python, Tkinter, and financial analysis libraries.
             for item in self.holdings_tree.get_children():
                 self.holdings_tree.delete(item)
             
+            # Assume $100k portfolio for value calculation
+            portfolio_value = 100000
+
             if strategy.weights is not None:
                 # Sort by weight descending
                 holdings_data = list(zip(strategy.symbols, strategy.weights))
                 holdings_data.sort(key=lambda x: x[1], reverse=True)
-                
-                # Add top holdings to table
-                for i, (symbol, weight) in enumerate(holdings_data[:20]):  # Show top 20
-                    # Assume $100k portfolio for value calculation
-                    portfolio_value = 100000
-                    position_value = portfolio_value * weight
-                    
-                    self.holdings_tree.insert("", tk.END, text=symbol,
-                                            values=(f"{weight:.2%}", f"${position_value:,.0f}"))
             else:
                 # Equal weight
                 equal_weight = 1.0 / len(strategy.symbols)
-                portfolio_value = 100000
-                position_value = portfolio_value * equal_weight
-                
-                for symbol in strategy.symbols[:20]:  # Show top 20
-                    self.holdings_tree.insert("", tk.END, text=symbol,
-                                            values=(f"{equal_weight:.2%}", f"${position_value:,.0f}"))
+                holdings_data = [(symbol, equal_weight) for symbol in strategy.symbols]
+
+            # Show top 20, formatting weights/values in two vectorized passes
+            holdings_data = holdings_data[:20]
+            weights = np.array([weight for _, weight in holdings_data])
+            pct_strs = format_percentage_array(weights, decimals=2)
+            val_strs = format_currency_array(weights * portfolio_value, decimals=0)
+
+            self._bulk_insert(self.holdings_tree,
+                              [(symbol, (pct_strs[i], val_strs[i]))
+                               for i, (symbol, _) in enumerate(holdings_data)])
                     
         except Exception as e:
             print(f"Error updating holdings table: {e}")
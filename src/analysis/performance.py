@@ -27,55 +27,61 @@ class PerformanceAnalyzer:
         """Initialize the performance analyzer."""
         pass
     
-    def calculate_performance_metrics(self, returns: pd.Series, 
+    def calculate_performance_metrics(self, returns: pd.Series,
                                     risk_free_rate: float = 0.02) -> Dict[str, float]:
         """
         Calculate comprehensive performance metrics.
-        
+
         Args:
-            returns: Return series
+            returns: Return series or 1-D NumPy array
             risk_free_rate: Risk-free rate for calculations
-            
+
         Returns:
             Dictionary of performance metrics
         """
+        # Work on the underlying array - zero-copy for float Series/ndarray
+        # inputs, and every metric below runs in pure NumPy without pandas'
+        # per-operation alignment and type-check overhead
+        returns = np.asarray(returns, dtype=np.float64)
+
         if len(returns) == 0:
             return {}
-            
-        # Basic statistics
-        total_return = (1 + returns).prod() - 1
+
+        # Basic statistics (ddof=1 matches pandas' sample std)
+        total_return = np.prod(1 + returns) - 1
         annualized_return = (1 + returns.mean())**252 - 1
-        annualized_volatility = returns.std() * np.sqrt(252)
-        
+        annualized_volatility = returns.std(ddof=1) * np.sqrt(252)
+
         # Risk-adjusted metrics
         if annualized_volatility > 0:
             sharpe_ratio = (annualized_return - risk_free_rate) / annualized_volatility
         else:
             sharpe_ratio = 0
-        
+
         # Calculate Sortino ratio (downside deviation)
         negative_returns = returns[returns < 0]
         if len(negative_returns) > 0:
-            downside_deviation = negative_returns.std() * np.sqrt(252)
+            downside_deviation = negative_returns.std(ddof=1) * np.sqrt(252)
             sortino_ratio = (annualized_return - risk_free_rate) / downside_deviation if downside_deviation > 0 else np.inf
         else:
             sortino_ratio = np.inf
-        
+
         # Maximum drawdown
-        cumulative_returns = (1 + returns).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
+        cumulative_returns = np.cumprod(1 + returns)
+        rolling_max = np.maximum.accumulate(cumulative_returns)
         drawdowns = (cumulative_returns - rolling_max) / rolling_max
         max_drawdown = drawdowns.min()
-        
+
         # Calmar ratio
         calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else np.inf
-        
+
         # Value at Risk (95% confidence)
         var_95 = np.percentile(returns, 5) if len(returns) > 0 else 0
-        
+
         # Conditional Value at Risk (Expected Shortfall)
-        cvar_95 = returns[returns <= var_95].mean() if len(returns[returns <= var_95]) > 0 else 0
-        
+        tail_returns = returns[returns <= var_95]
+        cvar_95 = tail_returns.mean() if len(tail_returns) > 0 else 0
+
         # Skewness and Kurtosis
         skewness = stats.skew(returns) if len(returns) > 1 else 0
         kurtosis = stats.kurtosis(returns) if len(returns) > 1 else 0
@@ -0,0 +1,68 @@
+"""
+Price Returns Disk Cache
+
+Parquet-backed cache for daily returns DataFrames, keyed by the symbol
+set and lookback window. Cache hits skip the network fetch and parse
+entirely and just read a local parquet file; entries older than a day
+are considered stale and refetched.
+"""
+
+import hashlib
+import os
+import time
+from typing import List, Optional
+
+import pandas as pd
+
+CACHE_DIR = os.path.join('cache', 'prices')
+CACHE_TTL_SECONDS = 86400  # daily returns older than a day are refetched
+
+# Running hit/miss counts for this process, surfaced in the GUI status bar
+stats = {'hits': 0, 'misses': 0}
+
+
+def _cache_path(symbols: List[str], days: int) -> str:
+    """Build the cache file path for a symbol set and lookback window."""
+    key = hashlib.md5(f"{','.join(sorted(symbols))}|{days}".encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"returns_{key}.parquet")
+
+
+def load(fetcher, symbols: List[str], days: int = 180) -> Optional[pd.DataFrame]:
+    """
+    Fetch a returns DataFrame through the disk cache.
+
+    Args:
+        fetcher: TradingViewDataFetcher used on cache misses
+        symbols: Stock symbols to fetch returns for
+        days: Lookback window in days
+
+    Returns:
+        DataFrame of daily returns, or None if the fetch failed
+    """
+    cache_path = _cache_path(symbols, days)
+    try:
+        if (os.path.exists(cache_path)
+                and time.time() - os.path.getmtime(cache_path) < CACHE_TTL_SECONDS):
+            returns_df = pd.read_parquet(cache_path)
+            stats['hits'] += 1
+            print(f"CACHE: Loaded returns for {len(symbols)} symbols from disk")
+            return returns_df
+    except Exception as e:
+        print(f"WARNING: Price cache read failed ({e}), refetching")
+
+    stats['misses'] += 1
+    returns_df = fetcher.get_returns_data(symbols, days=days)
+
+    if returns_df is not None and len(returns_df) > 0:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            returns_df.to_parquet(cache_path, compression='zstd')
+        except Exception as e:
+            print(f"WARNING: Price cache write failed ({e})")
+
+    return returns_df
+
+
+def stats_line() -> str:
+    """One-line hit/miss summary for display in the status bar."""
+    return f"Price cache: {stats['hits']} hits / {stats['misses']} misses"
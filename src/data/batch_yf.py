@@ -0,0 +1,104 @@
+"""
+Batched yfinance Downloads
+
+Yahoo serves many symbols per request, so downloading tickers in chunks
+of 20 through yf.download issues one HTTP round trip per chunk instead
+of one per symbol. Use these helpers anywhere code would otherwise loop
+`yf.Ticker(t).history(...)` over a list of tickers.
+"""
+
+import pandas as pd
+from typing import Dict, List, Optional
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+    print("WARNING: yfinance not available - batch downloads disabled")
+
+# Yahoo caps symbols per request URL; 20 keeps each request under it
+CHUNK_SIZE = 20
+
+
+def download_history(tickers: List[str], start=None, end=None,
+                     period: Optional[str] = None,
+                     interval: str = "1d") -> Dict[str, pd.DataFrame]:
+    """
+    Download OHLCV history for many tickers in chunks of 20.
+
+    Args:
+        tickers: Stock symbols to download
+        start: Start date (used with end; ignored if period is given)
+        end: End date
+        period: Data period (e.g. '1y'); overrides start/end
+        interval: Data interval (e.g. '1d')
+
+    Returns:
+        Dictionary mapping each symbol to its OHLCV DataFrame; symbols
+        that returned no data are omitted
+    """
+    if not YFINANCE_AVAILABLE:
+        return {}
+
+    tickers = list(dict.fromkeys(tickers))  # dedupe, keep order
+    histories = {}
+
+    for i in range(0, len(tickers), CHUNK_SIZE):
+        chunk = tickers[i:i + CHUNK_SIZE]
+        try:
+            data = yf.download(chunk, start=start, end=end, period=period,
+                               interval=interval, group_by='ticker',
+                               threads=True, progress=False)
+        except Exception as e:
+            print(f"Error downloading batch {chunk}: {e}")
+            continue
+
+        if data is None or data.empty:
+            continue
+
+        if isinstance(data.columns, pd.MultiIndex):
+            available = set(data.columns.get_level_values(0))
+            for symbol in chunk:
+                if symbol in available:
+                    hist = data[symbol].dropna(how='all')
+                    if not hist.empty:
+                        histories[symbol] = hist
+        else:
+            # Single-symbol chunks come back with flat columns
+            hist = data.dropna(how='all')
+            if not hist.empty:
+                histories[chunk[0]] = hist
+
+    return histories
+
+
+def download_returns(tickers: List[str], start=None, end=None,
+                     period: Optional[str] = None,
+                     interval: str = "1d") -> pd.DataFrame:
+    """
+    Download daily returns for many tickers with batched requests.
+
+    Args:
+        tickers: Stock symbols to download
+        start: Start date (used with end; ignored if period is given)
+        end: End date
+        period: Data period (e.g. '1y'); overrides start/end
+        interval: Data interval (e.g. '1d')
+
+    Returns:
+        DataFrame of daily returns, one column per symbol (empty if
+        nothing could be downloaded)
+    """
+    histories = download_history(tickers, start=start, end=end,
+                                 period=period, interval=interval)
+    if not histories:
+        return pd.DataFrame()
+
+    closes = {symbol: hist['Close'] for symbol, hist in histories.items()
+              if 'Close' in hist.columns}
+    if not closes:
+        return pd.DataFrame()
+
+    prices = pd.DataFrame(closes)
+    return prices.pct_change().dropna(how='all')
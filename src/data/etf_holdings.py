@@ -9,6 +9,8 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import time
@@ -18,8 +20,27 @@ import os
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional caching dependencies - the manager degrades to a plain dict cache
+# (memory only, no TTL) when they are not installed
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
 
-@dataclass
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# ETF composition changes monthly, not per-second - holdings older than a day
+# are refreshed, everything fresher is served from cache
+HOLDINGS_TTL_SECONDS = 86400
+DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'leaps', 'etf')
+
+
+@dataclass(slots=True)
 class ETFHolding:
     """Individual holding within an ETF."""
     symbol: str
@@ -46,7 +67,29 @@ class ETFHoldingsManager:
     
     def __init__(self):
         """Initialize the ETF holdings manager."""
-        self.etf_cache = {}
+        # In-memory cache with a 24 h TTL when cachetools is installed
+        # (TTLCache is dict-compatible, so lookups below are unchanged)
+        if CACHETOOLS_AVAILABLE:
+            self.etf_cache = TTLCache(maxsize=512, ttl=HOLDINGS_TTL_SECONDS)
+        else:
+            self.etf_cache = {}
+        # Persistent on-disk cache so repeat runs skip the network entirely
+        self.disk_cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self.disk_cache = diskcache.Cache(DISK_CACHE_DIR)
+            except Exception as e:
+                print(f"WARNING: Could not open disk cache at {DISK_CACHE_DIR}: {e}")
+        # Shared pooled session for any direct HTTP fetches - keep-alive
+        # connections avoid a fresh TCP+TLS handshake per ETF request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         self.popular_sector_etfs = {
             # SPDR Sector ETFs
             'XLK': 'Technology Select Sector SPDR Fund',
@@ -185,7 +228,7 @@ class ETFHoldingsManager:
             ETFInfo object or None if failed
         """
         try:
-            etf = yf.Ticker(etf_symbol)
+            etf = yf.Ticker(etf_symbol, session=self._session)
             
             # Get basic info
             info = etf.info
@@ -588,8 +631,8 @@ class ETFHoldingsManager:
             ETFInfo object or None if failed
         """
         etf_symbol = etf_symbol.upper()
-        
-        # Check cache first
+
+        # Check in-memory cache first
         if etf_symbol in self.etf_cache:
             cached_info = self.etf_cache[etf_symbol]
             cached_result = ETFInfo(
@@ -602,7 +645,25 @@ class ETFHoldingsManager:
                 data_source=f"Cache ({getattr(cached_info, 'data_source', 'Unknown')})"
             )
             return cached_result
-        
+
+        # Then the persistent disk cache (survives across runs)
+        if self.disk_cache is not None:
+            try:
+                cached_info = self.disk_cache.get(etf_symbol)
+            except Exception:
+                cached_info = None
+            if cached_info is not None:
+                self.etf_cache[etf_symbol] = cached_info
+                return ETFInfo(
+                    symbol=cached_info.symbol,
+                    name=cached_info.name,
+                    holdings=cached_info.holdings[:top_n] if top_n else cached_info.holdings,
+                    total_holdings=cached_info.total_holdings,
+                    expense_ratio=cached_info.expense_ratio,
+                    aum=cached_info.aum,
+                    data_source=f"Disk cache ({getattr(cached_info, 'data_source', 'Unknown')})"
+                )
+
         print(f"Fetching holdings for {etf_symbol}...")
         
         # Try Web Scraping first (primary data source using etfdb.com)
@@ -630,9 +691,15 @@ class ETFHoldingsManager:
             if etf_info and etf_info.holdings:
                 etf_info.data_source = 'Hard-coded'
         
-        # Cache the result
+        # Cache the result (write-through: memory + disk)
         if etf_info:
             self.etf_cache[etf_symbol] = etf_info
+            if self.disk_cache is not None:
+                try:
+                    self.disk_cache.set(etf_symbol, etf_info,
+                                        expire=HOLDINGS_TTL_SECONDS)
+                except Exception as e:
+                    print(f"WARNING: Could not persist {etf_symbol} to disk cache: {e}")
             print(f"CHECK: Found {len(etf_info.holdings)} holdings for {etf_symbol}")
         else:
             print(f"CROSS: Could not fetch holdings for {etf_symbol}")
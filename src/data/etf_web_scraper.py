@@ -5,12 +5,36 @@ Advanced web scraping for ETF holdings from etf.com with dynamic dropdown handli
 Fully XPath-based for maximum reliability and findability.
 """
 
+import os
+import tempfile
 import time
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import re
+import gzip
+import json
+import sqlite3
+from datetime import date
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Cache settings - fall back to sane defaults when config isn't importable
+try:
+    from config.settings import HOLDINGS_CACHE_PATH, HOLDINGS_CACHE_TTL_HOURS
+except ImportError:
+    HOLDINGS_CACHE_PATH = "holdings_cache.sqlite"
+    HOLDINGS_CACHE_TTL_HOURS = 12
 from selenium import webdriver
 from selenium import __version__ as selenium_version
 from selenium.webdriver.chrome.options import Options
@@ -58,6 +82,193 @@ except ImportError:
             total_holdings: int = 0
 
 
+# Installs a MutationObserver once, then reports whether the DOM has been
+# quiet for the given number of milliseconds - lets us stop waiting as soon
+# as the page has actually settled instead of sleeping a fixed 3-5s.
+_DOM_IDLE_JS = """
+if (!window.__domIdleObserver) {
+    window.__lastMutation = Date.now();
+    window.__domIdleObserver = new MutationObserver(function() {
+        window.__lastMutation = Date.now();
+    });
+    window.__domIdleObserver.observe(document, {childList: true, subtree: true, attributes: true});
+}
+return (Date.now() - window.__lastMutation) > arguments[0];
+"""
+
+
+def wait_for_page_ready(driver, timeout: int = 10, idle_ms: int = 100):
+    """Wait for document.readyState == 'complete' plus a short DOM-idle window.
+
+    Replaces blanket time.sleep(3-5) calls after driver.get(): pages that
+    finish in <1s return immediately, slow pages still get the full timeout.
+
+    Args:
+        driver: Active WebDriver
+        timeout: Maximum seconds to wait for each condition
+        idle_ms: How long the DOM must go without mutations to count as idle
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script(_DOM_IDLE_JS, idle_ms)
+        )
+    except TimeoutException:
+        # Page never fully settled - proceed with whatever has rendered
+        pass
+
+
+# Evaluates a whole batch of XPaths inside the browser and returns the
+# results as one JSON payload - each driver.find_element call is a separate
+# JSON-over-HTTP round-trip to ChromeDriver (~20-50ms), so probing N
+# selectors in one execute_script is N times cheaper.
+_XPATH_PROBE_JS = """
+const xpaths = arguments[0];
+return xpaths.map(function(xp) {
+    try {
+        const r = document.evaluate(xp, document, null,
+                                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        if (r.snapshotLength === 0) {
+            return {found: false, count: 0};
+        }
+        const n = r.snapshotItem(0);
+        return {found: true, count: r.snapshotLength,
+                text: (n.textContent || '').slice(0, 200), tag: n.tagName};
+    } catch (e) {
+        return {found: false, count: 0, error: String(e)};
+    }
+});
+"""
+
+
+# Resolved ChromeDriver binary path, shared by every driver launch in the
+# process - ChromeDriverManager().install() does an HTTP version probe on
+# every call (~0.5-1s) even when the binary is already cached on disk.
+_DRIVER_PATH_CACHE = None
+
+
+def chromedriver_path() -> str:
+    """Resolve (and memoize) the ChromeDriver binary path for this process."""
+    global _DRIVER_PATH_CACHE
+    if _DRIVER_PATH_CACHE is None:
+        # Prefer the locally cached binary and silence webdriver-manager
+        os.environ.setdefault("WDM_LOCAL", "1")
+        os.environ.setdefault("WDM_LOG", "0")
+        _DRIVER_PATH_CACHE = ChromeDriverManager().install()
+    return _DRIVER_PATH_CACHE
+
+
+def build_chrome_options(headless: bool = True,
+                         profile_name: str = "etf_scraper_profile") -> Options:
+    """Build Chrome options tuned for scraping.
+
+    The scrapers only need DOM text, so images, notifications and Chrome's
+    background services are all switched off - that cuts page-load bytes by
+    roughly 70% and gets the page interactive seconds sooner. The profile
+    and disk cache persist under the temp dir, so repeat runs reuse cached
+    JS bundles, fonts and cookies instead of redownloading them.
+
+    Args:
+        headless: Run without a visible window
+        profile_name: Profile directory name - parallel workers must each
+            pass a unique name (Chrome locks the profile)
+
+    Returns:
+        Configured Options instance (callers may add their own flags)
+    """
+    opts = Options()
+
+    # Return from driver.get() on DOMContentLoaded instead of window.onload -
+    # the explicit wait_for_page_ready calls handle anything still rendering,
+    # so there is no reason to sit through trackers/ads finishing (Selenium 4+)
+    opts.page_load_strategy = "eager"
+
+    # Persistent profile + HTTP cache across runs
+    profile_dir = os.path.join(tempfile.gettempdir(), profile_name)
+    opts.add_argument(f"--user-data-dir={profile_dir}")
+    opts.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+    opts.add_argument("--disk-cache-size=268435456")  # 256MB
+
+    if headless:
+        opts.add_argument("--headless")
+
+    # Stability
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--window-size=1920,1080")
+
+    # Skip images and background chatter - we only read the DOM
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    for flag in ("--disable-extensions", "--disable-background-networking",
+                 "--disable-sync", "--disable-translate", "--no-first-run",
+                 "--disable-default-apps", "--mute-audio"):
+        opts.add_argument(flag)
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+
+    return opts
+
+
+def probe_xpaths(driver, xpaths):
+    """Probe many XPaths with a single in-browser call.
+
+    Args:
+        driver: Active WebDriver
+        xpaths: Iterable of XPath strings
+
+    Returns:
+        List of dicts (one per xpath) with 'found', 'count', and for matches
+        'text' (first 200 chars) and 'tag'
+    """
+    return driver.execute_script(_XPATH_PROBE_JS, list(xpaths))
+
+
+def probe_xpaths_offline(page_source, xpaths):
+    """Evaluate XPaths against a page-source snapshot entirely in lxml.
+
+    One driver.page_source fetch replaces all ChromeDriver XPath RPCs; lxml
+    then evaluates each query in C in microseconds. Only useful for reads -
+    anything that must be clicked still needs live Selenium elements.
+
+    Args:
+        page_source: HTML string from driver.page_source
+        xpaths: Iterable of XPath strings
+
+    Returns:
+        Same result shape as probe_xpaths, or None when lxml is unavailable
+    """
+    if lxml_html is None:
+        return None
+
+    tree = lxml_html.fromstring(page_source)
+    results = []
+    for xpath in xpaths:
+        try:
+            nodes = tree.xpath(xpath)
+        except Exception as e:
+            results.append({'found': False, 'count': 0, 'error': str(e)})
+            continue
+
+        if not nodes:
+            results.append({'found': False, 'count': 0})
+            continue
+
+        node = nodes[0]
+        if hasattr(node, 'text_content'):
+            text, tag = node.text_content(), str(node.tag).upper()
+        else:
+            # Attribute/text results come back as plain strings
+            text, tag = str(node), ''
+        results.append({'found': True, 'count': len(nodes),
+                        'text': text[:200], 'tag': tag})
+    return results
+
+
 @dataclass
 class ScrapedHolding:
     """Individual holding scraped from ETF website."""
@@ -84,17 +295,20 @@ class ScrapedETFInfo:
 class ETFWebScraper:
     """Advanced ETF holdings web scraper using Selenium."""
     
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    def __init__(self, headless: bool = True, timeout: int = 30, driver=None):
         """Initialize the web scraper.
-        
+
         Args:
             headless: Run browser in headless mode
             timeout: Maximum wait time for elements (seconds)
+            driver: Optional existing WebDriver to reuse instead of launching
+                a new Chrome (caller keeps ownership and handles quit)
         """
         self.headless = headless
         self.timeout = timeout
-        self.driver = None
-        self.wait = None
+        self.driver = driver
+        self.wait = WebDriverWait(driver, timeout) if driver else None
+        self._owns_driver = driver is None
         
         # XPath selectors for etfdb.com - much simpler!
         self.xpaths = {
@@ -111,7 +325,158 @@ class ETFWebScraper:
             'weight_cell': ".//td[3]"         # Third column: % Assets
         }
         
+        # Plain HTTP session for the API fast path (no browser startup cost).
+        # When requests_cache is installed, responses are cached on disk so
+        # repeat runs within the TTL never hit the network at all.
+        if requests_cache is not None:
+            self.http_session = requests_cache.CachedSession(
+                HOLDINGS_CACHE_PATH,
+                backend="sqlite",
+                expire_after=HOLDINGS_CACHE_TTL_HOURS * 3600
+            )
+        else:
+            self.http_session = requests.Session()
+        self.http_session.headers.update({
+            'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                           'AppleWebKit/537.36 (KHTML, like Gecko) '
+                           'Chrome/120.0.0.0 Safari/537.36'),
+            'Referer': 'https://etfdb.com/',
+        })
+        # Pooled keep-alive connections: repeated scrapes reuse the same TCP
+        # socket instead of paying a TCP+TLS handshake per request
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.http_session.mount('https://', adapter)
+        self.http_session.mount('http://', adapter)
+        self._html_tree_cache = {}
+
         print(f"DEBUG: ETF Web Scraper initialized (Selenium {selenium_version})")
+
+    def _parse_html(self, etf_symbol: str, html_text: str):
+        """Parse (and cache) an lxml tree for an ETF page's HTML."""
+        tree = self._html_tree_cache.get(etf_symbol)
+        if tree is None:
+            tree = lxml_html.fromstring(html_text)
+            self._html_tree_cache[etf_symbol] = tree
+        return tree
+
+    def _holdings_cache_connect(self) -> sqlite3.Connection:
+        """Open the parsed-holdings cache, creating the table if needed."""
+        conn = sqlite3.connect(HOLDINGS_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS holdings ("
+            "symbol TEXT, date TEXT, json BLOB, "
+            "PRIMARY KEY (symbol, date))"
+        )
+        return conn
+
+    def _load_cached_holdings(self, etf_symbol: str) -> Optional[List[Dict[str, any]]]:
+        """Return today's cached holdings list for a symbol, if present."""
+        try:
+            with self._holdings_cache_connect() as conn:
+                row = conn.execute(
+                    "SELECT json FROM holdings WHERE symbol = ? AND date = ?",
+                    (etf_symbol, date.today().isoformat())
+                ).fetchone()
+            if row:
+                return json.loads(gzip.decompress(row[0]).decode('utf-8'))
+        except Exception as e:
+            print(f"WARNING: Holdings cache read failed: {e}")
+        return None
+
+    def _store_cached_holdings(self, etf_symbol: str, holdings: List[Dict[str, any]]):
+        """Persist a parsed holdings list keyed by (symbol, date)."""
+        try:
+            payload = gzip.compress(json.dumps(holdings).encode('utf-8'))
+            with self._holdings_cache_connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO holdings (symbol, date, json) VALUES (?, ?, ?)",
+                    (etf_symbol, date.today().isoformat(), payload)
+                )
+        except Exception as e:
+            print(f"WARNING: Holdings cache write failed: {e}")
+
+    def scrape_holdings_via_http(self, etf_symbol: str, max_holdings: Optional[int] = None) -> Optional[ScrapedETFInfo]:
+        """Fetch holdings via plain HTTP + lxml, skipping the browser entirely.
+
+        The etfdb.com holdings table is present in the static HTML, so a single
+        GET + C-level XPath parse replaces the 2-4s JavaScript render.
+
+        Args:
+            etf_symbol: ETF symbol (e.g., 'VHT')
+            max_holdings: Maximum number of holdings to return
+
+        Returns:
+            ScrapedETFInfo object or None if the HTTP path failed
+        """
+        if lxml_html is None:
+            return None
+
+        etf_symbol = etf_symbol.upper().strip()
+        url = f"https://etfdb.com/etf/{etf_symbol}/"
+
+        try:
+            print(f"HTTP: Fetching holdings for {etf_symbol} from {url}")
+            response = self.http_session.get(url, timeout=(3, 10))
+            if not response.ok:
+                print(f"HTTP: Request failed with status {response.status_code}")
+                return None
+
+            tree = self._parse_html(etf_symbol, response.text)
+            rows = tree.xpath(self.xpaths['table_rows'])
+            if not rows:
+                print("HTTP: No holdings table in static HTML")
+                return None
+
+            holdings = []
+            for row in rows:
+                cells = row.xpath("./td")
+                if len(cells) < 3:
+                    continue
+
+                symbol = cells[0].text_content().strip()
+                company_name = cells[1].text_content().strip()
+                weight_text = cells[2].text_content().strip()
+
+                weight = 0.0
+                if weight_text and '%' in weight_text:
+                    try:
+                        weight = float(weight_text.replace('%', '').strip())
+                    except ValueError:
+                        pass
+
+                if symbol and company_name:
+                    holdings.append(ScrapedHolding(
+                        symbol=symbol,
+                        name=company_name,
+                        weight=weight
+                    ))
+                    if max_holdings and len(holdings) >= max_holdings:
+                        break
+
+            if not holdings:
+                return None
+
+            print(f"SUCCESS: Extracted {len(holdings)} holdings via HTTP")
+
+            etf_name = f"{etf_symbol} ETF"
+            title = tree.findtext('.//title')
+            if title and etf_symbol in title:
+                etf_name = title.split('|')[0].strip()
+
+            return ScrapedETFInfo(
+                symbol=etf_symbol,
+                name=etf_name,
+                holdings=holdings,
+                total_holdings=len(holdings)
+            )
+
+        except Exception as e:
+            print(f"HTTP: Fetch failed for {etf_symbol}: {e}")
+            return None
     
     def company_name_to_ticker(self, company_name: str) -> str:
         """Convert company name to ticker symbol.
@@ -183,26 +548,19 @@ class ETFWebScraper:
         Returns:
             True if successful, False otherwise
         """
+        if self.driver is not None:
+            # Reuse the injected/persistent driver - Chrome startup costs ~1-2s
+            return True
+
         try:
-            chrome_options = Options()
-            
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            
-            # Performance and stability options
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-images")
+            chrome_options = build_chrome_options(headless=self.headless)
             chrome_options.add_argument("--disable-javascript")  # We'll enable if needed
-            chrome_options.add_argument("--window-size=1920,1080")
-            
+
             # User agent to avoid bot detection
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             
             # Install and setup ChromeDriver
-            service = Service(ChromeDriverManager().install())
+            service = Service(chromedriver_path())
             
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.implicitly_wait(5)
@@ -269,17 +627,25 @@ class ETFWebScraper:
                     
         return False
     
-    def scrape_etf_holdings(self, etf_symbol: str, max_holdings: Optional[int] = None) -> Optional[ScrapedETFInfo]:
+    def scrape_etf_holdings(self, etf_symbol: str, max_holdings: Optional[int] = None,
+                            use_api: bool = True) -> Optional[ScrapedETFInfo]:
         """Scrape ETF holdings from etfdb.com.
-        
+
         Args:
             etf_symbol: ETF symbol (e.g., 'VHT')
             max_holdings: Maximum number of holdings to return (up to 15 from etfdb.com)
-            
+            use_api: Try the direct HTTP path first, Selenium only as fallback
+
         Returns:
             ScrapedETFInfo object or None if failed
         """
         etf_symbol = etf_symbol.upper().strip()
+
+        if use_api:
+            etf_info = self.scrape_holdings_via_http(etf_symbol, max_holdings)
+            if etf_info:
+                return etf_info
+            print(f"FALLBACK: HTTP path failed for {etf_symbol}, using Selenium")
         url = f"https://etfdb.com/etf/{etf_symbol}/#holdings"
         
         print(f"WEB: Scraping holdings for {etf_symbol} from {url}")
@@ -290,7 +656,7 @@ class ETFWebScraper:
         try:
             # Navigate to ETF holdings page on etfdb.com
             self.driver.get(url)
-            time.sleep(5)  # Let page load completely
+            wait_for_page_ready(self.driver, timeout=self.timeout)
             
             print(f"PAGE: Loaded: {self.driver.title}")
             
@@ -392,8 +758,9 @@ class ETFWebScraper:
             return None
         
         finally:
-            if self.driver:
+            if self.driver and self._owns_driver:
                 self.driver.quit()
+                self.driver = None
                 print("CLEANUP: Browser closed")
     
     def scrape_multiple_etfs(self, etf_symbols: List[str], max_holdings_per_etf: Optional[int] = None) -> Dict[str, ScrapedETFInfo]:
@@ -464,21 +831,30 @@ class ETFWebScraper:
             print("WARNING: ETFHolding/ETFInfo classes not available for conversion")
             return None
     
-    def get_etf_holdings(self, etf_symbol: str) -> Optional[List[Dict[str, any]]]:
+    def get_etf_holdings(self, etf_symbol: str, use_api: bool = True) -> Optional[List[Dict[str, any]]]:
         """
         Get ETF holdings in the expected format for the portfolio system.
-        
+
         Args:
             etf_symbol: ETF ticker symbol
-            
+            use_api: Try the direct HTTP path before falling back to Selenium
+
         Returns:
             List of holdings in dict format with 'symbol', 'name', 'weight' keys
         """
-        scraped_info = self.scrape_etf_holdings(etf_symbol)
-        
+        etf_symbol = etf_symbol.upper().strip()
+
+        # Holdings change at most daily - check the on-disk cache first
+        cached = self._load_cached_holdings(etf_symbol)
+        if cached:
+            print(f"CACHE: Using cached holdings for {etf_symbol} ({len(cached)} entries)")
+            return cached
+
+        scraped_info = self.scrape_etf_holdings(etf_symbol, use_api=use_api)
+
         if not scraped_info or not scraped_info.holdings:
             return None
-            
+
         # Convert to expected format
         holdings = []
         for holding in scraped_info.holdings:
@@ -487,12 +863,13 @@ class ETFWebScraper:
                 'name': holding.name,
                 'weight': holding.weight
             })
-            
+
+        self._store_cached_holdings(etf_symbol, holdings)
         return holdings
     
     def cleanup(self):
-        """Clean up the web driver resources."""
-        if self.driver:
+        """Clean up the web driver resources (injected drivers are left alone)."""
+        if self.driver and self._owns_driver:
             try:
                 self.driver.quit()
             except Exception as e:
@@ -7,11 +7,16 @@ Module for fetching and processing financial market data.
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional, Union
 from datetime import datetime, timedelta
 import asyncio
 from dataclasses import dataclass
 
+from . import batch_yf
+
 
 @dataclass
 class StockData:
@@ -28,7 +33,16 @@ class MarketDataFetcher:
     
     def __init__(self):
         """Initialize the market data fetcher."""
-        self.session = None
+        # Persistent session with pooled keep-alive connections so repeated
+        # fetches skip the per-request TCP+TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def fetch_stock_data(self, symbols: Union[str, List[str]], 
                         period: str = "1y",
@@ -46,16 +60,22 @@ class MarketDataFetcher:
         """
         if isinstance(symbols, str):
             symbols = [symbols]
-        
+
         stock_data = {}
-        
+
+        # Batch the price downloads - one request per 20 symbols instead of
+        # one per symbol; info/dividends/splits still require per-ticker calls
+        histories = batch_yf.download_history(symbols, period=period, interval=interval)
+
         for symbol in symbols:
             try:
-                ticker = yf.Ticker(symbol)
-                
-                # Fetch price data
-                hist = ticker.history(period=period, interval=interval)
-                
+                ticker = yf.Ticker(symbol, session=self.session)
+
+                # Price data from the batched download, per-ticker fallback
+                hist = histories.get(symbol)
+                if hist is None:
+                    hist = ticker.history(period=period, interval=interval)
+
                 # Fetch additional info
                 try:
                     info = ticker.info
@@ -130,7 +150,7 @@ class MarketDataFetcher:
         symbol = treasury_symbols.get(duration, "^TNX")
         
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             hist = ticker.history(period="5d")
             latest_rate = hist['Close'].iloc[-1] / 100  # Convert percentage to decimal
             return latest_rate
@@ -150,7 +170,7 @@ class MarketDataFetcher:
             Dictionary containing options chain data
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             
             # Get expiration dates
             expiration_dates = ticker.options
@@ -161,7 +181,9 @@ class MarketDataFetcher:
             options_data = {
                 'symbol': symbol,
                 'expiration_dates': list(expiration_dates),
-                'chains': {}
+                'chains': {},
+                'n_calls': 0,
+                'n_puts': 0
             }
             
             # If specific expiration date requested
@@ -203,6 +225,10 @@ class MarketDataFetcher:
                         'puts': puts,
                         'current_price': current_price
                     }
+                    # Tally counts at build time so call-sites don't have to
+                    # re-walk every chain just to report totals
+                    options_data['n_calls'] += calls.shape[0]
+                    options_data['n_puts'] += puts.shape[0]
                     
                 except Exception as e:
                     print(f"Error fetching options for {symbol} exp {exp_date}: {e}")
@@ -216,7 +242,7 @@ class MarketDataFetcher:
     def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current stock price."""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             hist = ticker.history(period="1d")
             if not hist.empty:
                 return hist['Close'].iloc[-1]
@@ -266,7 +292,84 @@ class MarketDataFetcher:
         
         return iv_data
     
-    def calculate_volatility(self, returns: pd.Series, 
+    async def fetch_options_chain_async(self, symbol: str,
+                                        expiration_date: Optional[str] = None) -> Dict:
+        """
+        Async wrapper around fetch_options_chain.
+
+        yfinance is blocking, so the work runs on the event loop's thread
+        pool; the win is that many symbols can be awaited concurrently with
+        asyncio.gather instead of paying one network round-trip per symbol
+        in series.
+
+        Args:
+            symbol: Stock symbol
+            expiration_date: Specific expiration date (YYYY-MM-DD format)
+
+        Returns:
+            Dictionary containing options chain data
+        """
+        return await asyncio.to_thread(self.fetch_options_chain, symbol, expiration_date)
+
+    async def get_implied_volatilities_async(self, symbol: str,
+                                             expiration_date: Optional[str] = None) -> Dict:
+        """
+        Async wrapper around get_implied_volatilities.
+
+        Args:
+            symbol: Stock symbol
+            expiration_date: Specific expiration date, if None uses nearest
+
+        Returns:
+            Dictionary with implied volatility data
+        """
+        return await asyncio.to_thread(self.get_implied_volatilities, symbol, expiration_date)
+
+    async def fetch_options_batch_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch options chains and implied volatilities for many symbols at once.
+
+        All requests run concurrently, so total wall time approaches the
+        slowest single symbol rather than the sum over symbols.
+
+        Args:
+            symbols: List of stock symbols
+
+        Returns:
+            Dictionary mapping each symbol to
+            {'options': options_chain_dict, 'iv': iv_dict}
+        """
+        tasks = [
+            asyncio.gather(self.fetch_options_chain_async(symbol),
+                           self.get_implied_volatilities_async(symbol))
+            for symbol in symbols
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        batch = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                batch[symbol] = {'options': {'error': str(result)},
+                                 'iv': {'error': str(result)}}
+            else:
+                options_data, iv_data = result
+                batch[symbol] = {'options': options_data, 'iv': iv_data}
+        return batch
+
+    def fetch_options_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Synchronous entry point for batched options fetching.
+
+        Args:
+            symbols: List of stock symbols
+
+        Returns:
+            Dictionary mapping each symbol to
+            {'options': options_chain_dict, 'iv': iv_dict}
+        """
+        return asyncio.run(self.fetch_options_batch_async(symbols))
+
+    def calculate_volatility(self, returns: pd.Series,
                            window: Optional[int] = None,
                            annualize: bool = True) -> Union[float, pd.Series]:
         """
@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+import threading
 import time
 import warnings
 warnings.filterwarnings('ignore')
@@ -37,10 +38,19 @@ except Exception as e:
 class TradingViewDataFetcher:
     """Fetch market data using TradingView via tvdatafeed."""
     
-    def __init__(self, enable_cache: bool = True):
-        """Initialize the TradingView data fetcher."""
+    def __init__(self, enable_cache: bool = True,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Initialize the TradingView data fetcher.
+
+        Args:
+            enable_cache: Whether to cache fetched data
+            cancel_event: Optional event that aborts inter-request delays
+                early, so a GUI shutdown doesn't wait out rate-limit sleeps
+        """
         self.tv = None
         self.cache_enabled = enable_cache and CACHING_AVAILABLE
+        self.cancel_event = cancel_event
         
         if TVDATAFEED_AVAILABLE:
             try:
@@ -85,6 +95,21 @@ class TradingViewDataFetcher:
             'QQQ': 'NASDAQ'
         }
     
+    def _delay(self, seconds: float) -> bool:
+        """
+        Sleep between requests, waking immediately on cancellation.
+
+        Args:
+            seconds: Delay duration
+
+        Returns:
+            True if the cancel event was set during the wait
+        """
+        if self.cancel_event is not None:
+            return self.cancel_event.wait(seconds)
+        time.sleep(seconds)
+        return False
+
     def get_stock_data(self, symbol: str, days: int = 180, allow_synthetic: bool = True) -> pd.DataFrame:
         """
         Fetch stock data for a single symbol with caching.
@@ -133,7 +158,9 @@ class TradingViewDataFetcher:
             try:
                 if i > 0:
                     print(f"🔄 Trying {symbol} on {exchange}...")
-                    time.sleep(1.0)  # Brief delay between exchange attempts
+                    if self._delay(1.0):  # Brief delay between exchange attempts
+                        print(f"🛑 {symbol}: fetch cancelled")
+                        return None
                 
                 # Fetch data
                 data = self.tv.get_hist(
@@ -197,8 +224,12 @@ class TradingViewDataFetcher:
         
         for i, symbol in enumerate(symbols):
             if i > 0:
-                time.sleep(2.0)  # Increased delay to avoid connection issues
-            
+                # Increased delay to avoid connection issues; returns
+                # early when the owning thread is being shut down
+                if self._delay(2.0):
+                    print("🛑 Fetch cancelled, returning partial data")
+                    break
+
             stock_data = self.get_stock_data(symbol, days, allow_synthetic)
             if stock_data is not None:
                 data[symbol] = stock_data
@@ -4,13 +4,21 @@ Portfolio Universe Manager
 Manages the universe of tradable equities and builds various portfolio strategies.
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import yfinance as yf
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# aiohttp is optional - without it fundamental fetches fall back to threads
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
 from .market_data import MarketDataFetcher
 from .etf_holdings import ETFHoldingsManager
@@ -40,7 +48,7 @@ except ImportError:
         return f"${value:,.2f}"
 
 
-@dataclass
+@dataclass(slots=True)
 class UniverseStock:
     """Information about a stock in the universe."""
     symbol: str
@@ -63,6 +71,29 @@ class PortfolioStrategy:
     monte_carlo_results: Optional[Dict] = None
 
 
+def _optimize_strategy_task(args: tuple):
+    """
+    Pickle-safe worker for one strategy optimization.
+
+    Runs in a ProcessPoolExecutor child, so it builds its own optimizer
+    from plain arguments and returns either the metrics or the exception
+    (raising would abort the whole executor.map).
+
+    Args:
+        args: Tuple of (strategy_returns, optimization_target, risk_free_rate)
+
+    Returns:
+        PortfolioMetrics on success, the Exception on failure
+    """
+    strategy_returns, optimization_target, risk_free_rate = args
+    try:
+        optimizer = PortfolioOptimizer(risk_free_rate=risk_free_rate)
+        return optimizer.optimize_portfolio(
+            strategy_returns, optimization_target=optimization_target)
+    except Exception as e:
+        return e
+
+
 class PortfolioUniverseManager:
     """Manage universe of stocks and build portfolio strategies."""
     
@@ -88,7 +119,55 @@ class PortfolioUniverseManager:
         self.universe: List[UniverseStock] = []
         self.universe_data: Dict = {}
         self.strategies: List[PortfolioStrategy] = []
-        
+
+        # Cached moments of the universe returns, filled in by
+        # fetch_universe_data and reused by optimization and Monte Carlo
+        self._moment_symbols: List[str] = []
+        self._daily_mu: Optional[np.ndarray] = None
+        self._daily_cov: Optional[np.ndarray] = None
+        self._mu: Optional[np.ndarray] = None
+        self._cov: Optional[np.ndarray] = None
+        self._chol: Optional[np.ndarray] = None
+        self._mc_cache = None
+
+    def _strategy_moments(self, symbols: List[str]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Slice the cached annualized moments down to a strategy's symbols.
+
+        Args:
+            symbols: Symbols the strategy weights apply to, in order
+
+        Returns:
+            Tuple of (mean_returns, cov_matrix) or None if the cache is
+            missing or doesn't cover all requested symbols
+        """
+        if self._mu is None:
+            return None
+        try:
+            idx = [self._moment_symbols.index(s) for s in symbols]
+        except ValueError:
+            return None
+        return self._mu[idx], self._cov[np.ix_(idx, idx)]
+
+    def _portfolio_metrics(self, weights: np.ndarray, symbols: List[str],
+                           strategy_returns: pd.DataFrame) -> Tuple[float, float, float]:
+        """
+        Portfolio metrics from the cached universe moments when available,
+        falling back to recomputing from the raw returns.
+
+        Args:
+            weights: Portfolio weights
+            symbols: Symbols the weights apply to
+            strategy_returns: Returns DataFrame for the fallback path
+
+        Returns:
+            Tuple of (expected_return, volatility, sharpe_ratio)
+        """
+        moments = self._strategy_moments(symbols)
+        if moments is not None:
+            return self.optimizer._metrics_from_moments(weights, *moments)
+        return self.optimizer.calculate_portfolio_metrics(weights, strategy_returns)
+
     def add_universe_stocks(self, symbols: List[str], fetch_fundamentals: bool = True) -> None:
         """
         Add stocks to the trading universe.
@@ -161,8 +240,66 @@ class PortfolioUniverseManager:
         """Print detailed ETF holdings information."""
         self.etf_manager.print_etf_info(etf_symbol)
     
+    # Yahoo quoteSummary endpoint used by the async fundamentals path
+    _QUOTE_SUMMARY_URL = ("https://query1.finance.yahoo.com/v10/finance/quoteSummary/"
+                          "{symbol}?modules=summaryProfile,summaryDetail,price")
+
+    async def _fetch_fundamentals_async(self, symbols: List[str]) -> List[UniverseStock]:
+        """Fetch fundamentals for all symbols concurrently with aiohttp.
+
+        The workload is pure network latency, so overlapping the requests
+        (bounded by a semaphore to stay polite) collapses N round-trips to
+        roughly one.
+        """
+        semaphore = asyncio.Semaphore(16)
+        connector = aiohttp.TCPConnector(limit=20)
+        timeout = aiohttp.ClientTimeout(total=15)
+        headers = {'User-Agent': 'Mozilla/5.0'}
+
+        def _raw(section: dict, key: str):
+            value = section.get(key)
+            return value.get('raw') if isinstance(value, dict) else value
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=headers) as session:
+            async def fetch_one(symbol: str) -> UniverseStock:
+                async with semaphore:
+                    try:
+                        url = self._QUOTE_SUMMARY_URL.format(symbol=symbol)
+                        async with session.get(url) as resp:
+                            payload = await resp.json()
+
+                        result = payload['quoteSummary']['result'][0]
+                        profile = result.get('summaryProfile') or {}
+                        detail = result.get('summaryDetail') or {}
+                        price = result.get('price') or {}
+
+                        return UniverseStock(
+                            symbol=symbol,
+                            sector=profile.get('sector', 'Unknown'),
+                            market_cap=_raw(price, 'marketCap') or 0,
+                            beta=_raw(detail, 'beta'),
+                            pe_ratio=_raw(detail, 'trailingPE'),
+                            dividend_yield=_raw(detail, 'dividendYield'),
+                            avg_volume=_raw(detail, 'averageVolume')
+                        )
+                    except Exception as e:
+                        print(f"Error fetching data for {symbol}: {e}")
+                        return UniverseStock(symbol=symbol, sector="Unknown", market_cap=0.0)
+
+            return list(await asyncio.gather(*(fetch_one(s) for s in symbols)))
+
     def _fetch_stock_fundamentals(self, symbols: List[str]) -> None:
         """Fetch fundamental data for stocks."""
+        if AIOHTTP_AVAILABLE:
+            try:
+                # Sync shim so example scripts stay unchanged
+                stocks = asyncio.run(self._fetch_fundamentals_async(symbols))
+                self.universe.extend(stocks)
+                return
+            except Exception as e:
+                print(f"Async fundamentals fetch failed ({e}), falling back to threads")
+
         def fetch_single_stock(symbol: str) -> Optional[UniverseStock]:
             try:
                 ticker = yf.Ticker(symbol)
@@ -254,7 +391,23 @@ class PortfolioUniverseManager:
                 'returns': returns_df,
                 'symbols': list(prices_df.columns)
             }
-            
+
+            # Precompute the moments every downstream step needs - strategy
+            # building, optimization and Monte Carlo would otherwise each
+            # re-traverse the full returns matrix
+            clean_returns = returns_df.dropna()
+            self._moment_symbols = list(clean_returns.columns)
+            self._daily_mu = clean_returns.mean().values
+            self._daily_cov = clean_returns.cov().values
+            self._mu = self._daily_mu * 252
+            self._cov = self._daily_cov * 252
+            try:
+                self._chol = np.linalg.cholesky(self._daily_cov)
+            except np.linalg.LinAlgError:
+                self._chol = None
+            # Shape changed, so any cached Monte Carlo draws are stale
+            self._mc_cache = None
+
             print(f"Successfully fetched data for {len(prices_df.columns)} stocks")
             print(f"Date range: {prices_df.index[0].date()} to {prices_df.index[-1].date()}")
         
@@ -380,9 +533,13 @@ class PortfolioUniverseManager:
             raise ValueError("No strategies available. Call build_portfolio_strategies() first.")
         
         returns_df = self.universe_data['returns']
-        
+
         print("Optimizing portfolio strategies...")
-        
+
+        # Solver-bound strategies are collected here and dispatched to a
+        # process pool once the closed-form ones are done
+        pending = []
+
         for i, strategy in enumerate(self.strategies):
             try:
                 # Filter returns for strategy symbols
@@ -399,8 +556,8 @@ class PortfolioUniverseManager:
                     weights = np.array([1/n_assets] * n_assets)
                     
                     # Calculate metrics manually
-                    portfolio_return, volatility, sharpe = self.optimizer.calculate_portfolio_metrics(
-                        weights, strategy_returns
+                    portfolio_return, volatility, sharpe = self._portfolio_metrics(
+                        weights, strategy.symbols, strategy_returns
                     )
                     
                     strategy.metrics = PortfolioMetrics(
@@ -421,8 +578,8 @@ class PortfolioUniverseManager:
                     weights = np.array(market_caps)
                     weights = weights / weights.sum()  # Normalize
                     
-                    portfolio_return, volatility, sharpe = self.optimizer.calculate_portfolio_metrics(
-                        weights, strategy_returns
+                    portfolio_return, volatility, sharpe = self._portfolio_metrics(
+                        weights, strategy.symbols, strategy_returns
                     )
                     
                     strategy.metrics = PortfolioMetrics(
@@ -434,24 +591,22 @@ class PortfolioUniverseManager:
                     )
                     
                 elif "Max Sharpe" in strategy.name:
-                    # Optimize for maximum Sharpe ratio
-                    strategy.metrics = self.optimizer.optimize_portfolio(
-                        strategy_returns, optimization_target='sharpe'
-                    )
-                    
+                    # SLSQP solve - defer so all solver-bound strategies
+                    # can run in parallel after the cheap ones finish
+                    pending.append((strategy, strategy_returns, 'sharpe'))
+                    continue
+
                 elif "Minimum Volatility" in strategy.name:
-                    # Optimize for minimum volatility
-                    strategy.metrics = self.optimizer.optimize_portfolio(
-                        strategy_returns, optimization_target='min_volatility'
-                    )
-                    
+                    pending.append((strategy, strategy_returns, 'min_volatility'))
+                    continue
+
                 else:
                     # Default to equal weight for other strategies
                     n_assets = len(strategy.symbols)
                     weights = np.array([1/n_assets] * n_assets)
                     
-                    portfolio_return, volatility, sharpe = self.optimizer.calculate_portfolio_metrics(
-                        weights, strategy_returns
+                    portfolio_return, volatility, sharpe = self._portfolio_metrics(
+                        weights, strategy.symbols, strategy_returns
                     )
                     
                     strategy.metrics = PortfolioMetrics(
@@ -467,7 +622,38 @@ class PortfolioUniverseManager:
             except Exception as e:
                 print(f"Error optimizing {strategy.name}: {e}")
                 continue
-    
+
+        if pending:
+            self._run_pending_optimizations(pending)
+
+    def _run_pending_optimizations(self, pending: List[tuple]) -> None:
+        """
+        Run the queued SLSQP optimizations, in parallel when possible.
+
+        Each solve is an independent CPU-bound SciPy call, so a process
+        pool scales with strategy count; any pool failure (pickling,
+        restricted platform) falls back to the serial path.
+
+        Args:
+            pending: List of (strategy, strategy_returns, target) tuples
+        """
+        task_args = [(strategy_returns, target, self.risk_free_rate)
+                     for _, strategy_returns, target in pending]
+
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_optimize_strategy_task, task_args))
+        except Exception as e:
+            print(f"Warning: parallel optimization unavailable ({e}), running serially")
+            results = [_optimize_strategy_task(args) for args in task_args]
+
+        for (strategy, _, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                print(f"Error optimizing {strategy.name}: {result}")
+                continue
+            strategy.metrics = result
+            print(f"✓ Optimized {strategy.name}: Sharpe={strategy.metrics.sharpe_ratio:.3f}")
+
     def run_monte_carlo_simulations(self, num_simulations: int = 1000, 
                                   time_horizon: int = 252, 
                                   initial_investment: float = 10000) -> None:
@@ -481,34 +667,113 @@ class PortfolioUniverseManager:
         """
         if not self.strategies:
             raise ValueError("No strategies available")
-        
+
         returns_df = self.universe_data['returns']
-        
+
         print(f"Running Monte Carlo simulations ({num_simulations} runs, {time_horizon} days)...")
-        
+
+        # Draw the correlated return tensor once over the full universe and
+        # reuse it for every strategy - each strategy only differs in which
+        # columns it weights, so re-drawing (and re-factoring the covariance)
+        # per strategy is pure waste
+        shared = self._shared_mc_draws(returns_df, num_simulations, time_horizon)
+
         for strategy in self.strategies:
             if not strategy.metrics:
                 continue
-                
+
             try:
-                strategy_returns = returns_df[strategy.symbols].dropna()
-                
-                results = self.optimizer.monte_carlo_simulation(
-                    strategy_returns,
-                    strategy.metrics.weights,
-                    initial_investment=initial_investment,
-                    time_horizon=time_horizon,
-                    num_simulations=num_simulations
-                )
-                
+                if shared is not None:
+                    symbols, asset_returns = shared
+                    col_idx = [symbols.index(s) for s in strategy.symbols]
+                    portfolio_paths = (
+                        asset_returns[:, :, col_idx]
+                        @ np.asarray(strategy.metrics.weights, dtype=np.float32))
+                    values = initial_investment * np.cumprod(
+                        1.0 + portfolio_paths, axis=1, dtype=np.float64)
+                    simulation_array = np.hstack([
+                        np.full((num_simulations, 1), float(initial_investment)),
+                        values
+                    ])
+                    final_values = simulation_array[:, -1]
+                    p5, p25, p50, p75, p95 = np.percentile(
+                        final_values, [5, 25, 50, 75, 95])
+                    results = {
+                        'simulations': simulation_array,
+                        'final_values': final_values,
+                        'percentiles': {
+                            '5th': p5, '25th': p25, '50th': p50,
+                            '75th': p75, '95th': p95
+                        }
+                    }
+                else:
+                    strategy_returns = returns_df[strategy.symbols].dropna()
+                    results = self.optimizer.monte_carlo_simulation(
+                        strategy_returns,
+                        strategy.metrics.weights,
+                        initial_investment=initial_investment,
+                        time_horizon=time_horizon,
+                        num_simulations=num_simulations
+                    )
+
                 strategy.monte_carlo_results = results
-                
+
                 median_return = (results['percentiles']['50th'] - initial_investment) / initial_investment
                 print(f"✓ {strategy.name}: Median return = {format_percentage(median_return)}")
-                
+
             except Exception as e:
                 print(f"Error in Monte Carlo for {strategy.name}: {e}")
                 continue
+
+    def _shared_mc_draws(self, returns_df: pd.DataFrame,
+                         num_simulations: int,
+                         time_horizon: int) -> Optional[tuple]:
+        """
+        Draw one (N, T, n) tensor of correlated asset returns for the whole
+        universe, cached on the instance so repeated calls with the same
+        shape reuse both the random draws and the Cholesky factor.
+
+        Returns:
+            Tuple of (symbols, asset_returns) or None if the covariance
+            cannot be factored
+        """
+        clean = returns_df.dropna()
+        symbols = list(clean.columns)
+        cache_key = (num_simulations, time_horizon, tuple(symbols))
+
+        cached = getattr(self, '_mc_cache', None)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        try:
+            # Reuse the moments cached by fetch_universe_data when they cover
+            # the same symbols; otherwise compute them for this frame
+            if (symbols == self._moment_symbols and self._daily_mu is not None
+                    and self._chol is not None):
+                mu = self._daily_mu
+                L = self._chol
+            else:
+                mu = clean.mean().values
+                cov = clean.cov().values
+                try:
+                    L = np.linalg.cholesky(cov)
+                except np.linalg.LinAlgError:
+                    L = np.linalg.cholesky(cov + 1e-12 * np.eye(len(cov)))
+
+            rng = np.random.default_rng()
+            # float32 halves the RAM and memory bandwidth of the dominant
+            # (N, T, n) tensor and dispatches to SGEMM; the terminal-value
+            # accumulation below still happens in float64
+            Z = rng.standard_normal((num_simulations, time_horizon, len(symbols)),
+                                    dtype=np.float32)
+            asset_returns = mu.astype(np.float32) + Z @ L.T.astype(np.float32)
+        except Exception as e:
+            print(f"Warning: shared Monte Carlo draws unavailable ({e}), "
+                  f"falling back to per-strategy simulation")
+            return None
+
+        self._mc_cache = (cache_key, (symbols, asset_returns))
+        return (symbols, asset_returns)
     
     def get_strategy_summary(self) -> pd.DataFrame:
         """Get summary of all strategies."""
@@ -6,6 +6,7 @@ Implementation of the Black-Scholes formula for European option pricing.
 
 import numpy as np
 from scipy.stats import norm
+from scipy.special import ndtr
 from typing import Union, Optional
 from dataclasses import dataclass
 
@@ -80,6 +81,149 @@ class BlackScholesModel:
             
         return price
     
+    def calculate_price_vec(self, S, K, T, r, sigma,
+                            option_type: str = 'call') -> np.ndarray:
+        """
+        Calculate option prices for whole arrays of strikes/expiries at once.
+
+        All inputs broadcast against each other, so a full chain prices in a
+        single pass. Uses scipy.special.ndtr, which is ~3x faster than
+        norm.cdf because it skips the distribution-object machinery.
+
+        Args:
+            S: Current stock price(s)
+            K: Strike price(s)
+            T: Time(s) to expiration (in years)
+            r: Risk-free interest rate(s)
+            sigma: Volatility (annualized)
+            option_type: 'call' or 'put'
+
+        Returns:
+            Array of option prices (scalar inputs give a 0-d array)
+        """
+        S, K, T, r, sigma = np.broadcast_arrays(
+            *[np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma)])
+
+        # Expired options collapse to intrinsic value; mask to avoid log(0)
+        expired = T <= 0
+        T_safe = np.where(expired, 1.0, T)
+
+        sqrt_T = np.sqrt(T_safe)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T_safe) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        discount = K * np.exp(-r * T_safe)
+
+        if option_type.lower() == 'call':
+            price = S * ndtr(d1) - discount * ndtr(d2)
+            intrinsic = np.maximum(S - K, 0.0)
+        elif option_type.lower() == 'put':
+            price = discount * ndtr(-d2) - S * ndtr(-d1)
+            intrinsic = np.maximum(K - S, 0.0)
+        else:
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        return np.where(expired, intrinsic, price)
+
+    def calculate_greeks_vec(self, S, K, T, r, sigma,
+                             option_type: str = 'call') -> dict:
+        """
+        Calculate Greeks over arrays of strikes/expiries in one pass.
+
+        Same broadcasting semantics and practical units as calculate_greeks.
+
+        Returns:
+            Dictionary of arrays: delta, gamma, theta, vega, rho
+        """
+        S, K, T, r, sigma = np.broadcast_arrays(
+            *[np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma)])
+
+        expired = T <= 0
+        T_safe = np.where(expired, 1.0, T)
+
+        sqrt_T = np.sqrt(T_safe)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T_safe) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        discount = K * np.exp(-r * T_safe)
+
+        pdf_d1 = np.exp(-0.5 * d1**2) / np.sqrt(2.0 * np.pi)
+
+        if option_type.lower() == 'call':
+            delta = ndtr(d1)
+            rho = K * T_safe * np.exp(-r * T_safe) * ndtr(d2)
+            theta = (-S * pdf_d1 * sigma / (2 * sqrt_T)
+                     - r * discount * ndtr(d2))
+        elif option_type.lower() == 'put':
+            delta = ndtr(d1) - 1
+            rho = -K * T_safe * np.exp(-r * T_safe) * ndtr(-d2)
+            theta = (-S * pdf_d1 * sigma / (2 * sqrt_T)
+                     + r * discount * ndtr(-d2))
+        else:
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        gamma = pdf_d1 / (S * sigma * sqrt_T)
+        vega = S * pdf_d1 * sqrt_T
+
+        zero = np.zeros_like(T_safe)
+        return {
+            'delta': np.where(expired, zero, delta),
+            'gamma': np.where(expired, zero, gamma),
+            'theta': np.where(expired, zero, theta / 365),  # Per day
+            'vega': np.where(expired, zero, vega / 100),    # Per 1% vol change
+            'rho': np.where(expired, zero, rho / 100)       # Per 1% rate change
+        }
+
+    def implied_volatility_vec(self, market_price, S, K, T, r,
+                               option_type: str = 'call',
+                               max_iterations: int = 20,
+                               tolerance: float = 1e-6) -> np.ndarray:
+        """
+        Solve implied volatility for whole arrays of options at once.
+
+        Newton iteration with analytic vega, stepped on every option in
+        lockstep - each row typically converges in 3-5 iterations, so a
+        full chain solves in a handful of vectorized passes instead of one
+        scalar root-find per option.
+
+        Args:
+            market_price: Observed market price(s)
+            S: Current stock price(s)
+            K: Strike price(s)
+            T: Time(s) to expiration (in years)
+            r: Risk-free interest rate(s)
+            option_type: 'call' or 'put'
+            max_iterations: Maximum Newton iterations
+            tolerance: Convergence tolerance on price error
+
+        Returns:
+            Array of implied volatilities, NaN where no solution was found
+        """
+        market_price, S, K, T, r = np.broadcast_arrays(
+            *[np.asarray(x, dtype=np.float64)
+              for x in (market_price, S, K, T, r)])
+
+        # Brenner-Subrahmanyam starting guess, clipped to a sane band
+        sigma = np.clip(np.sqrt(2.0 * np.pi / np.maximum(T, 1e-8))
+                        * market_price / S, 0.05, 2.0)
+        converged = np.zeros(sigma.shape, dtype=bool)
+
+        for _ in range(max_iterations):
+            price = self.calculate_price_vec(S, K, T, r, sigma, option_type)
+            diff = price - market_price
+            converged |= np.abs(diff) < tolerance
+            if converged.all():
+                break
+
+            sqrt_T = np.sqrt(np.maximum(T, 1e-8))
+            d1 = ((np.log(S / K) + (r + 0.5 * sigma**2) * T)
+                  / (sigma * sqrt_T))
+            vega = S * np.exp(-0.5 * d1**2) / np.sqrt(2.0 * np.pi) * sqrt_T
+
+            # Only step the unconverged rows with usable vega
+            step = np.where(~converged & (vega > 1e-12), diff / np.maximum(vega, 1e-12), 0.0)
+            sigma = np.maximum(sigma - step, 1e-3)
+
+        return np.where(converged, sigma, np.nan)
+
     def calculate_greeks(self, S: float, K: float, T: float, r: float, sigma: float,
                         option_type: str = 'call') -> dict:
         """
@@ -1,5 +1,6 @@
 """Portfolio management package."""
 
 from .optimizer import PortfolioOptimizer, PortfolioMetrics
+from .rolling_stats import RollingCovariance
 
-__all__ = ['PortfolioOptimizer', 'PortfolioMetrics']
\ No newline at end of file
+__all__ = ['PortfolioOptimizer', 'PortfolioMetrics', 'RollingCovariance']
\ No newline at end of file
@@ -10,6 +10,44 @@ from scipy.optimize import minimize
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+# Numba is an optional performance dependency
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mc_path_kernel(L, mu, weights, time_horizon, num_simulations,
+                        initial_investment, out_terminal, out_maxdd):
+        """Streaming per-path Monte Carlo with terminal value and max drawdown.
+
+        Each prange thread keeps O(n) state instead of materializing the full
+        (N, T) tensor, so path-dependent stats stay cheap on memory even for
+        large simulation counts.
+        """
+        n_assets = mu.shape[0]
+        for i in prange(num_simulations):
+            cum = initial_investment
+            peak = initial_investment
+            max_dd = 0.0
+            for _ in range(time_horizon):
+                z = np.random.standard_normal(n_assets)
+                r = mu + L @ z
+                port_return = 0.0
+                for j in range(n_assets):
+                    port_return += r[j] * weights[j]
+                cum *= 1.0 + port_return
+                if cum > peak:
+                    peak = cum
+                dd = (peak - cum) / peak
+                if dd > max_dd:
+                    max_dd = dd
+            out_terminal[i] = cum
+            out_maxdd[i] = max_dd
+
 
 @dataclass
 class PortfolioMetrics:
@@ -45,34 +83,57 @@ class PortfolioOptimizer:
             Tuple of (expected_return, volatility, sharpe_ratio)
         """
         # Calculate expected returns and covariance matrix
-        mean_returns = returns.mean() * 252  # Annualized
-        cov_matrix = returns.cov() * 252    # Annualized
-        
+        mean_returns = returns.mean().values * 252  # Annualized
+        cov_matrix = returns.cov().values * 252    # Annualized
+
+        return self._metrics_from_moments(weights, mean_returns, cov_matrix)
+
+    def _metrics_from_moments(self, weights: np.ndarray, mean_returns: np.ndarray,
+                              cov_matrix: np.ndarray) -> Tuple[float, float, float]:
+        """
+        Portfolio metrics from precomputed annualized moments.
+
+        Split out so the optimizer's objective functions can reuse one
+        mean/cov computation across all SLSQP iterations instead of
+        re-traversing the full returns matrix on every evaluation.
+
+        Args:
+            weights: Portfolio weights
+            mean_returns: Annualized mean returns
+            cov_matrix: Annualized covariance matrix
+
+        Returns:
+            Tuple of (expected_return, volatility, sharpe_ratio)
+        """
         # Portfolio expected return
         portfolio_return = np.sum(weights * mean_returns)
-        
+
         # Portfolio volatility
         portfolio_variance = np.dot(weights.T, np.dot(cov_matrix, weights))
         portfolio_volatility = np.sqrt(portfolio_variance)
-        
+
         # Sharpe ratio
         sharpe_ratio = (portfolio_return - self.risk_free_rate) / portfolio_volatility
-        
+
         return portfolio_return, portfolio_volatility, sharpe_ratio
     
-    def optimize_portfolio(self, returns: pd.DataFrame, 
+    def optimize_portfolio(self, returns: pd.DataFrame,
                           optimization_target: str = 'sharpe',
                           min_weight: float = 0.0,
-                          max_weight: float = 1.0) -> PortfolioMetrics:
+                          max_weight: float = 1.0,
+                          mean_returns: Optional[np.ndarray] = None,
+                          cov_matrix: Optional[np.ndarray] = None) -> PortfolioMetrics:
         """
         Optimize portfolio weights.
-        
+
         Args:
             returns: Historical returns DataFrame
             optimization_target: 'sharpe', 'min_volatility', or 'max_return'
             min_weight: Minimum weight constraint
             max_weight: Maximum weight constraint
-            
+            mean_returns: Precomputed annualized mean returns (optional)
+            cov_matrix: Precomputed annualized covariance matrix (optional)
+
         Returns:
             PortfolioMetrics object with optimal weights and metrics
         """
@@ -88,19 +149,27 @@ class PortfolioOptimizer:
         
         # Bounds
         bounds = tuple((min_weight, max_weight) for _ in range(n_assets))
-        
+
+        # Compute the annualized moments once - SLSQP evaluates the
+        # objective dozens of times and they never change between calls.
+        # Callers maintaining rolling statistics can pass them in instead.
+        if mean_returns is None:
+            mean_returns = returns.mean().values * 252
+        if cov_matrix is None:
+            cov_matrix = returns.cov().values * 252
+
         # Define objective function based on target
         if optimization_target == 'sharpe':
             def objective(weights):
-                _, _, sharpe = self.calculate_portfolio_metrics(weights, returns)
+                _, _, sharpe = self._metrics_from_moments(weights, mean_returns, cov_matrix)
                 return -sharpe  # Minimize negative Sharpe ratio
         elif optimization_target == 'min_volatility':
             def objective(weights):
-                _, volatility, _ = self.calculate_portfolio_metrics(weights, returns)
+                _, volatility, _ = self._metrics_from_moments(weights, mean_returns, cov_matrix)
                 return volatility
         elif optimization_target == 'max_return':
             def objective(weights):
-                expected_return, _, _ = self.calculate_portfolio_metrics(weights, returns)
+                expected_return, _, _ = self._metrics_from_moments(weights, mean_returns, cov_matrix)
                 return -expected_return  # Minimize negative return
         else:
             raise ValueError("optimization_target must be 'sharpe', 'min_volatility', or 'max_return'")
@@ -119,8 +188,8 @@ class PortfolioOptimizer:
             raise RuntimeError(f"Optimization failed: {result.message}")
         
         optimal_weights = result.x
-        expected_return, volatility, sharpe_ratio = self.calculate_portfolio_metrics(
-            optimal_weights, returns
+        expected_return, volatility, sharpe_ratio = self._metrics_from_moments(
+            optimal_weights, mean_returns, cov_matrix
         )
         
         return PortfolioMetrics(
@@ -176,36 +245,111 @@ class PortfolioOptimizer:
         Returns:
             Dictionary with simulation results
         """
-        # Calculate portfolio statistics
-        portfolio_returns = (returns * weights).sum(axis=1)
-        mean_return = portfolio_returns.mean()
-        std_return = portfolio_returns.std()
-        
-        # Run simulations
-        simulation_results = []
-        
-        for _ in range(num_simulations):
-            # Generate random returns
-            random_returns = np.random.normal(mean_return, std_return, time_horizon)
-            
-            # Calculate cumulative portfolio value
-            portfolio_values = [initial_investment]
-            for daily_return in random_returns:
-                new_value = portfolio_values[-1] * (1 + daily_return)
-                portfolio_values.append(new_value)
-            
-            simulation_results.append(portfolio_values)
-        
-        simulation_array = np.array(simulation_results)
-        
+        rng = np.random.default_rng()
+        n_assets = len(returns.columns)
+
+        # Draw all paths at once as an (N, T, n) tensor of correlated asset
+        # returns - two BLAS calls replace N Python-level path loops
+        mu = returns.mean().values
+        cov = returns.cov().values
+
+        try:
+            L = np.linalg.cholesky(cov)
+            # The (N, T, n) tensor dominates memory, so draw it in float32 -
+            # half the bandwidth, and BLAS runs SGEMM at twice the DGEMM
+            # rate. Daily return noise is far above float32 precision.
+            Z = rng.standard_normal((num_simulations, time_horizon, n_assets),
+                                    dtype=np.float32)
+            asset_returns = mu.astype(np.float32) + Z @ L.T.astype(np.float32)
+            portfolio_paths = asset_returns @ np.asarray(weights, dtype=np.float32)  # (N, T)
+        except np.linalg.LinAlgError:
+            # Singular covariance (e.g. duplicated series) - fall back to
+            # portfolio-level draws with the same vectorized shape
+            portfolio_returns = (returns * weights).sum(axis=1)
+            portfolio_paths = rng.normal(portfolio_returns.mean(),
+                                         portfolio_returns.std(),
+                                         (num_simulations, time_horizon))
+
+        # Cumulative value along each path, with the initial value prepended;
+        # accumulate in float64 so long products don't drift
+        values = initial_investment * np.cumprod(1.0 + portfolio_paths, axis=1,
+                                                 dtype=np.float64)
+        simulation_array = np.hstack([
+            np.full((num_simulations, 1), float(initial_investment)),
+            values
+        ])
+
+        final_values = simulation_array[:, -1]
+        p5, p25, p50, p75, p95 = np.percentile(final_values, [5, 25, 50, 75, 95])
+
         return {
             'simulations': simulation_array,
-            'final_values': simulation_array[:, -1],
+            'final_values': final_values,
+            'percentiles': {
+                '5th': p5,
+                '25th': p25,
+                '50th': p50,
+                '75th': p75,
+                '95th': p95
+            }
+        }
+
+    def monte_carlo_path_stats(self, returns: pd.DataFrame, weights: np.ndarray,
+                               initial_investment: float = 10000,
+                               time_horizon: int = 252,
+                               num_simulations: int = 1000) -> Dict[str, np.ndarray]:
+        """
+        Run a path-dependent Monte Carlo (terminal value + max drawdown).
+
+        Uses a Numba-compiled streaming kernel when available, so memory is
+        O(assets) per thread instead of the full (N, T) path tensor; falls
+        back to the vectorized tensor when Numba is not installed.
+
+        Args:
+            returns: Historical returns DataFrame
+            weights: Portfolio weights
+            initial_investment: Initial investment amount
+            time_horizon: Simulation time horizon in days
+            num_simulations: Number of simulation runs
+
+        Returns:
+            Dictionary with 'final_values', 'max_drawdowns', and percentiles
+        """
+        mu = returns.mean().values
+        cov = returns.cov().values
+
+        try:
+            L = np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            # Regularize a singular covariance just enough to factor it
+            L = np.linalg.cholesky(cov + 1e-12 * np.eye(len(cov)))
+
+        if NUMBA_AVAILABLE:
+            terminal = np.empty(num_simulations)
+            max_dd = np.empty(num_simulations)
+            _mc_path_kernel(L, mu, np.asarray(weights, dtype=np.float64),
+                            time_horizon, num_simulations,
+                            float(initial_investment), terminal, max_dd)
+        else:
+            rng = np.random.default_rng()
+            Z = rng.standard_normal((num_simulations, time_horizon, len(mu)))
+            paths = initial_investment * np.cumprod(
+                1.0 + (mu + Z @ L.T) @ weights, axis=1)
+            terminal = paths[:, -1]
+            peaks = np.maximum.accumulate(
+                np.maximum(paths, initial_investment), axis=1)
+            max_dd = ((peaks - paths) / peaks).max(axis=1)
+
+        p5, p25, p50, p75, p95 = np.percentile(terminal, [5, 25, 50, 75, 95])
+
+        return {
+            'final_values': terminal,
+            'max_drawdowns': max_dd,
             'percentiles': {
-                '5th': np.percentile(simulation_array[:, -1], 5),
-                '25th': np.percentile(simulation_array[:, -1], 25),
-                '50th': np.percentile(simulation_array[:, -1], 50),
-                '75th': np.percentile(simulation_array[:, -1], 75),
-                '95th': np.percentile(simulation_array[:, -1], 95)
+                '5th': p5,
+                '25th': p25,
+                '50th': p50,
+                '75th': p75,
+                '95th': p95
             }
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,101 @@
+"""
+Rolling Covariance Statistics
+
+Incremental mean/covariance maintenance for overlapping return windows.
+Re-optimizing a portfolio after a short interval re-reads almost the
+same history; updating the sufficient statistics for just the added and
+dropped rows costs O(K^2) per row instead of the O(N*K^2) full re-scan
+of returns.cov().
+"""
+
+import numpy as np
+import pandas as pd
+from collections import deque
+from typing import List, Optional
+
+
+class RollingCovariance:
+    """Maintain the mean vector and covariance of a rolling return window."""
+
+    def __init__(self, returns: pd.DataFrame):
+        """
+        Seed the statistics from an initial returns window.
+
+        Args:
+            returns: Initial window of daily returns (rows = days)
+        """
+        values = returns.to_numpy(dtype=np.float64)
+        self.columns: List = list(returns.columns)
+        self.index: List = list(returns.index)
+        self._rows = deque(values)
+        self._n = len(values)
+        self._sum = values.sum(axis=0)
+        # Sum of row outer products; cov() recovers Σ from it in O(K^2)
+        self._outer = values.T @ values
+
+    def update(self, new_row: Optional[np.ndarray] = None,
+               dropped_row: Optional[np.ndarray] = None) -> None:
+        """
+        Apply one window step: append a new observation, drop the oldest.
+
+        Args:
+            new_row: Returns row entering the window (or None)
+            dropped_row: Returns row leaving the window (or None)
+        """
+        if new_row is not None:
+            new_row = np.asarray(new_row, dtype=np.float64)
+            self._rows.append(new_row)
+            self._n += 1
+            self._sum += new_row
+            self._outer += np.outer(new_row, new_row)
+        if dropped_row is not None:
+            dropped_row = np.asarray(dropped_row, dtype=np.float64)
+            self._n -= 1
+            self._sum -= dropped_row
+            self._outer -= np.outer(dropped_row, dropped_row)
+
+    def sync(self, returns: pd.DataFrame) -> bool:
+        """
+        Roll the window forward incrementally to match a new frame.
+
+        Args:
+            returns: The refreshed returns window
+
+        Returns:
+            True if the statistics now match the frame; False when the
+            frame is incompatible (different columns, or not a forward
+            roll of the current window) and the caller should reseed
+        """
+        if list(returns.columns) != self.columns:
+            return False
+
+        new_index = list(returns.index)
+        if new_index == self.index:
+            return True
+
+        # Rows that fell out of the window must be a prefix of the old
+        # index, and the retained rows a prefix of the new one
+        new_set = set(new_index)
+        drop_count = 0
+        while drop_count < len(self.index) and self.index[drop_count] not in new_set:
+            drop_count += 1
+        kept = self.index[drop_count:]
+        if kept != new_index[:len(kept)]:
+            return False
+
+        new_values = returns.to_numpy(dtype=np.float64)
+        for _ in range(drop_count):
+            self.update(dropped_row=self._rows.popleft())
+        for row in new_values[len(kept):]:
+            self.update(new_row=row)
+        self.index = new_index
+        return True
+
+    def mean(self) -> np.ndarray:
+        """Mean returns vector of the current window."""
+        return self._sum / self._n
+
+    def cov(self) -> np.ndarray:
+        """Sample covariance matrix of the current window."""
+        mean = self.mean()
+        return (self._outer - self._n * np.outer(mean, mean)) / (self._n - 1)
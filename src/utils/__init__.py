@@ -6,14 +6,18 @@ from .helpers import (
     annualize_volatility,
     format_percentage,
     format_currency,
+    format_percentage_array,
+    format_currency_array,
     generate_report_summary
 )
 
 __all__ = [
     'validate_weights',
-    'annualize_returns', 
+    'annualize_returns',
     'annualize_volatility',
     'format_percentage',
     'format_currency',
+    'format_percentage_array',
+    'format_currency_array',
     'generate_report_summary'
 ]
\ No newline at end of file
@@ -75,6 +75,62 @@ def format_currency(value: float, currency: str = "$") -> str:
     return f"{currency}{value:,.2f}"
 
 
+def format_percentage_array(values, decimals: int = 2) -> np.ndarray:
+    """
+    Format an array of decimal values as percentage strings.
+
+    Args:
+        values: Array of decimal values
+        decimals: Number of decimal places
+
+    Returns:
+        Array of formatted percentage strings
+    """
+    scaled = np.asarray(values, dtype=np.float64) * 100
+    return np.char.mod(f'%.{decimals}f%%', scaled)
+
+
+def format_currency_array(values, currency: str = "$", decimals: int = 2) -> np.ndarray:
+    """
+    Format an array of values as currency strings.
+
+    Args:
+        values: Array of numeric values
+        currency: Currency symbol
+        decimals: Number of decimal places
+
+    Returns:
+        Array of formatted currency strings
+    """
+    # np.char.mod cannot group thousands, so format through pandas
+    formatted = pd.Series(np.asarray(values, dtype=np.float64)).map(f'{{:,.{decimals}f}}'.format)
+    return (currency + formatted).to_numpy()
+
+
+def write_dataframe(df: pd.DataFrame, path: str, index: bool = False) -> None:
+    """
+    Write a DataFrame to CSV using the fastest available writer.
+
+    Uses PyArrow's columnar CSV writer when installed - it serializes
+    numeric columns in C instead of row by row - and falls back to
+    pandas' default writer otherwise. Output format and filename are
+    unchanged either way.
+
+    Args:
+        df: DataFrame to write
+        path: Destination CSV path
+        index: Whether to write the index column
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        table = pa.Table.from_pandas(df.reset_index() if index else df,
+                                     preserve_index=False)
+        pa_csv.write_csv(table, path)
+    except Exception:
+        df.to_csv(path, index=index)
+
+
 def generate_report_summary(metrics: Dict[str, float]) -> str:
     """
     Generate a summary report from performance metrics.